@@ -0,0 +1,72 @@
+"""Unit test for the pre-rendered frame cache of the assets"""
+
+import io
+import unittest
+from src import assets
+from src.assets import Assets
+from src.game import Game
+from src.read_json import ReadJson
+from src.terminal import TerminalGeometry
+
+
+class TestAssets(unittest.TestCase):
+    """Test suite for `Assets.get_rendered` and the frames cached in it"""
+
+    def test_rendered_once_per_size(self) -> None:
+        """A frame is built once per key and terminal size"""
+        store = Assets()
+        calls = []
+
+        def render() -> str:
+            calls.append(1)
+            return "frame"
+
+        for _ in range(3):
+            self.assertEqual(
+                store.get_rendered("a", (80, 24), render), "frame"
+            )
+        store.get_rendered("a", (100, 30), render)
+        store.get_rendered("b", (80, 24), render)
+        self.assertEqual(len(calls), 3)
+
+    def test_least_recently_used_size_dropped(self) -> None:
+        """Only `MAX_SIZES` sizes are kept, the oldest used goes first"""
+        store = Assets()
+        for width in range(assets.MAX_SIZES):
+            store.get_rendered("a", (width, 24), lambda: width)
+        # touch the oldest size so the second oldest is dropped instead
+        store.get_rendered("a", (0, 24), lambda: -1)
+        store.get_rendered("a", (99, 24), lambda: 99)
+
+        self.assertEqual(len(store.rendered), assets.MAX_SIZES)
+        self.assertIn((0, 24), store.rendered)
+        self.assertNotIn((1, 24), store.rendered)
+        self.assertEqual(store.get_rendered("a", (0, 24), lambda: -1), 0)
+
+    def test_end_screen_shared_between_games(self) -> None:
+        """Games sharing the assets reuse the end screen, answer included"""
+        settings = ReadJson().get_settings("settings.json")
+        store = Assets()
+        screens = []
+        for answer in ("big", "small"):
+            output = io.StringIO()
+            game = Game(
+                settings,
+                store,
+                ["big", "small"],
+                ["big small"],
+                output=output,
+                geometry=TerminalGeometry((80, 24)),
+            )
+            game.timer["scheduler"].shutdown()
+            game.engine.new_round(answer)
+            game._game_end_menu()
+            self.assertIn("Answer: " + answer, output.getvalue())
+            self.assertIn("Game Over!", output.getvalue())
+            self.assertEqual(game.renderer.writes, 1)
+            screens.append(store.rendered[(80, 24)][("end", False)])
+        self.assertIs(screens[0], screens[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Unit test for the asyncio game loop.
+
+Covers a scripted win, a loss by timeout, and many sessions sharing one
+event loop.
+"""
+
+import asyncio
+import io
+import unittest
+from src.async_game import AsyncGame, QueueReader
+from src.read_json import ReadJson
+from src.assets import Assets
+
+
+class TestAsyncGame(unittest.TestCase):
+    """Test suite for AsyncGame sessions driven by a QueueReader"""
+
+    def setUp(self) -> None:
+        settings = ReadJson().get_settings("settings.json")
+        if not settings:
+            self.fail("ReadJson().get_settings() returned none")
+        self.settings = settings
+
+    def _new_game(self, settings: dict[str, str]) -> AsyncGame:
+        return AsyncGame(
+            settings,
+            Assets(),
+            ["big"],
+            ["big small"],
+            reader=QueueReader(),
+            output=io.StringIO(),
+        )
+
+    def test_scripted_win(self) -> None:
+        """Feeding every letter of the answer wins the game"""
+
+        async def play() -> AsyncGame:
+            game = self._new_game(self.settings)
+            for line in ["B", "i", "", "g", ""]:
+                game.reader.feed(line)
+            task = asyncio.ensure_future(game.start_game("basic"))
+            # stop before `reset_game` so the final state can be checked
+            while not game.state["won"]:
+                await asyncio.sleep(0)
+            await task
+            return game
+
+        game = asyncio.run(play())
+        self.assertIn("Congratulations!", game.output.getvalue())
+        self.assertEqual(game.state["life"], int(self.settings["start_life"]))
+
+    def test_timeout_ends_game(self) -> None:
+        """The countdown takes the last life and ends the game"""
+        settings = dict(self.settings, start_life="1", max_time="1")
+
+        async def play() -> AsyncGame:
+            game = self._new_game(settings)
+            task = asyncio.ensure_future(game.start_game("basic"))
+            await asyncio.sleep(1.2)
+            game.reader.feed("")
+            await asyncio.wait_for(task, 2)
+            return game
+
+        game = asyncio.run(play())
+        self.assertIn("Game Over!", game.output.getvalue())
+        self.assertIsNone(game.countdown_task)
+
+    def test_concurrent_sessions(self) -> None:
+        """Many sessions run on one event loop with separate output"""
+
+        async def play() -> list[AsyncGame]:
+            games = [self._new_game(self.settings) for _ in range(200)]
+            for idx, game in enumerate(games):
+                if idx % 2:
+                    lines = ["b", "i", "g", ""]
+                else:
+                    lines = list("acdefhj") + [""]
+                for line in lines:
+                    game.reader.feed(line)
+            await asyncio.gather(
+                *(game.start_game("basic") for game in games)
+            )
+            return games
+
+        games = asyncio.run(play())
+        for idx, game in enumerate(games):
+            output = game.output.getvalue()
+            if idx % 2:
+                self.assertIn("Congratulations!", output)
+            else:
+                self.assertNotIn("Congratulations!", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
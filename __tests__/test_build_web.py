@@ -0,0 +1,82 @@
+"""Unit test for building the browser bundle"""
+
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from src import build_web
+from src.read_json import ReadJson
+
+
+class TestBuildWeb(unittest.TestCase):
+    """Test suite for the zip and manifest of `build_bundle`"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.settings = ReadJson().get_settings("settings.json")
+        self.source = os.path.join(self.directory, "data.json")
+        with open(self.source, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "words": ["apple", "tea", "banana"],
+                    "phrases": ["big small", "hello world"],
+                },
+                file,
+            )
+
+    def build(self, out: str) -> tuple[dict, zipfile.ZipFile]:
+        out_dir = os.path.join(self.directory, out)
+        manifest = build_web.build_bundle(
+            "src", self.settings, self.source, out_dir
+        )
+        archive = zipfile.ZipFile(os.path.join(out_dir, manifest["bundle"]))
+        self.addCleanup(archive.close)
+        return manifest, archive
+
+    def test_bundle_contents(self) -> None:
+        """Every module, the compiled corpus, its indexes and settings"""
+        manifest, archive = self.build("build")
+        names = archive.namelist()
+        for module in os.listdir("src"):
+            if module.endswith(".py"):
+                self.assertIn("src/" + module, names)
+        self.assertIn("data.bin.features", names)
+        self.assertTrue(archive.read("data.bin").startswith(b"HMCORP"))
+
+        settings = json.loads(archive.read("settings.json"))
+        self.assertEqual(settings["data_filename"], "data.bin")
+        self.assertEqual(settings["stats_filename"], "")
+        self.assertEqual(settings["start_life"], self.settings["start_life"])
+        info = json.loads(archive.read("bundle.json"))
+        self.assertEqual(sorted(info["files"]), sorted(names))
+        self.assertEqual(
+            manifest["bundle"], f"hangman-{manifest['hash']}.zip"
+        )
+
+    def test_reproducible(self) -> None:
+        """The same sources give the same bundle, older ones are removed"""
+        first, _ = self.build("build")
+        second, _ = self.build("build")
+        self.assertEqual(first, second)
+
+        with open(self.source, "w", encoding="utf-8") as file:
+            json.dump({"words": ["tea"], "phrases": ["big small"]}, file)
+        third, _ = self.build("build")
+        self.assertNotEqual(first["hash"], third["hash"])
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.directory, "build"))),
+            sorted(["manifest.json", third["bundle"]]),
+        )
+
+    def test_missing_corpus(self) -> None:
+        """A missing corpus is reported"""
+        self.source = os.path.join(self.directory, "none.json")
+        with self.assertRaises(FileNotFoundError):
+            self.build("build")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Unit test for the memory-mapped word/phrase corpus"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+from src import corpus
+from src.read_json import ReadJson
+
+
+class TestJsonCorpus(unittest.TestCase):
+    """Test suite for the streamed offset index and lazy entries"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "data.json")
+        self.data = {
+            "version": "words",
+            "words": ["apple", "qu\"ote", "back\\slash", "ünïcode", "[x]"],
+            "nested": {"words": ["not", "these"]},
+            "phrases": ["hello world", "a, b: c"],
+        }
+        self._write(self.data)
+
+    def _write(self, data: dict) -> None:
+        with open(self.filename, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4, ensure_ascii=False)
+
+    def test_entries_match_json(self) -> None:
+        """Lazy entries decode to the same strings as `json.load`"""
+        words, phrases = corpus.load_json_corpus(self.filename)
+        self.assertEqual(list(words), self.data["words"])
+        self.assertEqual(list(phrases), self.data["phrases"])
+        self.assertEqual(words[-1], "[x]")
+        self.assertIn(random.choice(words), self.data["words"])
+        with self.assertRaises(IndexError):
+            _ = words[len(words)]
+
+    def test_index_reused(self) -> None:
+        """The index is only built once while the file is unchanged"""
+        corpus.load_json_corpus(self.filename)
+        with patch.object(corpus, "build_json_index") as build:
+            words, _ = corpus.load_json_corpus(self.filename)
+        build.assert_not_called()
+        self.assertEqual(len(words), 5)
+
+    def test_index_rebuilt_on_change(self) -> None:
+        """A changed file gets a new index"""
+        corpus.load_json_corpus(self.filename)
+        self.data["words"].append("pear")
+        self._write(self.data)
+        words, _ = corpus.load_json_corpus(self.filename)
+        self.assertEqual(words[-1], "pear")
+
+    def test_old_lists_survive_rebuild(self) -> None:
+        """Lists loaded before the index is rebuilt keep their entries"""
+        words, phrases = corpus.load_json_corpus(self.filename)
+        data = {
+            "phrases": ["x y"] * 50,
+            "words": [f"longer{idx}" for idx in range(100)],
+        }
+        # saved in one go, as a reload expects
+        with open(self.filename + ".new", "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(self.filename + ".new", self.filename)
+
+        new_words, _ = corpus.load_json_corpus(self.filename)
+        self.assertEqual(list(new_words), data["words"])
+        self.assertEqual(list(words), self.data["words"])
+        self.assertEqual(list(phrases), self.data["phrases"])
+        self.assertFalse(os.path.exists(self.filename + ".idx.tmp"))
+
+    def test_many_entries(self) -> None:
+        """Offsets are flushed in chunks without losing entries"""
+        entries = [f"word{idx}" for idx in range(corpus._FLUSH_EVERY + 10)]
+        self._write({"phrases": ["x y"], "words": entries})
+        words, phrases = corpus.load_json_corpus(self.filename)
+        self.assertEqual(len(words), len(entries))
+        self.assertEqual(words[corpus._FLUSH_EVERY], entries[-10])
+        self.assertEqual(list(phrases), ["x y"])
+
+    def test_not_found(self) -> None:
+        """Missing files return None"""
+        self.assertIsNone(corpus.load_json_corpus("none.json"))
+        self.assertIsNone(corpus.load_corpus(ReadJson(), "none.json"))
+
+    def test_load_corpus_small_file(self) -> None:
+        """Small files are parsed into plain lists"""
+        words, _ = corpus.load_corpus(ReadJson(), self.filename)
+        self.assertIsInstance(words, list)
+        with patch.object(corpus, "LAZY_LOAD_SIZE", 0):
+            words, _ = corpus.load_corpus(ReadJson(), self.filename)
+        self.assertIsInstance(words, corpus.JsonCorpusList)
+
+
+class TestBinaryCorpus(unittest.TestCase):
+    """Test suite for compiling and mapping the binary corpus format"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.source = os.path.join(directory.name, "data.json")
+        self.target = os.path.join(directory.name, "data.bin")
+        self.data = {
+            "words": ["apple", "ünïcode", "", "qu\"ote"],
+            "phrases": ["hello world", "✺ stars ✺"],
+        }
+        with open(self.source, "w", encoding="utf-8") as file:
+            json.dump(self.data, file)
+
+    def test_round_trip(self) -> None:
+        """A compiled corpus holds the same entries as its JSON source"""
+        self.assertTrue(
+            corpus.compile_corpus(ReadJson(), self.source, self.target)
+        )
+        words, phrases = corpus.load_binary_corpus(self.target)
+        self.assertEqual(list(words), self.data["words"])
+        self.assertEqual(list(phrases), self.data["phrases"])
+        self.assertEqual(phrases[-1], "✺ stars ✺")
+
+    def test_read_without_mmap(self) -> None:
+        """Corpora are read into memory where files cannot be mapped"""
+        corpus.compile_corpus(ReadJson(), self.source, self.target)
+        with patch.object(corpus.mmap, "mmap", side_effect=OSError):
+            words, phrases = corpus.load_binary_corpus(self.target)
+        self.assertEqual(list(words), self.data["words"])
+        self.assertEqual(list(phrases), self.data["phrases"])
+
+    def test_load_corpus_detects_format(self) -> None:
+        """`load_corpus` maps compiled files whatever their name"""
+        target = self.target.replace(".bin", ".dat")
+        corpus.compile_corpus(ReadJson(), self.source, target)
+        self.assertTrue(corpus.is_binary_corpus(target))
+        self.assertFalse(corpus.is_binary_corpus(self.source))
+        words, _ = corpus.load_corpus(ReadJson(), target)
+        self.assertIsInstance(words, corpus.BinaryCorpusList)
+
+    def test_not_a_corpus(self) -> None:
+        """Files without the magic are rejected"""
+        with self.assertRaises(ValueError):
+            corpus.load_binary_corpus(self.source)
+        self.assertIsNone(corpus.load_binary_corpus("none.bin"))
+        self.assertFalse(
+            corpus.compile_corpus(ReadJson(), "none.json", self.target)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
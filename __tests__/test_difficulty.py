@@ -0,0 +1,164 @@
+"""Unit test for the difficulty features and bucketed selection"""
+
+import json
+import math
+import os
+import random
+import tempfile
+import tracemalloc
+import unittest
+from collections import Counter
+from src.difficulty import DifficultyIndex, load_indexes, save_indexes
+from src.game import Data
+
+
+class TestDifficultyIndex(unittest.TestCase):
+    """Test suite for `DifficultyIndex` and its cache file"""
+
+    def setUp(self) -> None:
+        self.words = [
+            "eat", "tea", "ate", "seat", "east", "tease",
+            "jazz", "fuzz", "quiz", "zephyr", "sphinx", "rhythm",
+        ]
+        self.index = DifficultyIndex.build(self.words)
+
+    def test_features(self) -> None:
+        """Lengths and distinct letters are counted without spaces"""
+        index = DifficultyIndex.build(["a bb", "abc"])
+        self.assertEqual(list(index.lengths), [3, 3])
+        self.assertEqual(list(index.distinct), [2, 3])
+        self.assertGreater(index.expected[1], index.expected[0])
+        self.assertGreater(index.rarity[1], index.rarity[0])
+
+    def test_many_letters(self) -> None:
+        """Alphabets of more than 64 letters are indexed too"""
+        letters = [chr(0x400 + idx) for idx in range(80)]
+        entries = ["".join(letters[idx:idx + 20]) for idx in range(61)]
+        entries.append(letters[0] * 3)
+        index = DifficultyIndex.build(entries)
+        self.assertEqual(set(index.distinct[:-1]), {20})
+        self.assertEqual(index.distinct[-1], 1)
+        ranking = index._ranking()
+        for entry, expected in zip(entries, index.expected):
+            self.assertEqual(
+                expected, max(ranking[letter] + 1 for letter in entry)
+            )
+
+    def test_long_list(self) -> None:
+        """Lists looked up a few letters at a time get the same features"""
+        rng = random.Random(3)
+        entries = [
+            "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=8))
+            for _ in range(9000)
+        ]
+        index = DifficultyIndex.build(entries)
+        ranking = index._ranking()
+        appears = index.appears
+        for entry, distinct, rarity, expected in zip(
+            entries, index.distinct, index.rarity, index.expected
+        ):
+            letters = set(entry)
+            self.assertEqual(distinct, len(letters))
+            self.assertEqual(
+                expected, max(ranking[letter] + 1 for letter in letters)
+            )
+            self.assertAlmostEqual(
+                rarity,
+                sum(-math.log2(appears[letter] / len(entries))
+                    for letter in letters),
+                places=3,
+            )
+
+    def test_buckets_sorted(self) -> None:
+        """`order` lists each bucket's entries together, in list order"""
+        seen = []
+        for (difficulty, length), (start, count) in sorted(
+            self.index.buckets.items()
+        ):
+            bucket = list(self.index.order[start:start + count])
+            self.assertEqual(bucket, sorted(bucket))
+            for idx in bucket:
+                self.assertEqual(self.index.difficulty[idx], difficulty)
+                self.assertEqual(self.index.lengths[idx], length)
+            seen += bucket
+        self.assertEqual(sorted(seen), list(range(len(self.words))))
+
+    def test_build_memory(self) -> None:
+        """Building keeps typed arrays, not Python objects, per entry"""
+        rng = random.Random(3)
+        entries = [
+            "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=8))
+            for _ in range(50000)
+        ]
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        DifficultyIndex.build(entries)
+        _, peak = tracemalloc.get_traced_memory()
+        self.assertLess(peak / len(entries), 100)
+
+    def test_common_letters_are_easier(self) -> None:
+        """Entries of common letters rank easier than rare ones"""
+        easy = self.index.difficulty[self.words.index("tea")]
+        hard = self.index.difficulty[self.words.index("jazz")]
+        self.assertLess(easy, hard)
+
+    def test_pick_matches_filters(self) -> None:
+        """Picked entries always have the difficulty and length asked for"""
+        rng = random.Random(1)
+        for _ in range(200):
+            idx = self.index.pick(rng, ("hard",), 4, 5)
+            self.assertTrue(self.index.matches(idx, ("hard",)))
+            self.assertIn(self.index.lengths[idx], (4, 5))
+
+    def test_pick_uniform(self) -> None:
+        """Every matching entry is picked about as often"""
+        rng = random.Random(2)
+        counts = Counter(self.index.pick(rng) for _ in range(12000))
+        self.assertEqual(len(counts), len(self.words))
+        self.assertLess(max(counts.values()) - min(counts.values()), 300)
+
+    def test_pick_no_match(self) -> None:
+        """`None` is returned when no bucket matches"""
+        self.assertIsNone(self.index.pick(random, ("easy",), 50, 60))
+        self.assertIsNone(DifficultyIndex.build([]).pick())
+
+    def test_cache_round_trip(self) -> None:
+        """Cached indexes load back equal, and are dropped on change"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        source = os.path.join(directory.name, "data.json")
+        cache = source + ".features"
+        with open(source, "w") as file:
+            json.dump({"words": self.words}, file)
+
+        save_indexes(cache, source, [self.index, self.index])
+        loaded = load_indexes(cache, source)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0].buckets, self.index.buckets)
+        self.assertEqual(loaded[1].order, self.index.order)
+        self.assertEqual(loaded[1].rarity, self.index.rarity)
+        self.assertEqual(loaded[1].appears, self.index.appears)
+
+        with open(source, "a") as file:
+            file.write("\n")
+        self.assertIsNone(load_indexes(cache, source))
+
+    def test_data_selection(self) -> None:
+        """`Data` picks by level, and falls back on empty buckets"""
+        data = Data(self.words, ["the end", "zany quiz"])
+        for _ in range(50):
+            self.assertNotIn(
+                data.get_random("basic"), ("quiz", "sphinx", "rhythm")
+            )
+            self.assertIn(
+                data.get_random("intermediate"), data.phrase_list
+            )
+        self.assertIsNone(data.select("words", ("easy",), 10))
+        self.assertEqual(data.select("words", ("hard",), 4, 4), "quiz")
+
+        single = Data(["quiz"], ["quiz"])
+        self.assertEqual(single.get_random("basic"), "quiz")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Unit test for the headless Hangman rules engine"""
+
+import unittest
+from src.engine import (
+    GameEngine, REPEATED, WRONG, REVEALED, UNCHANGED, HIT, MISS
+)
+
+
+class TestGameEngine(unittest.TestCase):
+    """Test suite for `GameEngine` rounds"""
+
+    def setUp(self) -> None:
+        self.engine = GameEngine(3)
+
+    def test_new_round(self) -> None:
+        """Letters are hidden, spaces are shown and counted as found"""
+        self.engine.new_round("big small")
+        state = self.engine.state
+        self.assertEqual("".join(state["hidden"]), "___ _____")
+        self.assertEqual(state["correct_counter"], 1)
+        self.assertFalse(self.engine.is_over())
+
+    def test_guess_outcomes(self) -> None:
+        """Each guess reports what it changed"""
+        self.engine.new_round("big big")
+        self.assertEqual(self.engine.guess("i"), REVEALED)
+        self.assertEqual(self.engine.state["correct_counter"], 3)
+        self.assertEqual(self.engine.guess("i"), REPEATED)
+        self.assertEqual(self.engine.guess("z"), WRONG)
+        self.assertEqual(self.engine.state["life"], 2)
+        self.assertEqual(self.engine.guess(" "), UNCHANGED)
+        self.assertEqual(self.engine.guess("bi"), UNCHANGED)
+        self.assertEqual(self.engine.guess(""), UNCHANGED)
+        self.assertEqual(self.engine.state["life"], 2)
+        # the repeated and the empty input are not counted
+        self.assertEqual(self.engine.state["guesses"], 4)
+
+        statuses = self.engine.tracker.statuses()
+        self.assertEqual((statuses[8], statuses[25]), (HIT, MISS))
+
+    def test_win(self) -> None:
+        """Revealing every letter wins the round"""
+        self.engine.new_round("odd")
+        self.engine.guess("o")
+        self.engine.guess("d")
+        self.assertTrue(self.engine.state["won"])
+        self.assertTrue(self.engine.is_over())
+
+    def test_lose(self) -> None:
+        """Running out of lives ends the round without winning"""
+        self.engine.new_round("odd")
+        self.engine.guess("x")
+        self.engine.guess("y")
+        self.engine.lose_life()
+        self.assertTrue(self.engine.is_over())
+        self.assertFalse(self.engine.state["won"])
+
+    def test_reset(self) -> None:
+        """Reset restores lives and forgets typed letters"""
+        state = self.engine.state
+        self.engine.new_round("odd")
+        self.engine.guess("x")
+        self.engine.reset()
+        self.assertIs(self.engine.state, state)
+        self.assertEqual(state["life"], 3)
+        self.assertEqual(state["answer"], "")
+        self.assertEqual(state["guesses"], 0)
+        self.assertFalse(self.engine.tracker.is_typed("x"))
+
+        self.engine.new_round("ox")
+        self.assertEqual(self.engine.guess("x"), REVEALED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,63 @@ Covers menu selection, question generation, letter-guess handling,
 win/loss conditions, time expiry, and state reset behaviour.
 """
 
+import contextlib
+import io
+import threading
 import unittest
-from src.game import Game, Data, LetterTracker
+from unittest.mock import patch
+from src.game import (
+    Game, Data, LetterTracker, UNTYPED, HIT, MISS, seconds_left
+)
 from src.read_json import ReadJson
 from src.assets import Assets
+from src.scheduler import TimerHandle
+
+
+class ManualScheduler:
+    """Stands in for `TimerScheduler`, run by hand on a fake clock
+
+    Every callback runs `late` seconds after its deadline, as a busy
+    machine would.
+    """
+
+    def __init__(self, late: float) -> None:
+        self.now = 0.0
+        self.late = late
+        self.timers: list[TimerHandle] = []
+        self.wakeups = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def schedule(self, delay: float, callback, *args) -> TimerHandle:
+        return self.schedule_at(self.now + delay, callback, *args)
+
+    def schedule_at(self, deadline: float, callback, *args) -> TimerHandle:
+        handle = TimerHandle(self, deadline, callback, args)
+        self.timers.append(handle)
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        handle.cancelled = True
+
+    def shutdown(self) -> None:
+        self.timers.clear()
+
+    def run_until(self, end: float) -> None:
+        """Run every timer due by `end`, in deadline order"""
+        while True:
+            due = [
+                handle for handle in self.timers
+                if not handle.cancelled and handle.deadline <= end
+            ]
+            if not due:
+                return
+            handle = min(due, key=lambda handle: handle.deadline)
+            handle.cancelled = True
+            self.now = max(self.now, handle.deadline + self.late)
+            self.wakeups += 1
+            handle.callback(*handle.args)
 
 
 class TestGame(unittest.TestCase):
@@ -24,6 +77,9 @@ class TestGame(unittest.TestCase):
         self.data = Data(word_list, phrase_list)
         self.tracker = LetterTracker()
 
+    def tearDown(self) -> None:
+        self.game.timer["scheduler"].shutdown()
+
     def test_menu_select_basic(self) -> None:
         """Selecting 1 should return basic level"""
         self.assertEqual(self.game.game_menu_helper("1"), "basic")
@@ -203,10 +259,178 @@ class TestGame(unittest.TestCase):
     def test_timer_finished(self) -> None:
         """Timer reduces life upon reaching 0"""
         self.game.state["life"] = 1
-        self.game.timer_finished_thread(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game.timer_finished_thread(0)
         self.assertEqual(self.game.state["life"], 0)
         self.assertTrue(self.game.timer["stop_event_thread"].is_set())
 
+    def test_letter_positions_index(self) -> None:
+        """`get_question` indexes the positions of every letter"""
+        self.game.get_question("intermediate")
+        self.assertEqual(self.game.state["positions"]["b"], [0])
+        self.assertEqual(self.game.state["positions"]["l"], [7, 8])
+        self.assertEqual(self.game.state["positions"][" "], [3])
+
+        self.game.letter_in_question("l")
+        self.assertEqual(self.game.state["correct_counter"], 3)
+        self.assertEqual(self.game.state["hidden"][7:], ["l", "l"])
+
+    def test_letter_positions_rebuilt(self) -> None:
+        """Replacing the answer directly re-indexes it on the next guess"""
+        self.game.get_question("basic")
+        self.game.reset_game()
+        self.game.state["answer"] = "odd"
+        self.game.state["hidden"] = ["_", "_", "_"]
+        self.game.letter_in_question("d")
+        self.assertEqual(self.game.state["hidden"], ["_", "d", "d"])
+        self.assertEqual(self.game.state["correct_counter"], 2)
+
+    def test_space_and_substring_not_penalised(self) -> None:
+        """Inputs found in the answer but not single letters cost no life"""
+        self.game.get_question("intermediate")
+        initial_life = self.game.state["life"]
+        self.game.letter_in_question(" ")
+        self.game.letter_in_question("sma")
+        self.assertEqual(self.game.state["life"], initial_life)
+        self.assertEqual(self.game.state["correct_counter"], 1)
+
+    def test_tracker_statuses(self) -> None:
+        """Statuses report hit, miss and untyped letters in order"""
+        self.tracker.mark_typed("a", hit=True)
+        self.tracker.mark_typed("c")
+        statuses = self.tracker.statuses()
+        self.assertEqual(len(statuses), 26)
+        self.assertEqual(statuses[:4], (HIT, UNTYPED, MISS, UNTYPED))
+
+        self.tracker.reset_is_typed()
+        self.assertEqual(set(self.tracker.statuses()), {UNTYPED})
+
+    def test_tracker_statuses_from_guesses(self) -> None:
+        """Guesses mark letters as hit or miss against the answer"""
+        self.game.state["answer"] = "big"
+        self.game.state["hidden"] = ["_", "_", "_"]
+        self.game.letter_in_question("b")
+        self.game.letter_in_question("z")
+        statuses = self.game.tracker.statuses()
+        self.assertEqual(statuses[1], HIT)
+        self.assertEqual(statuses[25], MISS)
+
+    def test_tracker_other_inputs(self) -> None:
+        """Inputs outside the alphabet are tracked separately"""
+        self.tracker.mark_typed("1")
+        self.assertTrue(self.tracker.is_typed("1"))
+        self.assertFalse(self.tracker.is_typed("2"))
+        self.assertEqual(set(self.tracker.statuses()), {UNTYPED})
+        self.tracker.reset_is_typed()
+        self.assertFalse(self.tracker.is_typed("1"))
+
+    def test_tracker_custom_alphabet(self) -> None:
+        """The tracker works with alphabets other than a-z"""
+        tracker = LetterTracker("abcdefghijklmnopqrstuvwxyzäöüß")
+        tracker.mark_typed("ß", hit=True)
+        self.assertTrue(tracker.is_typed("ß"))
+        self.assertEqual(tracker.statuses()[-1], HIT)
+        self.assertFalse(hasattr(tracker, "__dict__"))
+
+    def test_timer_thread_count_bounded(self) -> None:
+        """Playing many turns does not grow the number of threads"""
+        initial_threads = threading.active_count()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(5000):
+                self.game._create_timer()
+                self.assertLessEqual(
+                    threading.active_count(), initial_threads + 1
+                )
+                self.game._reset_timer(self.game.timer["thread_counter"] - 1)
+
+        self.assertLessEqual(threading.active_count(), initial_threads + 1)
+        self.assertLess(self.game.timer["scheduler"].pending(), 100)
+
+    def test_timer_ticks_follow_deadline(self) -> None:
+        """The countdown wakes once a second and late wakeups do not drift"""
+        max_time = 15
+        late = 0.3
+        scheduler = ManualScheduler(late)
+        self.game.timer["scheduler"].shutdown()
+        self.game.timer["scheduler"] = scheduler
+        self.game.timer["time_counter"] = max_time
+        shown: list[tuple[float, int]] = []
+        ended: list[float] = []
+        self.game._timer_display = lambda value: shown.append(
+            (scheduler.now, value)
+        )
+        self.game.timer_finished_thread = lambda idx: ended.append(
+            scheduler.now
+        )
+
+        self.game._create_timer()
+        scheduler.run_until(max_time + 1)
+
+        # a tick per value shown, plus the end of the turn
+        self.assertEqual(scheduler.wakeups, max_time + 1)
+        self.assertEqual(
+            [value for _, value in shown], list(range(max_time, 0, -1))
+        )
+        # each value is shown `late` after it is due, the last one too
+        for elapsed, (now, value) in enumerate(shown):
+            self.assertLess(now - elapsed, late + 0.02)
+        self.assertEqual(len(ended), 1)
+        self.assertLess(ended[0] - max_time, late + 0.001)
+
+    def test_seconds_left(self) -> None:
+        """The time left changes exactly at whole seconds to the deadline"""
+        self.assertEqual(seconds_left(15.0, 0.0), 15)
+        self.assertEqual(seconds_left(15.0, 0.5), 15)
+        self.assertEqual(seconds_left(0.1 + 15, 0.1 + 1), 14)
+        self.assertEqual(seconds_left(15.0, 14.9), 1)
+        self.assertEqual(seconds_left(15.0, 16.0), 0)
+
+    def test_data_load_async(self) -> None:
+        """Lists loaded in the background are waited for, then indexed"""
+        release = threading.Event()
+
+        def load():
+            release.wait()
+            return ["big", "small"], ["big small"]
+
+        data = Data.load_async(load)
+        self.assertFalse(data.loaded.is_set())
+        release.set()
+        self.assertEqual(data.word_list, ["big", "small"])
+        self.assertEqual(
+            data.pick("intermediate"), ("phrases", 0, "big small")
+        )
+
+    def test_data_load_async_without_threads(self) -> None:
+        """Without threads, the lists are loaded by their first use"""
+        loads = []
+
+        def load():
+            loads.append(1)
+            return ["big"], ["big small"]
+
+        with patch.object(
+            threading.Thread, "start", side_effect=RuntimeError
+        ):
+            data = Data.load_async(load)
+        self.assertEqual(loads, [])
+        self.assertEqual(data.get_random_word(), "big")
+        self.assertEqual(data.get_random_phrase(), "big small")
+        self.assertEqual(loads, [1])
+        self.assertIsNotNone(data.indexes)
+
+    def test_data_load_async_error(self) -> None:
+        """What the background load raises is raised by using the lists"""
+
+        def load():
+            raise FileNotFoundError("data.json")
+
+        data = Data.load_async(load)
+        with self.assertRaises(FileNotFoundError):
+            data.get_random_word()
+        with self.assertRaises(FileNotFoundError):
+            data.phrase_list
+
 
 if __name__ == "__main__":
     unittest.main()
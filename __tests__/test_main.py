@@ -0,0 +1,206 @@
+"""Unit test for the start-up cost of the main entry point"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+# microseconds `-X importtime` may report for `main`, and for `main` plus
+# `game`, all that is imported before the notice is shown. Several times
+# what they take, so that only an eager import of a heavy module fails
+MAIN_IMPORT_BUDGET = 40_000
+NOTICE_IMPORT_BUDGET = 100_000
+# imported once the feature that needs them is used
+DEFERRED = (
+    "asyncio",
+    "async_game",
+    "corpus",
+    "metrics",
+    "sqlite3",
+    "stats",
+    "watcher",
+)
+RUNS = 3
+# seconds from the interpreter being up to the notice drawn by `main()`
+# with the shipped settings, several times what it takes
+NOTICE_BUDGET = 0.15
+# runs `main()`, printing the modules loaded once the notice is drawn
+MAIN_CODE = f"""
+import sys
+sys.path.insert(0, {SRC!r})
+import game, main
+
+display = game.Game._display_notice
+
+def notice(self):
+    display(self)
+    print("\\nLOADED", " ".join(sys.modules), flush=True)
+
+game.Game._display_notice = notice
+main.main()
+"""
+
+
+def _bytecode_env() -> dict[str, str]:
+    # with the bytecode written, so that only importing is timed and not
+    # compiling the sources
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def notice_time(args: list[str], cwd: str) -> tuple[float, set[str]]:
+    """Run `args` in `cwd` until the notice, then quit from the menu
+
+    Returns the seconds until the notice was drawn, or the process ended
+    if it draws none, and the modules loaded then.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        args,
+        cwd=cwd,
+        env=_bytecode_env(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    seen = b""
+    while not seen.partition(b"LOADED")[2].endswith(b"\n"):
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:
+            break
+        seen += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(b"\n3\n", timeout=30)
+    if process.returncode:
+        raise RuntimeError(f"{args} exited with {process.returncode}")
+    return elapsed, set(seen.partition(b"LOADED")[2].decode().split())
+
+
+def import_times(code: str) -> tuple[dict[str, int], set[str]]:
+    """Run `code` with `-X importtime` in `src`
+
+    Returns the cumulative microseconds of each top-level import and the
+    modules loaded once `code` ran, which must print `sys.modules`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC,
+        env=_bytecode_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            # nested imports are indented past the separator's space
+            name = fields[2].rstrip()[1:]
+            if not name.startswith(" "):
+                times[name] = int(fields[1])
+    return times, set(result.stdout.split())
+
+
+class TestStartup(unittest.TestCase):
+    """Test suite for what `main.py` imports before the first screen"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        code = "import sys, main, game; print(' '.join(sys.modules))"
+        # the best of a few runs, the first one writes the bytecode
+        runs = [import_times(code) for _ in range(RUNS)]
+        cls.modules = runs[-1][1]
+        cls.main_time = min(times["main"] for times, _ in runs)
+        cls.notice_time = min(
+            times["main"] + times.get("game", 0) for times, _ in runs
+        )
+
+    def test_deferred_modules(self) -> None:
+        """Optional features are not imported at start"""
+        for module in DEFERRED:
+            self.assertNotIn(module, self.modules)
+
+    def test_import_budget(self) -> None:
+        """`main` and the game are imported within the budget"""
+        self.assertLess(self.main_time, MAIN_IMPORT_BUDGET)
+        self.assertLess(self.notice_time, NOTICE_IMPORT_BUDGET)
+
+
+class TestMainStartup(unittest.TestCase):
+    """Test suite for `main()` up to the notice, with the shipped settings"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # a copy of the repository's settings and corpus, so that the
+        # files the game writes stay out of it
+        cls.directory = tempfile.mkdtemp()
+        for filename in ("settings.json", "data.json"):
+            shutil.copy(os.path.join(ROOT, filename), cls.directory)
+        interpreter = min(
+            notice_time([sys.executable, "-c", "pass"], cls.directory)[0]
+            for _ in range(RUNS)
+        )
+        runs = [
+            notice_time([sys.executable, "-c", MAIN_CODE], cls.directory)
+            for _ in range(RUNS)
+        ]
+        cls.modules = runs[-1][1]
+        cls.notice = min(elapsed for elapsed, _ in runs) - interpreter
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.directory)
+
+    def test_features_off(self) -> None:
+        """The shipped settings write no stats or snapshots"""
+        self.assertIn("game", self.modules)
+        for module in DEFERRED:
+            self.assertNotIn(module, self.modules)
+        for filename in ("stats.db", "game.snapshot"):
+            self.assertFalse(
+                os.path.exists(os.path.join(self.directory, filename))
+            )
+
+    def test_features_after_notice(self) -> None:
+        """Stats, snapshots and the watcher are opened after the notice"""
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copy(os.path.join(ROOT, "data.json"), directory)
+            with open(
+                os.path.join(ROOT, "settings.json"), encoding="utf-8"
+            ) as file:
+                settings = json.load(file)
+            settings.update(
+                stats_filename="stats.db",
+                snapshot_filename="game.snapshot",
+                watch_corpus="true",
+            )
+            with open(
+                os.path.join(directory, "settings.json"), "w",
+                encoding="utf-8",
+            ) as file:
+                json.dump(settings, file)
+            _, modules = notice_time(
+                [sys.executable, "-c", MAIN_CODE], directory
+            )
+            for module in DEFERRED:
+                self.assertNotIn(module, modules)
+            # opened while the notice waits
+            for filename in ("stats.db", "game.snapshot"):
+                self.assertTrue(
+                    os.path.exists(os.path.join(directory, filename))
+                )
+
+    def test_notice_budget(self) -> None:
+        """The notice is drawn within the budget"""
+        self.assertLess(self.notice, NOTICE_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
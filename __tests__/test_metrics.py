@@ -0,0 +1,147 @@
+"""Unit test for the latency histograms and game instrumentation"""
+
+import asyncio
+import inspect
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import unittest
+from src.assets import Assets
+from src.async_game import AsyncGame, QueueReader
+from src.game import Game
+from src.metrics import Histogram, Metrics, instrument
+from src.read_json import ReadJson
+from src.scheduler import TimerScheduler
+from src.terminal import TerminalGeometry
+
+
+class TestHistogram(unittest.TestCase):
+    """Test suite for `Histogram` buckets and percentiles"""
+
+    def test_buckets_are_contiguous(self) -> None:
+        """Every value falls in the bucket whose range holds it"""
+        previous_high = -1
+        for bucket in range(Histogram.bucket_of(1 << 40)):
+            low, high = Histogram.bucket_range(bucket)
+            self.assertEqual(low, previous_high + 1)
+            # within 1/64 of the value, like 2 significant digits
+            self.assertLessEqual(high - low, max(0, low // 64))
+            previous_high = high
+
+        rng = random.Random(3)
+        for _ in range(1000):
+            value = rng.randrange(1 << rng.randrange(1, 40))
+            low, high = Histogram.bucket_range(Histogram.bucket_of(value))
+            self.assertTrue(low <= value <= high)
+
+    def test_percentiles(self) -> None:
+        """Percentiles are within a bucket of the exact ones"""
+        histogram = Histogram()
+        for value in range(1, 10001):
+            histogram.record(value * 1000)
+        self.assertEqual(histogram.count, 10000)
+        self.assertEqual((histogram.min, histogram.max), (1000, 10000000))
+        for percent, exact in ((50, 5000000), (99, 9900000), (100, 10**7)):
+            self.assertAlmostEqual(
+                histogram.percentile(percent), exact, delta=exact / 64
+            )
+        self.assertEqual(Histogram().percentile(99), 0)
+
+    def test_merge_and_dump(self) -> None:
+        """Merged histograms count both, dumps are JSON"""
+        first, second = Histogram(), Histogram()
+        first.record(5)
+        second.record(10**9)
+        first.merge(second)
+        self.assertEqual((first.count, first.min, first.max), (2, 5, 10**9))
+
+        metrics = Metrics()
+        metrics.histograms["render"] = first
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "metrics.json")
+        metrics.dump(filename)
+        with open(filename) as file:
+            dumped = json.load(file)
+        self.assertEqual(dumped["render"]["count"], 2)
+        self.assertEqual(dumped["render"]["max_us"], 10**6)
+        self.assertEqual(len(dumped["render"]["buckets"]), 2)
+
+
+class TestInstrument(unittest.TestCase):
+    """Test suite for timing the methods of a game"""
+
+    def setUp(self) -> None:
+        self.settings = ReadJson().get_settings("settings.json")
+
+    def test_game_timings(self) -> None:
+        """Guesses, renders and input-to-frame lag are recorded"""
+        game = Game(
+            self.settings,
+            Assets(),
+            ["big"],
+            ["big small"],
+            output=io.StringIO(),
+            geometry=TerminalGeometry((80, 24)),
+        )
+        self.addCleanup(game.timer["scheduler"].shutdown)
+        game._read_guess = lambda: "b"
+        metrics = Metrics()
+        instrument(game, metrics)
+
+        game.get_question("basic")
+        game._print_question()
+        game.letter_in_question(game._read_guess())
+        game._print_question()
+        game._clear_screen()
+
+        counts = {
+            name: histogram.count
+            for name, histogram in metrics.histograms.items()
+        }
+        self.assertEqual(counts["guess"], 1)
+        self.assertEqual(counts["input_to_frame"], 1)
+        self.assertEqual(counts["clear"], 1)
+        self.assertGreaterEqual(counts["render"], 2)
+
+    def test_async_game_stays_async(self) -> None:
+        """Coroutine methods are wrapped by coroutines"""
+        game = AsyncGame(
+            self.settings,
+            Assets(),
+            ["big"],
+            ["big small"],
+            reader=QueueReader(),
+            output=io.StringIO(),
+            geometry=TerminalGeometry((80, 24)),
+        )
+        self.addCleanup(game.timer["scheduler"].shutdown)
+        metrics = Metrics()
+        instrument(game, metrics)
+        self.assertTrue(inspect.iscoroutinefunction(game._read_guess))
+
+        async def read() -> str:
+            game.reader.feed("b")
+            return await game._read_guess()
+
+        self.assertEqual(asyncio.run(read()), "b")
+        self.assertEqual(metrics.histograms["input"].count, 1)
+
+    def test_timer_wakeup_lateness(self) -> None:
+        """The scheduler reports how late each callback ran"""
+        scheduler = TimerScheduler()
+        self.addCleanup(scheduler.shutdown)
+        late: list[float] = []
+        scheduler.on_wakeup = late.append
+        done = threading.Event()
+        scheduler.schedule(0.01, done.set)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(len(late), 1)
+        self.assertGreaterEqual(late[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
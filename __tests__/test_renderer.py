@@ -0,0 +1,116 @@
+"""Unit test for the frame-buffer renderer"""
+
+import io
+import unittest
+from src.renderer import Frame, Renderer
+
+
+class TestRenderer(unittest.TestCase):
+    """Test suite for frame diffing and output batching"""
+
+    def setUp(self) -> None:
+        self.output = io.StringIO()
+        self.renderer = Renderer(self.output)
+
+    def _draw(self, frame: Frame, keep_cursor: bool = False) -> str:
+        self.output.seek(0)
+        self.output.truncate()
+        self.renderer.draw(frame, keep_cursor)
+        return self.output.getvalue()
+
+    def test_first_frame_written_once(self) -> None:
+        """A whole frame is sent with a single write"""
+        frame = Frame()
+        frame.put(2, 3, "abc")
+        frame.put(3, 1, "x", "\033[31m")
+        self.assertEqual(
+            self._draw(frame), "\033[2;3Habc\033[3;1H\033[0m\033[31mx\033[0m"
+        )
+        self.assertEqual(self.renderer.writes, 1)
+
+    def test_only_changed_cells(self) -> None:
+        """Redrawing writes only the cells that differ"""
+        frame = Frame()
+        frame.put(1, 1, "hello world, this is a long line")
+        self._draw(frame)
+
+        frame = Frame()
+        frame.put(1, 1, "hello world, this is a LONG line")
+        self.assertEqual(self._draw(frame), "\033[1;24HLONG")
+
+        self.assertEqual(self._draw(frame), "")
+
+    def test_removed_cells_are_blanked(self) -> None:
+        """Rows and cells missing from the new frame are erased"""
+        frame = Frame()
+        frame.put(1, 1, "abc")
+        frame.put(2, 1, "de")
+        self._draw(frame)
+
+        frame = Frame()
+        frame.put(1, 1, "a")
+        self.assertEqual(self._draw(frame), "\033[1;2H  \033[2;1H  ")
+
+    def test_wide_characters_rewrite_row(self) -> None:
+        """Rows with non-ASCII characters are rewritten as a whole"""
+        frame = Frame()
+        frame.put(1, 1, "✺ a")
+        self._draw(frame)
+
+        frame = Frame()
+        frame.put(1, 1, "✺ b")
+        self.assertEqual(self._draw(frame), "\033[1;1H\033[2K✺ b")
+
+    def test_prompt_cursor(self) -> None:
+        """The cursor ends after the prompt, or where it was"""
+        frame = Frame()
+        frame.put_prompt(5, 3, "-> ")
+        # trailing blanks match an empty screen and are not written
+        self.assertEqual(self._draw(frame), "\033[5;3H->\033[5;6H\033[K")
+        self.assertEqual(self._draw(frame), "\033[5;6H\033[K")
+
+        frame = Frame()
+        frame.put(1, 1, "x")
+        self.assertEqual(
+            self._draw(frame, keep_cursor=True),
+            "\033[s\033[1;1Hx\033[5;3H  \033[u",
+        )
+
+    def test_clear_forgets_previous_frame(self) -> None:
+        """After a clear, the next frame is drawn in full"""
+        frame = Frame()
+        frame.put(1, 1, "abc")
+        self._draw(frame)
+        self.renderer.clear()
+        self.assertEqual(self._draw(frame), "\033[1;1Habc")
+
+    def test_paint_matches_first_draw(self) -> None:
+        """`paint` returns what drawing on a blank screen writes"""
+        frame = Frame()
+        frame.put(2, 4, "ab", "\033[1m")
+        frame.put_row(3, [("✺", ""), (" ", ""), ("c", "")])
+        frame.put_prompt(6, 2, "> ")
+        painted = self.renderer.paint(frame)
+        self.assertEqual(self.renderer.writes, 0)
+        self.assertEqual(self._draw(frame), painted)
+
+    def test_draw_encoded(self) -> None:
+        """Encoded screens are written once, then fully redrawn over"""
+        self.renderer.draw_encoded("\033[1;1H✺".encode("utf-8"))
+        self.assertEqual(self.output.getvalue(), "\033[1;1H✺")
+        self.assertEqual(self.renderer.bytes_written, 9)
+
+        binary = io.BytesIO()
+        text = io.TextIOWrapper(binary, encoding="utf-8")
+        renderer = Renderer(text)
+        renderer.write("a")
+        renderer.draw_encoded(b"b")
+        self.assertEqual(binary.getvalue(), b"ab")
+
+        frame = Frame()
+        frame.put(1, 1, "x")
+        self.assertEqual(self._draw(frame), "\033[2J\033[H\033[1;1Hx")
+
+
+if __name__ == "__main__":
+    unittest.main()
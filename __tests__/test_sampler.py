@@ -0,0 +1,153 @@
+"""Unit test for the no-repeat permutation sampler"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from src.game import Data, SAMPLER_SAVE_INTERVAL
+from src.sampler import PermutationSampler, load_samplers, save_samplers
+
+
+class TestPermutationSampler(unittest.TestCase):
+    """Test suite for `PermutationSampler` and its saved state"""
+
+    def test_no_repeat_in_pass(self) -> None:
+        """A pass visits every index exactly once"""
+        for size in (1, 2, 3, 7, 100, 1000, 4097):
+            sampler = PermutationSampler(size, seed=size)
+            drawn = [sampler.draw() for _ in range(size)]
+            self.assertEqual(sorted(drawn), list(range(size)))
+
+    def test_next_pass_reshuffles(self) -> None:
+        """After the last index a new pass starts in a new order"""
+        sampler = PermutationSampler(500, seed=3)
+        first = [sampler.draw() for _ in range(500)]
+        second = [sampler.draw() for _ in range(500)]
+        self.assertEqual(sampler.epoch, 1)
+        self.assertEqual(sorted(second), list(range(500)))
+        self.assertNotEqual(first, second)
+
+    def test_uniform_over_seeds(self) -> None:
+        """Each index is about as likely at any position"""
+        size = 10
+        runs = 5000
+        first = Counter()
+        last = Counter()
+        for seed in range(runs):
+            sampler = PermutationSampler(size, seed=seed)
+            first[sampler.at(0)] += 1
+            last[sampler.at(size - 1)] += 1
+        expected = runs / size
+        for counts in (first, last):
+            self.assertEqual(len(counts), size)
+            chi_square = sum(
+                (count - expected) ** 2 / expected
+                for count in counts.values()
+            )
+            # 9 degrees of freedom, p < 0.001 above 27.9
+            self.assertLess(chi_square, 27.9)
+
+    def test_state_resumes_order(self) -> None:
+        """A sampler rebuilt from its state continues the same order"""
+        sampler = PermutationSampler(300, seed=11)
+        expected = [sampler.draw() for _ in range(450)]
+
+        sampler = PermutationSampler(300, seed=11)
+        drawn = [sampler.draw() for _ in range(200)]
+        resumed = PermutationSampler.from_state(sampler.get_state())
+        drawn += [resumed.draw() for _ in range(250)]
+        self.assertEqual(drawn, expected)
+
+    def test_extend_keeps_pass(self) -> None:
+        """Indexes added during a pass join it, the drawn ones stay out"""
+        for seed in range(20):
+            sampler = PermutationSampler(50, seed=seed)
+            drawn = [sampler.draw() for _ in range(20)]
+            sampler.extend(80)
+            drawn += [sampler.draw() for _ in range(40)]
+            # resumed half way through the extended pass
+            sampler = PermutationSampler.from_state(sampler.get_state())
+            drawn += [sampler.draw() for _ in range(20)]
+            self.assertEqual(sorted(drawn), list(range(80)))
+            self.assertEqual(sampler.epoch, 0)
+            self.assertEqual(
+                sorted(sampler.draw() for _ in range(80)), list(range(80))
+            )
+            self.assertEqual(sampler.epoch, 1)
+
+    def test_extend_mixes_added(self) -> None:
+        """Added indexes are spread over the rest of the pass"""
+        sampler = PermutationSampler(1000, seed=4)
+        for _ in range(500):
+            sampler.draw()
+        sampler.extend(1500)
+        rest = [sampler.draw() for _ in range(1000)]
+        added = sum(idx >= 1000 for idx in rest[:500])
+        self.assertGreater(added, 200)
+        self.assertLess(added, 300)
+
+    def test_save_and_load(self) -> None:
+        """Saved states are resumed, stale or missing ones start over"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "data.json.sampler")
+
+        samplers = {"words": PermutationSampler(40, seed=5, position=12)}
+        save_samplers(filename, samplers)
+        loaded = load_samplers(filename, {"words": 40, "phrases": 8})
+        self.assertEqual(loaded["words"].get_state(), samplers["words"]
+                         .get_state())
+        self.assertEqual(loaded["phrases"].position, 0)
+
+        loaded = load_samplers(filename, {"words": 41})
+        self.assertEqual(loaded["words"].position, 0)
+
+    def test_data_asks_every_entry_once(self) -> None:
+        """`Data` repeats no answer until the whole list was asked"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "data.json.sampler")
+        phrases = [f"phrase {idx}" for idx in range(30)]
+
+        data = Data(["word"], phrases)
+        data.use_sampler(filename)
+        asked = [data.get_random("intermediate") for _ in range(10)]
+        data.save_sampler()
+
+        # a restart resumes the same permutation
+        data = Data(["word"], phrases)
+        data.use_sampler(filename)
+        asked += [data.get_random("intermediate") for _ in range(20)]
+        self.assertEqual(sorted(asked), sorted(phrases))
+
+    def test_data_saves_every_interval(self) -> None:
+        """The sampler state is written every few picks, not on each one"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "data.json.sampler")
+        data = Data(["word"], [f"phrase {idx}" for idx in range(100)])
+        data.use_sampler(filename)
+
+        for _ in range(SAMPLER_SAVE_INTERVAL - 1):
+            data.get_random("intermediate")
+        self.assertFalse(os.path.exists(filename))
+        data.get_random("intermediate")
+        saved = load_samplers(filename, {"phrases": 100})
+        self.assertEqual(saved["phrases"].position, SAMPLER_SAVE_INTERVAL)
+        self.assertEqual(data.unsaved_draws, 0)
+
+    def test_data_reload_appended(self) -> None:
+        """Entries appended by a reload join the pass without repeats"""
+        phrases = [f"phrase {idx}" for idx in range(30)]
+        data = Data(["word"], phrases)
+        data.use_sampler()
+        asked = [data.get_random("intermediate") for _ in range(20)]
+
+        phrases = phrases + [f"phrase {idx}" for idx in range(30, 45)]
+        self.assertTrue(data.reload(["word"], phrases))
+        asked += [data.get_random("intermediate") for _ in range(25)]
+        self.assertEqual(sorted(asked), sorted(phrases))
+
+
+if __name__ == "__main__":
+    unittest.main()
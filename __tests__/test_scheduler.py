@@ -0,0 +1,72 @@
+"""Unit test for the single-thread timer scheduler"""
+
+import threading
+import unittest
+from src.scheduler import TimerScheduler
+
+
+class TestTimerScheduler(unittest.TestCase):
+    """Test suite for scheduling, ordering and cancelling timers"""
+
+    def setUp(self) -> None:
+        self.scheduler = TimerScheduler()
+
+    def tearDown(self) -> None:
+        self.scheduler.shutdown()
+
+    def test_runs_in_deadline_order(self) -> None:
+        """Callbacks run by deadline, not by scheduling order"""
+        done = threading.Event()
+        order: list[int] = []
+        self.scheduler.schedule(0.06, lambda: (order.append(3), done.set()))
+        self.scheduler.schedule(0.02, order.append, 1)
+        self.scheduler.schedule(0.04, order.append, 2)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(order, [1, 2, 3])
+
+    def test_cancel(self) -> None:
+        """Cancelled timers never run"""
+        done = threading.Event()
+        called: list[str] = []
+        handle = self.scheduler.schedule(0.01, called.append, "cancelled")
+        handle.cancel()
+        self.scheduler.schedule(0.03, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(called, [])
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_single_thread(self) -> None:
+        """Every callback runs on the same scheduler thread"""
+        done = threading.Event()
+        threads: set[int] = set()
+
+        def record() -> None:
+            threads.add(threading.get_ident())
+
+        for _ in range(50):
+            self.scheduler.schedule(0, record)
+        self.scheduler.schedule(0.02, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(len(threads), 1)
+
+    def test_schedule_at(self) -> None:
+        """Timers run at a deadline of the scheduler's clock"""
+        done = threading.Event()
+        ran_at: list[float] = []
+        deadline = self.scheduler.clock() + 0.03
+        self.scheduler.schedule_at(
+            deadline, lambda: (ran_at.append(self.scheduler.clock()),
+                               done.set())
+        )
+        self.assertTrue(done.wait(2))
+        self.assertGreaterEqual(ran_at[0], deadline)
+
+    def test_cancel_compacts_heap(self) -> None:
+        """Cancelling many long timers keeps the heap bounded"""
+        for _ in range(10000):
+            self.scheduler.schedule(60, print).cancel()
+        self.assertLess(len(self.scheduler._heap), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unit test for the multi-session TCP server"""
+
+import asyncio
+import unittest
+from src.read_json import ReadJson
+from src.server import HangmanServer
+
+
+class TestServer(unittest.TestCase):
+    """Test suite for sessions served over local TCP connections"""
+
+    def setUp(self) -> None:
+        self.settings = ReadJson().get_settings("settings.json")
+
+    async def _read_until(self, reader, text: bytes) -> bytes:
+        buffer = b""
+        while text not in buffer:
+            chunk = await asyncio.wait_for(reader.read(65536), 5)
+            if not chunk:
+                break
+            buffer += chunk
+        return buffer
+
+    def test_sessions_play_independently(self) -> None:
+        """Concurrent players each get their own game on shared data"""
+
+        async def player(port: int, letters: str) -> bytes:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await self._read_until(reader, b"Press enter to continue.")
+            # telnet option negotiation is ignored
+            writer.write(b"\xff\xfb\x1f\r\n")
+            await self._read_until(reader, b"3. Quit")
+            writer.write(b"1\r\n")
+            for letter in letters:
+                writer.write(letter.encode() + b"\r\n")
+            output = await self._read_until(reader, b"Press 'enter'")
+            writer.write(b"\r\n3\r\n")
+            output += await reader.read()
+            writer.close()
+            return output
+
+        async def run() -> tuple[HangmanServer, list[bytes]]:
+            server = HangmanServer(self.settings, ["big"], ["big small"])
+            listening = await server.start("127.0.0.1", 0)
+            port = listening.sockets[0].getsockname()[1]
+            outputs = await asyncio.gather(
+                *(
+                    player(port, "big" if idx % 2 else "acdefhj")
+                    for idx in range(20)
+                )
+            )
+            listening.close()
+            await listening.wait_closed()
+            return server, outputs
+
+        server, outputs = asyncio.run(run())
+        for idx, output in enumerate(outputs):
+            won = b"Congratulations!" in output
+            self.assertEqual(won, bool(idx % 2))
+        self.assertEqual(server.served, 20)
+        self.assertEqual(server.sessions, 0)
+
+    def test_disconnect_ends_session(self) -> None:
+        """A client leaving mid-game frees its session"""
+
+        async def run() -> HangmanServer:
+            server = HangmanServer(self.settings, ["big"], ["big small"])
+            listening = await server.start("127.0.0.1", 0)
+            port = listening.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"\r\n1\r\nb\r\n")
+            await self._read_until(reader, b"Time left")
+            writer.close()
+            while server.sessions:
+                await asyncio.sleep(0.01)
+            listening.close()
+            await listening.wait_closed()
+            return server
+
+        server = asyncio.run(asyncio.wait_for(run(), 5))
+        self.assertEqual(server.served, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unit test for the bit-sliced batch simulator"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src import simulate as simulate_module
+from src.read_json import ReadJson
+from src.simulate import (
+    SCRIPTED,
+    check_equivalence,
+    play_counts,
+    random_orders,
+    simulate,
+    simulate_counts,
+)
+
+
+class TestSimulate(unittest.TestCase):
+    """Test suite for `simulate_counts` against `GameEngine`"""
+
+    def setUp(self) -> None:
+        self.word_list, self.phrase_list = ReadJson().get_data("data.json")
+
+    def test_matches_engine_on_corpus(self) -> None:
+        """Every game of the corpus ends as it does with the engine"""
+        answers = self.word_list + self.phrase_list
+        for start_life in (1, 3, 7):
+            orders = random_orders(21, seed=start_life)
+            self.assertTrue(check_equivalence(answers, orders, start_life))
+        self.assertTrue(check_equivalence(answers, [SCRIPTED], 7))
+
+    def test_matches_engine_on_edge_cases(self) -> None:
+        """Empty, unguessable and partial guess orders behave the same"""
+        answers = ["", "   ", "a-b", "Ab", "zz", "a", "abc def"]
+        orders = ["abc", "", "zyxfedcba", "b"] + random_orders(5, seed=9)
+        self.assertEqual(
+            simulate_counts(answers, orders, 2),
+            play_counts(answers, orders, 2),
+        )
+
+    def test_known_results(self) -> None:
+        """Win rate and mean guesses of simple games"""
+        results = simulate(["ab", "xyz"], ["ab", "ba", "cab"], 1)
+        # "cab" loses its only life on "c"
+        self.assertEqual(results[0], (2 / 3, 5 / 3))
+        self.assertEqual(results[1], (0.0, 1.0))
+
+    def test_repeated_letter_rejected(self) -> None:
+        """Guess orders must not repeat a letter"""
+        with self.assertRaises(ValueError):
+            simulate(["ab"], ["aa"], 3)
+
+    def _main(self, data_filename: str, output: io.StringIO) -> None:
+        # runs `main` with the shipped settings but `data_filename`
+        with tempfile.TemporaryDirectory() as directory:
+            settings = dict(
+                ReadJson().get_settings("settings.json"),
+                data_filename=data_filename,
+            )
+            filename = os.path.join(directory, "settings.json")
+            with open(filename, "w", encoding="utf-8") as file:
+                json.dump(settings, file)
+            with patch.object(
+                simulate_module, "SETTINGS_FILENAME", filename
+            ), patch.object(
+                simulate_module.sys, "argv", ["simulate.py", "7", "scripted"]
+            ), contextlib.redirect_stdout(output):
+                simulate_module.main()
+
+    def test_main_uses_settings(self) -> None:
+        """The corpus is the one named by the settings"""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "corpus.json")
+            with open(filename, "w", encoding="utf-8") as file:
+                json.dump({"words": ["quiz"], "phrases": ["big jump"]}, file)
+            output = io.StringIO()
+            self._main(filename, output)
+        self.assertIn("words: 1 entries, 1 games each", output.getvalue())
+        self.assertIn("quiz", output.getvalue())
+        self.assertIn("big jump", output.getvalue())
+
+    def test_main_missing_corpus(self) -> None:
+        """A missing corpus exits with a message"""
+        output = io.StringIO()
+        with self.assertRaises(SystemExit) as context:
+            self._main("missing.json", output)
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("missing.json not found", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit test for game snapshots and resuming a game"""
+
+import io
+import os
+import tempfile
+import unittest
+from src.assets import Assets
+from src.game import Game
+from src.read_json import ReadJson
+from src.snapshot import SnapshotFile, pack, unpack, record_size
+from src.terminal import TerminalGeometry
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test suite for the snapshot format, file and `Game.resume_game`"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "game.snapshot")
+        self.settings = ReadJson().get_settings("settings.json")
+        self.games: list[Game] = []
+
+    def tearDown(self) -> None:
+        for game in self.games:
+            game.timer["scheduler"].shutdown()
+            game.snapshots.close()
+        self.directory.cleanup()
+
+    def _game(self, phrase_list: list[str]) -> Game:
+        game = Game(
+            self.settings,
+            Assets(),
+            ["big", "small"],
+            phrase_list,
+            output=io.StringIO(),
+            geometry=TerminalGeometry((80, 24)),
+            snapshots=SnapshotFile(self.filename),
+        )
+        self.games.append(game)
+        return game
+
+    def test_pack_round_trip(self) -> None:
+        """Every field survives, in a few bytes"""
+        data = pack(1, 70000, "big small", 0b101, 6, 12, 26)
+        self.assertEqual(len(data), record_size(26))
+        self.assertLessEqual(len(data), 20)
+        snapshot = unpack(data, 26)
+        self.assertEqual(
+            (
+                snapshot["level"],
+                snapshot["index"],
+                snapshot["typed"],
+                snapshot["life"],
+                snapshot["time_left"],
+            ),
+            (1, 70000, 0b101, 6, 12),
+        )
+        self.assertIsNone(unpack(data, 40))
+        self.assertIsNone(unpack(b"", 26))
+
+    def test_bulk_flush(self) -> None:
+        """Slots put by many sessions are written by one flush"""
+        snapshots = SnapshotFile(self.filename)
+        for slot in range(100):
+            snapshots.put(slot, pack(0, slot, "big", 0, 7, 15, 26))
+        self.assertEqual(os.path.getsize(self.filename), 0)
+        snapshots.flush()
+        snapshots.clear(3)
+        snapshots.close()
+
+        reopened = SnapshotFile(self.filename)
+        self.assertEqual(unpack(reopened.get(99), 26)["index"], 99)
+        self.assertIsNone(reopened.get(3))
+        self.assertIsNone(reopened.get(100))
+        reopened.close()
+
+    def test_resume_game(self) -> None:
+        """A new game picks up the saved answer, letters, lives and time"""
+        game = self._game(["big small", "quick brown fox"])
+        game.get_question("intermediate")
+        for letter in "qzi":
+            game.letter_in_question(letter)
+        game.timer["time_counter"] = 9
+        # as `main` does at exit
+        game.save_snapshot()
+        game.snapshots.close()
+
+        resumed = self._game(["big small", "quick brown fox"])
+        self.assertEqual(resumed.resume_game(), "intermediate")
+        self.assertEqual(resumed.state["answer"], game.state["answer"])
+        self.assertEqual(resumed.state["hidden"], game.state["hidden"])
+        self.assertEqual(resumed.state["life"], game.state["life"])
+        self.assertEqual(resumed.tracker.typed, game.tracker.typed)
+        self.assertEqual(resumed.tracker.hit, game.tracker.hit)
+        self.assertEqual(resumed.timer["time_counter"], 9)
+
+    def test_timer_ticks_not_saved(self) -> None:
+        """Redrawing the time left does not write the snapshot"""
+        game = self._game(["big small"])
+        game.get_question("intermediate")
+        game.letter_in_question("b")
+        saved = game.snapshots.get(0)
+        writes = []
+        game.snapshots.write = lambda *args: writes.append(args)
+        for time_counter in range(9, 0, -1):
+            game.timer["time_counter"] = time_counter
+            game._timer_display(time_counter)
+        self.assertEqual(writes, [])
+        self.assertEqual(game.snapshots.get(0), saved)
+
+    def test_changed_corpus_not_resumed(self) -> None:
+        """A snapshot whose answer is not at its index anymore is ignored"""
+        game = self._game(["big small"])
+        game.get_question("intermediate")
+        game.letter_in_question("b")
+        game.snapshots.close()
+
+        self.assertIsNone(self._game(["other phrase"]).resume_game())
+
+    def test_finished_game_not_resumed(self) -> None:
+        """The end screen clears the snapshot"""
+        game = self._game(["big small"])
+        game.get_question("intermediate")
+        game.letter_in_question("b")
+        game._game_end_menu()
+        game.snapshots.close()
+
+        self.assertIsNone(self._game(["big small"]).resume_game())
+
+
+if __name__ == "__main__":
+    unittest.main()
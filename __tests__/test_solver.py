@@ -0,0 +1,107 @@
+"""Unit test for the next-guess solver, hints and the auto-play bot"""
+
+import asyncio
+import io
+import unittest
+from src.async_game import AsyncGame, QueueReader
+from src.assets import Assets
+from src.engine import GameEngine, LetterTracker
+from src.read_json import ReadJson
+from src.solver import Solver
+
+
+class TestSolver(unittest.TestCase):
+    """Test suite for `Solver` candidates and guesses"""
+
+    def setUp(self) -> None:
+        self.solver = Solver(["cat", "car", "bat", "cow"], ["a cat"])
+        self.tracker = LetterTracker()
+
+    def test_candidates_match_pattern(self) -> None:
+        """Revealed positions and missed letters narrow the candidates"""
+        self.tracker.mark_typed("a", hit=True)
+        hidden = ["_", "a", "_"]
+        self.assertEqual(
+            self.solver.candidates(hidden, self.tracker),
+            ["cat", "car", "bat"],
+        )
+        self.tracker.mark_typed("r")
+        self.assertEqual(
+            self.solver.candidates(hidden, self.tracker), ["cat", "bat"]
+        )
+        self.assertEqual(
+            self.solver.candidates(list("a _a_"), self.tracker), ["a cat"]
+        )
+
+    def test_found_letter_not_hidden(self) -> None:
+        """A found letter cannot be at a position still hidden"""
+        solver = Solver(["tot", "tog"])
+        self.tracker.mark_typed("t", hit=True)
+        self.assertEqual(
+            solver.candidates(["t", "_", "_"], self.tracker), ["tog"]
+        )
+
+    def test_next_guess(self) -> None:
+        """The guess is the untyped letter in the most candidates"""
+        # "a" and "c" are in 3 candidates each, ties go to the alphabet
+        self.assertEqual(self.solver.next_guess(list("___"), self.tracker),
+                         "a")
+        self.tracker.mark_typed("c", hit=True)
+        self.tracker.mark_typed("a", hit=True)
+        guess = self.solver.next_guess(list("ca_"), self.tracker)
+        self.assertIn(guess, ("t", "r"))
+
+    def test_unknown_answer(self) -> None:
+        """Answers missing from the list still get a guess"""
+        self.assertIsNotNone(self.solver.next_guess(list("____"),
+                                                    self.tracker))
+        self.assertEqual(
+            self.solver.next_guess(list("___"), LetterTracker("a")), "a"
+        )
+        tracker = LetterTracker("a")
+        tracker.mark_typed("a")
+        self.assertIsNone(self.solver.next_guess(list("___"), tracker))
+
+    def test_solves_corpus(self) -> None:
+        """Following the solver wins every game of the corpus"""
+        word_list, phrase_list = ReadJson().get_data("data.json")
+        solver = Solver(word_list, phrase_list)
+        engine = GameEngine(7)
+        for answer in word_list + phrase_list:
+            engine.reset()
+            engine.new_round(answer)
+            while not engine.is_over():
+                engine.guess(
+                    solver.next_guess(engine.state["hidden"], engine.tracker)
+                )
+            self.assertTrue(engine.state["won"], answer)
+
+    def test_hint_and_auto_play(self) -> None:
+        """The hint key shows a hint, the bot plays a game to the end"""
+        settings = ReadJson().get_settings("settings.json")
+
+        async def play(settings: dict[str, str], lines: list[str]):
+            game = AsyncGame(
+                settings,
+                Assets(),
+                ["big", "bag"],
+                ["big small"],
+                reader=QueueReader(),
+                output=io.StringIO(),
+            )
+            for line in lines:
+                game.reader.feed(line)
+            await asyncio.wait_for(game.start_game("basic"), 5)
+            return game.output.getvalue()
+
+        output = asyncio.run(play(settings, ["?", "b", "g", "i", "a", ""]))
+        self.assertIn("Hint: try 'b'", output)
+        self.assertIn("Congratulations!", output)
+
+        settings = dict(settings, auto_play="true", auto_play_delay="0")
+        output = asyncio.run(play(settings, [""]))
+        self.assertIn("Congratulations!", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Unit test for the player stats store"""
+
+import io
+import os
+import tempfile
+import threading
+import unittest
+import warnings
+from src.assets import Assets
+from src.game import Game
+from src.read_json import ReadJson
+from src.stats import StatsStore
+from src.terminal import TerminalGeometry
+
+
+class TestStatsStore(unittest.TestCase):
+    """Test suite for recording games and the leaderboard queries"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "stats.db")
+        self.stats = StatsStore(self.filename, flush_interval=60)
+
+    def tearDown(self) -> None:
+        self.stats.close()
+        self.directory.cleanup()
+
+    def _play(self, player: str, results: str, level: str = "basic") -> None:
+        for result in results:
+            self.stats.record(player, level, "big", result == "w", 4, 3, 2.0)
+
+    def test_batched_writes(self) -> None:
+        """Queued games share a transaction and are written on flush"""
+        self._play("ana", "wwlw")
+        self.assertIsNone(self.stats.rank("ana", "basic"))
+        self.stats.flush()
+        self.assertEqual(self.stats.written, 4)
+        self.assertEqual(self.stats.batches, 1)
+        self.assertEqual(
+            self.stats.history("ana", "basic", 1), [("big", 1, 4, 3, 2.0)]
+        )
+
+    def test_rank_and_streaks(self) -> None:
+        """Players rank by wins, then fewer games, per level"""
+        self._play("ana", "wwlw")
+        self._play("bob", "www")
+        self._play("cy", "wwwl")
+        self._play("dee", "wwwwww", "intermediate")
+        self.stats.flush()
+
+        self.assertEqual(
+            self.stats.leaderboard("basic"),
+            [("bob", 3, 3), ("ana", 3, 4), ("cy", 3, 4)],
+        )
+        rank = self.stats.rank("cy", "basic")
+        self.assertEqual((rank["rank"], rank["players"]), (2, 3))
+        self.assertEqual((rank["streak"], rank["best_streak"]), (0, 3))
+        self.assertEqual(self.stats.rank("ana", "basic")["streak"], 1)
+        self.assertEqual(self.stats.streaks("basic", 1), [("bob", 3, 3)])
+        self.assertEqual(self.stats.rank("dee", "intermediate")["rank"], 1)
+
+    def test_no_deprecated_bindings(self) -> None:
+        """Writes and ranks bind their parameters the way sqlite3 expects"""
+        # recorded from the writer thread too, the filters are global
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self._play("ana", "wlw")
+            self.stats.flush()
+            rank = self.stats.rank("ana", "basic")
+        self.assertEqual(
+            [str(warning.message) for warning in caught
+             if issubclass(warning.category, DeprecationWarning)],
+            [],
+        )
+        self.assertEqual(self.stats.errors, 0)
+        self.assertEqual((rank["games"], rank["wins"]), (3, 2))
+
+    def test_on_rank_called_after_write(self) -> None:
+        """The rank callback gets the standing including the new game"""
+        ranks = []
+        self.stats.record(
+            "ana", "basic", "big", True, 3, 7, 1.0, on_rank=ranks.append
+        )
+        self.stats.flush()
+        self.assertEqual(ranks[0]["games"], 1)
+        self.assertEqual(ranks[0]["rank"], 1)
+
+    def test_failing_callback_keeps_writer(self) -> None:
+        """A rank callback that raises does not stop later writes"""
+
+        def fail(rank: dict) -> None:
+            raise ValueError("display gone")
+
+        self.stats.record("ana", "basic", "big", True, 3, 7, 1.0, fail)
+        self.stats.flush()
+        ranks = []
+        self.stats.record(
+            "ana", "basic", "big", False, 5, 0, 2.0, on_rank=ranks.append
+        )
+        flushed = threading.Thread(target=self.stats.flush, daemon=True)
+        flushed.start()
+        flushed.join(5)
+        self.assertFalse(flushed.is_alive())
+        self.assertEqual(self.stats.callback_errors, 1)
+        self.assertEqual(self.stats.written, 2)
+        self.assertEqual(ranks[0]["games"], 2)
+
+    def test_close_writes_queued_games(self) -> None:
+        """Closing the store writes what is still queued"""
+        self._play("ana", "wl")
+        self.stats.close()
+        reopened = StatsStore(self.filename)
+        try:
+            self.assertEqual(reopened.rank("ana", "basic")["games"], 2)
+        finally:
+            reopened.close()
+
+    def test_game_shows_rank(self) -> None:
+        """The end screen records the game and draws the player's rank"""
+        settings = dict(ReadJson().get_settings("settings.json"))
+        settings["player"] = "ana"
+        output = io.StringIO()
+        game = Game(
+            settings,
+            Assets(),
+            ["big"],
+            ["big small"],
+            output=output,
+            geometry=TerminalGeometry((80, 24)),
+            stats=self.stats,
+        )
+        game.timer["scheduler"].shutdown()
+        drawn = threading.Event()
+        show_rank = game._show_rank
+
+        def on_rank(rank) -> None:
+            show_rank(rank)
+            drawn.set()
+
+        game._show_rank = on_rank
+        game.get_question("basic")
+        for letter in "bxig":
+            game.letter_in_question(letter)
+        game._game_end_menu()
+        self.stats.flush()
+        self.assertTrue(drawn.wait(5))
+
+        self.assertIn(
+            "Rank #1 of 1 in basic, win streak 1", output.getvalue()
+        )
+        # b, x, i and g were guessed, x cost a life
+        self.assertEqual(
+            self.stats.history("ana", "basic")[0][:4], ("big", 1, 4, 6)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
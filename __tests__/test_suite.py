@@ -0,0 +1,107 @@
+"""Unit test for the benchmark suite's sizes and regression check"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmarks import suite
+
+BASELINE = os.path.join("benchmarks", "baseline.json")
+
+
+def results_of(times: dict[str, float]) -> dict:
+    """Returns a results file with `times` as the best of each metric"""
+    return {
+        "meta": {},
+        "metrics": {
+            name: {"best": best, "median": best}
+            for name, best in times.items()
+        },
+    }
+
+
+class TestSuite(unittest.TestCase):
+    """Test suite for `parse_size`, `compare` and the exit status"""
+
+    def test_parse_size(self) -> None:
+        """Counts are read with or without a `k`/`m` suffix"""
+        self.assertEqual(suite.parse_size("1k"), 1000)
+        self.assertEqual(suite.parse_size(" 100K "), 100000)
+        self.assertEqual(suite.parse_size("10m"), 10000000)
+        self.assertEqual(suite.parse_size("250"), 250)
+        for size in (250, 1000, 1500, 100000, 10000000):
+            self.assertEqual(
+                suite.parse_size(suite.format_size(size)), size
+            )
+        with self.assertRaises(ValueError):
+            suite.parse_size("fast")
+
+    def test_compare(self) -> None:
+        """Only metrics slower than the threshold are regressions"""
+        baseline = results_of(
+            {"a[1k]": 1.0, "b[1k]": 1.0, "c[1k]": 1.0, "zero[1k]": 0.0}
+        )
+        results = results_of(
+            {
+                "a[1k]": 1.2,
+                "b[1k]": 1.1,
+                "c[1k]": 0.5,
+                "zero[1k]": 1.0,
+                "new[1k]": 9.0,
+            }
+        )
+        regressions = suite.compare(results, baseline, 0.15)
+        self.assertEqual(len(regressions), 1)
+        name, old, new, ratio = regressions[0]
+        self.assertEqual((name, old, new), ("a[1k]", 1.0, 1.2))
+        self.assertAlmostEqual(ratio, 1.2)
+        self.assertEqual(suite.compare(results, baseline, 0.25), [])
+        self.assertEqual(suite.compare(baseline, baseline, 0.0), [])
+
+    def _main(self, baseline: dict, results: dict) -> str:
+        # runs `main` on `results` instead of timing anything
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "baseline.json")
+            with open(filename, "w", encoding="utf-8") as file:
+                json.dump(baseline, file)
+            argv = ["suite", "--sizes", "1k", "--baseline", filename]
+            output = io.StringIO()
+            with patch.object(suite.sys, "argv", argv), patch.object(
+                suite, "run", return_value=results
+            ), contextlib.redirect_stdout(output):
+                suite.main()
+        return output.getvalue()
+
+    def test_exit_on_regression(self) -> None:
+        """A run slower than its baseline exits with status 1"""
+        with self.assertRaises(SystemExit) as context:
+            self._main(
+                results_of({"a[1k]": 1.0}), results_of({"a[1k]": 1.5})
+            )
+        self.assertEqual(context.exception.code, 1)
+
+        output = self._main(
+            results_of({"a[1k]": 1.0}), results_of({"a[1k]": 1.1})
+        )
+        self.assertIn("no regression past 15%", output)
+
+    def test_baseline_file(self) -> None:
+        """The saved baseline has every metric of its sizes"""
+        with open(BASELINE, encoding="utf-8") as file:
+            baseline = json.load(file)
+        sizes = baseline["meta"]["sizes"]
+        self.assertEqual(sizes, suite.DEFAULT_SIZES.split(","))
+        self.assertEqual(baseline["meta"]["seed"], suite.SEED)
+        groups = {name.split(".")[0] for name in baseline["metrics"]}
+        self.assertEqual(groups, set(suite.GROUPS))
+        for name, result in baseline["metrics"].items():
+            self.assertIn(name[name.index("[") + 1:-1], sizes)
+            self.assertGreater(result["best"], 0)
+            self.assertLessEqual(result["best"], result["median"])
+
+
+if __name__ == "__main__":
+    unittest.main()
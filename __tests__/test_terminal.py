@@ -0,0 +1,78 @@
+"""Unit test for the cached terminal geometry"""
+
+import io
+import os
+import signal
+import unittest
+from unittest.mock import patch
+from src.terminal import TerminalGeometry
+from src.renderer import Frame, Renderer
+
+
+class TestTerminalGeometry(unittest.TestCase):
+    """Test suite for size caching, resize refresh and centering"""
+
+    def test_fixed_size(self) -> None:
+        """A fixed geometry never queries the terminal"""
+        with patch("shutil.get_terminal_size") as get_size:
+            geometry = TerminalGeometry((40, 10))
+            self.assertEqual((geometry.width, geometry.height), (40, 10))
+            self.assertEqual(geometry.center("ab"), "ab".center(40))
+        get_size.assert_not_called()
+
+    def test_size_is_cached(self) -> None:
+        """Repeated lookups query the terminal once"""
+        size = os.terminal_size((100, 30))
+        with patch("shutil.get_terminal_size", return_value=size) as get_size:
+            geometry = TerminalGeometry()
+            for _ in range(100):
+                _ = geometry.width, geometry.height, geometry.center("x")
+        self.assertEqual(get_size.call_count, 1)
+
+    def test_cache_off(self) -> None:
+        """With the cache off every lookup queries the terminal"""
+        size = os.terminal_size((100, 30))
+        with patch("shutil.get_terminal_size", return_value=size) as get_size:
+            geometry = TerminalGeometry(cache=False)
+            for _ in range(10):
+                _ = geometry.width
+        self.assertEqual(get_size.call_count, 10)
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+    def test_resize_signal(self) -> None:
+        """SIGWINCH refreshes the size and drops the centered lines"""
+        previous = signal.getsignal(signal.SIGWINCH)
+        self.addCleanup(signal.signal, signal.SIGWINCH, previous)
+
+        sizes = [os.terminal_size((100, 30)), os.terminal_size((60, 20))]
+        with patch("shutil.get_terminal_size", side_effect=sizes):
+            geometry = TerminalGeometry()
+            self.assertTrue(geometry.watch_resize())
+            self.assertEqual(geometry.center("ab"), "ab".center(100))
+            generation = geometry.generation
+
+            os.kill(os.getpid(), signal.SIGWINCH)
+            self.assertEqual(geometry.center("ab"), "ab".center(60))
+            self.assertEqual(geometry.height, 20)
+            self.assertEqual(geometry.generation, generation + 1)
+
+    def test_resize_redraws_frame(self) -> None:
+        """A renderer redraws everything after the geometry changed"""
+        output = io.StringIO()
+        sizes = [os.terminal_size((100, 30)), os.terminal_size((60, 20))]
+        with patch("shutil.get_terminal_size", side_effect=sizes):
+            geometry = TerminalGeometry()
+            renderer = Renderer(output, geometry=geometry)
+            frame = Frame()
+            frame.put(1, 1, geometry.center("x"))
+            renderer.draw(frame)
+
+            geometry.refresh()
+            output.seek(0)
+            output.truncate()
+            renderer.draw(frame)
+        self.assertTrue(output.getvalue().startswith("\033[2J\033[H"))
+
+
+if __name__ == "__main__":
+    unittest.main()
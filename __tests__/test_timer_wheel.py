@@ -0,0 +1,159 @@
+"""Unit test for the hashed timing wheel"""
+
+import asyncio
+import io
+import unittest
+from src.assets import Assets
+from src.async_game import AsyncGame, QueueReader
+from src.read_json import ReadJson
+from src.timer_wheel import TimerWheel
+
+
+class FakeClock:
+    """Clock moved by hand"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Test suite for `TimerWheel` arm, reset, cancel and ticks"""
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(resolution=1, slots=8, clock=self.clock)
+        self.fired: list[str] = []
+
+    def _advance(self, seconds: float) -> None:
+        self.clock.now += seconds
+        self.wheel.advance()
+
+    def test_fires_on_deadline(self) -> None:
+        """Timers run once their delay has elapsed, not before"""
+        self.wheel.arm(3, self.fired.append, "a")
+        self.wheel.arm(1, self.fired.append, "b")
+        self._advance(2)
+        self.assertEqual(self.fired, ["b"])
+        self._advance(1)
+        self.assertEqual(self.fired, ["b", "a"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_longer_than_one_turn(self) -> None:
+        """Delays past the end of the ring wait for their turn"""
+        self.wheel.arm(20, self.fired.append, "late")
+        self.wheel.arm(4, self.fired.append, "early")
+        self._advance(19)
+        self.assertEqual(self.fired, ["early"])
+        self._advance(1)
+        self.assertEqual(self.fired, ["early", "late"])
+
+    def test_cancel_and_reset(self) -> None:
+        """Cancelled timers never run, reset ones run at the new time"""
+        cancelled = self.wheel.arm(2, self.fired.append, "cancelled")
+        moved = self.wheel.arm(2, self.fired.append, "moved")
+        cancelled.cancel()
+        cancelled.cancel()
+        self._advance(1)
+        moved.reset(3)
+        self._advance(2)
+        self.assertEqual(self.fired, [])
+        self._advance(1)
+        self.assertEqual(self.fired, ["moved"])
+
+        # a timer that ran can be armed again
+        moved.reset(1)
+        self._advance(1)
+        self.assertEqual(self.fired, ["moved", "moved"])
+
+    def test_callback_rearms(self) -> None:
+        """A callback can reset its own timer to repeat"""
+        count = []
+
+        def repeat() -> None:
+            count.append(1)
+            if len(count) < 5:
+                timer.reset(1)
+
+        timer = self.wheel.arm(1, repeat)
+        self._advance(10)
+        self.assertEqual(len(count), 5)
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_countdown_ticks_follow_deadline(self) -> None:
+        """The wheel countdown does not drift with coarse or late ticks"""
+        max_time = 15
+        # ticks that do not divide a second, advanced late and unevenly
+        step = 0.45
+        wheel = TimerWheel(resolution=0.3, slots=16, clock=self.clock)
+        game = AsyncGame(
+            ReadJson().get_settings("settings.json"),
+            Assets(),
+            ["big"],
+            ["big small"],
+            reader=QueueReader(),
+            output=io.StringIO(),
+            wheel=wheel,
+        )
+        shown: list[tuple[float, int]] = []
+        ended: list[float] = []
+        game._timer_display = lambda value: shown.append(
+            (self.clock.now, value)
+        )
+        game._time_out = lambda: ended.append(self.clock.now)
+
+        self.clock.now = 0.05
+        start = self.clock.now
+        game.timer["time_counter"] = max_time
+        game._start_countdown()
+        while self.clock.now < start + max_time + 2:
+            self.clock.now += step
+            wheel.advance()
+
+        self.assertEqual(
+            [value for _, value in shown], list(range(max_time, 0, -1))
+        )
+        # each value is shown at most a tick and a step after it is due
+        for elapsed, (now, value) in enumerate(shown):
+            self.assertLess(now - start - elapsed, 0.3 + step + 1e-6)
+        self.assertEqual(len(ended), 1)
+        self.assertGreaterEqual(ended[0] - start, max_time)
+        self.assertLess(ended[0] - start - max_time, 0.3 + step + 1e-6)
+        self.assertEqual(len(wheel), 0)
+
+    def test_session_times_out_on_wheel(self) -> None:
+        """An `AsyncGame` countdown on the wheel takes a life per turn"""
+        settings = dict(
+            ReadJson().get_settings("settings.json"),
+            start_life="2",
+            max_time="1",
+        )
+
+        async def play() -> AsyncGame:
+            wheel = TimerWheel(resolution=0.05)
+            clock = asyncio.ensure_future(wheel.run())
+            game = AsyncGame(
+                settings,
+                Assets(),
+                ["big"],
+                ["big small"],
+                reader=QueueReader(),
+                output=io.StringIO(),
+                wheel=wheel,
+            )
+            task = asyncio.ensure_future(game.start_game("basic"))
+            await asyncio.sleep(2.3)
+            game.reader.feed("")
+            await asyncio.wait_for(task, 2)
+            clock.cancel()
+            self.assertEqual(len(wheel), 0)
+            return game
+
+        game = asyncio.run(play())
+        self.assertIn("Game Over!", game.output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Unit test for the multiprocess strategy tournament"""
+
+import unittest
+from src.read_json import ReadJson
+from src.tournament import load_strategy, run_tournament, STRATEGIES
+
+
+class TestTournament(unittest.TestCase):
+    """Test suite for `run_tournament`"""
+
+    def setUp(self) -> None:
+        self.word_list, self.phrase_list = ReadJson().get_data("data.json")
+
+    def test_results(self) -> None:
+        """Every entry is played once per strategy"""
+        results = run_tournament(
+            self.word_list, self.phrase_list, list(STRATEGIES), 7,
+            processes=1,
+        )
+        games = len(self.word_list) + len(self.phrase_list)
+        for result in results.values():
+            self.assertEqual(result["games"], games)
+            self.assertLessEqual(result["wins"], games)
+        self.assertEqual(results["solver"]["win_rate"], 1.0)
+        self.assertGreater(results["solver"]["win_rate"],
+                           results["random"]["win_rate"])
+
+    def test_processes_match_single(self) -> None:
+        """Sharding over worker processes gives the same totals"""
+        names = ["random", "src.tournament:frequency_strategy"]
+        single = run_tournament(
+            self.word_list, self.phrase_list, names, 5, processes=1
+        )
+        pooled = run_tournament(
+            self.word_list, self.phrase_list, names, 5, processes=2,
+            chunk_size=7,
+        )
+        self.assertEqual(single, pooled)
+
+    def test_unknown_strategy(self) -> None:
+        """Unknown names are rejected"""
+        with self.assertRaises(ValueError):
+            load_strategy("nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit test for reloading the corpus while games run"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.difficulty import DifficultyIndex
+from src.engine import LetterTracker
+from src.game import Data
+from src.read_json import ReadJson
+from src.watcher import CorpusWatcher
+
+
+class TestCorpusReload(unittest.TestCase):
+    """Test suite for `DifficultyIndex.extended`, `Data.reload` and
+    `CorpusWatcher`"""
+
+    def setUp(self) -> None:
+        self.words = [
+            "eat", "tea", "ate", "seat", "east", "tease",
+            "jazz", "fuzz", "quiz", "zephyr", "sphinx", "rhythm",
+        ]
+        self.phrases = ["the end", "zany quiz"]
+
+    def _assert_same(self, index, other) -> None:
+        for name in ("lengths", "distinct", "expected", "difficulty"):
+            self.assertEqual(getattr(index, name), getattr(other, name))
+        self.assertEqual(index.order, other.order)
+        self.assertEqual(index.buckets, other.buckets)
+        self.assertEqual(index.cuts, other.cuts)
+
+    def test_extended_matches_build(self) -> None:
+        """Extending gives the buckets a full build would"""
+        index = DifficultyIndex.build(self.words)
+        words = self.words + ["tea", "ate", "seat"]
+        extended = index.extended(words)
+        self._assert_same(extended, DifficultyIndex.build(words))
+        # only the added entries were scored
+        self.assertEqual(extended.rarity[:12], index.rarity)
+        self.assertNotEqual(
+            extended.rarity[:12], DifficultyIndex.build(words).rarity[:12]
+        )
+
+    def test_extended_with_new_letter_order(self) -> None:
+        """Entries changing the letter order rebuild the index"""
+        words = self.words + ["zzz" + str(idx) for idx in range(30)]
+        extended = DifficultyIndex.build(self.words).extended(words)
+        self._assert_same(extended, DifficultyIndex.build(words))
+        self.assertEqual(
+            extended.rarity, DifficultyIndex.build(words).rarity
+        )
+
+    def test_reload_swaps_lists(self) -> None:
+        """A reload swaps the lists, indexes and solver together"""
+        data = Data(self.words, self.phrases)
+        data.get_solver()
+        answer = data.get_random("basic")
+
+        self.assertTrue(data.reload(self.words + ["tee"], self.phrases))
+        self.assertEqual(len(data.get_indexes()["words"]), 13)
+        self.assertIn(
+            "tee", data.get_solver().candidates(["_"] * 3, LetterTracker())
+        )
+        self.assertIn(answer, data.word_list)
+
+        self.assertFalse(data.reload(["odd"], ["new phrase"]))
+        self.assertEqual(data.get_random("basic"), "odd")
+        self.assertEqual(data.get_random("intermediate"), "new phrase")
+
+    def test_watcher_reloads_changed_file(self) -> None:
+        """The watcher reloads the file once it changes and parses"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        source = os.path.join(directory.name, "data.json")
+        with open(source, "w") as file:
+            json.dump({"words": self.words, "phrases": self.phrases}, file)
+        data = Data(self.words, self.phrases, source)
+        watcher = CorpusWatcher(data, ReadJson(), source)
+        self.assertFalse(watcher.check())
+
+        with open(source, "w") as file:
+            file.write('{"words": ["half')
+        self.assertFalse(watcher.check())
+        self.assertIs(data.word_list, self.words)
+
+        with open(source, "w") as file:
+            json.dump(
+                {"words": self.words + ["added"], "phrases": self.phrases},
+                file,
+            )
+        os.utime(source, ns=(0, 1))
+        self.assertTrue(watcher.check())
+        self.assertEqual(data.word_list[-1], "added")
+        self.assertEqual(watcher.reloads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
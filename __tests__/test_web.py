@@ -0,0 +1,120 @@
+"""Unit test for the browser entry point, run with CPython"""
+
+import asyncio
+import glob
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+from src import build_web, web
+from benchmarks import bench_web
+from src.read_json import ReadJson
+
+
+class TestWeb(unittest.TestCase):
+    """Test suite for starting a game from an unpacked bundle"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.root = os.path.join(self.directory, "home")
+        manifest = build_web.build_bundle(
+            "src",
+            ReadJson().get_settings("settings.json"),
+            "data.json",
+            os.path.join(self.directory, "build"),
+        )
+        self.unpack(
+            os.path.join(self.directory, "build", manifest["bundle"])
+        )
+
+    def unpack(self, filename: str) -> None:
+        # sets every file's time to now, like unpacking in the browser
+        with zipfile.ZipFile(filename) as archive:
+            archive.extractall(self.root)
+
+    def play(self) -> str:
+        """Start a game, choose a level and return what was drawn"""
+        written: list[str] = []
+
+        async def play() -> None:
+            task, reader = web.start(written.append, (80, 24), self.root)
+            await asyncio.sleep(0)
+            self.assertIn("Press enter to continue.", "".join(written))
+            reader.feed("")
+            reader.feed("1")
+            for _ in range(500):
+                await asyncio.sleep(0.01)
+                if "*---*" in "".join(written):
+                    break
+            task.cancel()
+
+        asyncio.run(play())
+        return "".join(written)
+
+    def test_start_uses_cached_indexes(self) -> None:
+        """The bundled indexes are used, not built again"""
+        features = os.path.join(self.root, "data.bin.features")
+        stamp = os.stat(features).st_mtime_ns
+        self.assertIn("*---*", self.play())
+        self.assertEqual(os.stat(features).st_mtime_ns, stamp)
+
+    def test_warm_state(self) -> None:
+        """The warm state holds the bundle and unchecked bytecode"""
+        warm = os.path.join(self.directory, "warm.zip")
+        self.assertTrue(web.save_warm_state(warm, self.root))
+        with zipfile.ZipFile(warm) as archive:
+            names = archive.namelist()
+        self.assertIn("src/game.py", names)
+        self.assertIn("data.bin", names)
+        self.assertTrue(
+            any(re.match(r"src/__pycache__/game\..*\.pyc$", n) for n in names)
+        )
+
+        for name in glob.glob(os.path.join(self.root, "**"), recursive=True):
+            if os.path.isfile(name):
+                os.remove(name)
+        self.unpack(warm)
+        self.assertIn("*---*", self.play())
+        self.assertFalse(web.save_warm_state(warm, self.directory))
+
+    def test_page_lists_sources(self) -> None:
+        """The page fetches every module `web` imports"""
+        with open("static/index.html", encoding="utf-8") as file:
+            page = file.read()
+        listed = set(re.findall(r'"src/(\w+)\.py"', page))
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, web; print(' '.join(sys.modules))",
+            ],
+            cwd="src",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = {
+            module
+            for module in result.stdout.split()
+            if os.path.exists(os.path.join("src", module + ".py"))
+        }
+        self.assertLessEqual(imported, listed)
+        self.assertIn("web", listed)
+
+    def test_headless_load(self) -> None:
+        """The browser-free benchmark reaches each stage of a load"""
+        self.assertIn("src/web.py", bench_web.page_files())
+        bundle = glob.glob(os.path.join(self.directory, "build", "*.zip"))
+        times = bench_web.load_python(bundle[0])
+        stages = ("unpacked", "ready", "firstFrame", "firstInput")
+        for earlier, later in zip(stages, stages[1:] + ("firstBoard",)):
+            self.assertLessEqual(times[earlier], times[later])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Benchmark of loading a large corpus: `json.load` vs the mapped index.
+
+Writes a synthetic words/phrases file with `entries` entries, then loads it
+in a fresh interpreter per measurement and reports the load time, the peak
+resident memory, the private (anonymous) memory still in use, and the time
+of 10k random picks.
+
+Run from the repository root (POSIX only, peak memory uses `resource`):
+
+    python -m benchmarks.bench_corpus_load [entries]
+
+e.g. `python -m benchmarks.bench_corpus_load 10000000` for 10M entries.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+MEASURE = """
+import random, resource, sys, time
+sys.path.insert(0, "src")
+from read_json import ReadJson
+from corpus import load_json_corpus
+
+start = time.perf_counter()
+if sys.argv[1] == "json":
+    words, phrases = ReadJson().get_data(sys.argv[2])
+else:
+    words, phrases = load_json_corpus(sys.argv[2])
+loaded = time.perf_counter() - start
+
+rng = random.Random(0)
+start = time.perf_counter()
+for _ in range(10000):
+    rng.choice(words)
+    rng.choice(phrases)
+picked = time.perf_counter() - start
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+# mapped file pages count towards the peak but are shared, evictable page
+# cache. Private memory only counts what the process allocated itself
+private = peak
+if sys.platform == "linux":
+    with open("/proc/self/status", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                private = int(line.split()[1]) / 1024
+print(f"{loaded:.3f} {picked * 1000:.1f} {peak:.0f} {private:.0f}")
+"""
+
+
+def write_corpus(filename: str, entries: int) -> None:
+    """Write `entries` synthetic words and phrases, streamed to disk"""
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = entries * 4 // 5
+
+    def entry(length: int) -> str:
+        return "".join(rng.choices(letters, k=length))
+
+    with open(filename, "w", encoding="utf-8") as file:
+        file.write('{\n    "words": [\n')
+        for idx in range(words):
+            sep = ",\n" if idx < words - 1 else "\n"
+            file.write("        " + json.dumps(entry(rng.randint(4, 10)))
+                       + sep)
+        file.write('    ],\n    "phrases": [\n')
+        for idx in range(entries - words):
+            sep = ",\n" if idx < entries - words - 1 else "\n"
+            phrase = f"{entry(rng.randint(2, 8))} {entry(rng.randint(2, 8))}"
+            file.write("        " + json.dumps(phrase) + sep)
+        file.write("    ]\n}\n")
+
+
+def measure(mode: str, filename: str) -> tuple[str, ...]:
+    """Run one load in a fresh interpreter
+
+    Returns (load s, pick ms, peak MiB, private MiB) as strings.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE, mode, filename],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return tuple(result.stdout.split())
+
+
+def main() -> None:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "data.json")
+        write_corpus(filename, entries)
+        size = os.path.getsize(filename) / 1024 / 1024
+        print(f"entries: {entries}, file: {size:.0f} MiB")
+        print(f"{'loader':<22} {'load s':>8} {'10k picks ms':>13} "
+              f"{'peak MiB':>9} {'private MiB':>12}")
+        for name, mode in (
+            ("json.load", "json"),
+            ("index (first run)", "index"),
+            ("index (cached)", "index"),
+        ):
+            loaded, picked, peak, private = measure(mode, filename)
+            print(f"{name:<22} {loaded:>8} {picked:>13} {peak:>9} "
+                  f"{private:>12}")
+
+
+if __name__ == "__main__":
+    main()
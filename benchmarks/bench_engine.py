@@ -0,0 +1,64 @@
+"""Benchmark of headless games played with `GameEngine`.
+
+Every word and phrase of `data.json` is played to the end, once with a
+random guess order per game and once with a scripted order (letters from
+the most to the least common in English). No terminal, timer or input is
+involved, so this is the raw speed of the rules.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_engine [rounds]
+"""
+
+import random
+import string
+import sys
+import time
+from src.engine import GameEngine
+from src.read_json import ReadJson
+
+SCRIPTED = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+def play(engine: GameEngine, answer: str, guesses: str) -> bool:
+    """Plays one game of `answer`, returns `True` if it was won"""
+    engine.reset()
+    engine.new_round(answer)
+    for letter in guesses:
+        engine.guess(letter)
+        if engine.is_over():
+            break
+    return engine.state["won"]
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    settings = ReadJson().get_settings("settings.json")
+    word_list, phrase_list = ReadJson().get_data(settings["data_filename"])
+    answers = list(word_list) + list(phrase_list)
+    engine = GameEngine(int(settings["start_life"]))
+
+    rng = random.Random(0)
+    letters = list(string.ascii_lowercase)
+    orders = []
+    for _ in range(len(answers)):
+        rng.shuffle(letters)
+        orders.append("".join(letters))
+
+    for name, guesses_for in (
+        ("random", lambda idx: orders[idx]),
+        ("scripted", lambda idx: SCRIPTED),
+    ):
+        won = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for idx, answer in enumerate(answers):
+                won += play(engine, answer, guesses_for(idx))
+        elapsed = time.perf_counter() - start
+        games = rounds * len(answers)
+        print(f"{name:>8}: {games} games, {games / elapsed:,.0f} games/s, "
+              f"{won / games:.1%} won")
+
+
+if __name__ == "__main__":
+    main()
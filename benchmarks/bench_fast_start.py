@@ -0,0 +1,102 @@
+"""Benchmark of how soon `main.py` shows its first screens.
+
+Runs the game in a fresh interpreter on a synthetic corpus and times, from
+the start of the process, the notice screen, the menu (after pressing
+enter) and the first board (after choosing a level), which needs the
+corpus. Loading the corpus alone and interpreter start-up are reported
+for comparison. The first run builds the corpus caches and is left out.
+
+Run from the repository root (POSIX only):
+
+    python -m benchmarks.bench_fast_start [entries]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from src.corpus import load_corpus
+from src.read_json import ReadJson
+from benchmarks.bench_corpus_load import write_corpus
+
+MAIN = os.path.abspath(os.path.join("src", "main.py"))
+RUNS = 5
+NOTICE = b"Press enter to continue."
+MENU = b"3. Quit"
+# top of the gallows, drawn with the first board
+BOARD = b"*---*"
+
+
+def read_until(process: subprocess.Popen, marker: bytes, seen: bytearray):
+    """Read the game's output until `marker` shows up in it"""
+    while marker not in seen:
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:
+            raise RuntimeError(f"game exited before {marker!r}")
+        seen += chunk
+    del seen[:seen.index(marker) + len(marker)]
+
+
+def run_once(directory: str) -> tuple[float, float, float]:
+    """Returns seconds to the notice, the menu and the first board"""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN],
+        cwd=directory,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    seen = bytearray()
+    try:
+        read_until(process, NOTICE, seen)
+        notice = time.perf_counter() - start
+        process.stdin.write(b"\n")
+        process.stdin.flush()
+        read_until(process, MENU, seen)
+        menu = time.perf_counter() - start
+        process.stdin.write(b"2\n")
+        process.stdin.flush()
+        read_until(process, BOARD, seen)
+        board = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+    return notice, menu, board
+
+
+def main() -> None:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    settings = ReadJson().get_settings("settings.json")
+    settings.update(watch_corpus="false", metrics="false")
+    with tempfile.TemporaryDirectory() as directory:
+        with open(
+            os.path.join(directory, "settings.json"), "w", encoding="utf-8"
+        ) as file:
+            json.dump(settings, file)
+        filename = os.path.join(directory, settings["data_filename"])
+        write_corpus(filename, entries)
+
+        start = time.perf_counter()
+        load_corpus(ReadJson(), filename)
+        loaded = time.perf_counter() - start
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        interpreter = time.perf_counter() - start
+
+        run_once(directory)
+        runs = [run_once(directory) for _ in range(RUNS)]
+
+    print(f"entries: {entries}, best of {RUNS} runs")
+    print(f"{'interpreter start':20} {interpreter * 1000:8.1f} ms")
+    print(f"{'corpus load':20} {loaded * 1000:8.1f} ms")
+    for idx, name in enumerate(("notice", "menu", "first board")):
+        best = min(run[idx] for run in runs)
+        print(f"{name:20} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the frames pre-rendered in `Assets`.
+
+Many sessions sharing one `Assets`, like the server's, each draw a full
+board (a new session has nothing on screen yet) and an end screen. Reports
+frames per second with the pre-rendered frames kept and with them rebuilt
+every time (`MAX_SIZES = 0` keeps nothing).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_frames [sessions]
+"""
+
+import sys
+import time
+from src import assets
+from src.assets import Assets
+from src.game import Game
+from src.read_json import ReadJson
+from src.terminal import TerminalGeometry
+
+
+class NullOutput:
+    """Output taking text or bytes and dropping them"""
+
+    def write(self, text: str) -> None:
+        pass
+
+    def write_bytes(self, data: bytes) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+def frames_per_second(sessions: int, max_sizes: int) -> tuple[float, float]:
+    """Returns the (board, end screen) frames per second"""
+    saved = assets.MAX_SIZES
+    assets.MAX_SIZES = max_sizes
+    settings = ReadJson().get_settings("settings.json")
+    shared = Assets()
+    games = []
+    for idx in range(sessions):
+        game = Game(
+            settings,
+            shared,
+            ["hangman"],
+            ["the quick brown fox"],
+            output=NullOutput(),
+            geometry=TerminalGeometry((80, 24)),
+        )
+        game.timer["scheduler"].shutdown()
+        game.get_question("basic")
+        game.state["won"] = bool(idx % 2)
+        games.append(game)
+
+    try:
+        start = time.perf_counter()
+        for game in games:
+            game.renderer.previous = None
+            game._print_question()
+        board = sessions / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for game in games:
+            game._game_end_menu()
+        end = sessions / (time.perf_counter() - start)
+    finally:
+        assets.MAX_SIZES = saved
+    return board, end
+
+
+def main() -> None:
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    cached = frames_per_second(sessions, assets.MAX_SIZES)
+    rebuilt = frames_per_second(sessions, 0)
+    print(f"sessions: {sessions}")
+    print(f"{'':12} {'board/s':>10} {'end/s':>10}")
+    print(f"{'cached':12} {cached[0]:10.0f} {cached[1]:10.0f}")
+    print(f"{'rebuilt':12} {rebuilt[0]:10.0f} {rebuilt[1]:10.0f}")
+    print(f"{'speedup':12} {cached[0] / rebuilt[0]:9.2f}x "
+          f"{cached[1] / rebuilt[1]:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark of `Game._print_question` with and without the geometry cache.
+
+Renders the game board repeatedly, with a guess between frames so the
+frame changes, and reports frames per second with the terminal size cached
+and with it queried on every lookup.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_geometry [frames]
+"""
+
+import io
+import string
+import sys
+import time
+from src.game import Game
+from src.read_json import ReadJson
+from src.assets import Assets
+from src.terminal import TerminalGeometry
+
+
+def frames_per_second(frames: int, cache: bool) -> float:
+    """Returns the frames per second of `_print_question`"""
+    settings = ReadJson().get_settings("settings.json")
+    game = Game(
+        settings,
+        Assets(),
+        ["hangman"],
+        ["the quick brown fox jumps over the lazy dog"],
+        output=io.StringIO(),
+        geometry=TerminalGeometry(cache=cache),
+    )
+    game.get_question("intermediate")
+
+    start = time.perf_counter()
+    for idx in range(frames):
+        if idx % 26 == 0:
+            game.reset_game()
+            game.get_question("intermediate")
+        game.letter_in_question(string.ascii_lowercase[idx % 26])
+        game._print_question()
+        game.output.seek(0)
+        game.output.truncate()
+    return frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cached = frames_per_second(frames, cache=True)
+    uncached = frames_per_second(frames, cache=False)
+    print(f"frames: {frames}")
+    print(f"cache on:  {cached:10.0f} frames/s")
+    print(f"cache off: {uncached:10.0f} frames/s")
+    print(f"speedup:   {cached / uncached:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark of `Game.letter_in_question` on very long answers.
+
+Each answer is `length` characters where the guessed letters only appear a
+few times, so a guess reveals k positions out of n. The indexed lookup is
+compared with the full scan `letter_in_question` did before (kept below as
+`scan_guess`): the indexed cost per guess stays flat as n grows.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_guess
+"""
+
+import random
+import string
+import time
+from src.game import Game
+from src.read_json import ReadJson
+from src.assets import Assets
+
+GUESSES = "bcdefghijklmnopqrstuvwxyz"
+OCCURRENCES = 4
+
+
+def make_answer(length: int, rng: random.Random) -> str:
+    """Returns `length` "a"s with every other letter sprinkled in"""
+    answer = ["a"] * length
+    positions = rng.sample(range(length), len(GUESSES) * OCCURRENCES)
+    for idx, position in enumerate(positions):
+        answer[position] = GUESSES[idx % len(GUESSES)]
+    return "".join(answer)
+
+
+def scan_guess(state: dict, letter_input: str) -> None:
+    """Previous `letter_in_question` reveal logic: scans the whole answer"""
+    if letter_input not in state["answer"]:
+        state["life"] -= 1
+        return
+    if letter_input in state["hidden"]:
+        return
+    for idx, char in enumerate(state["answer"]):
+        if state["answer"][idx] == letter_input:
+            state["hidden"][idx] = char
+            state["correct_counter"] += 1
+        if state["correct_counter"] >= len(state["answer"]):
+            state["won"] = True
+
+
+def main() -> None:
+    rng = random.Random(0)
+    settings = ReadJson().get_settings("settings.json")
+    print(f"{'length':>8} {'index ms':>9} {'scan us/guess':>14} "
+          f"{'indexed us/guess':>17}")
+    for length in (1_000, 10_000, 100_000):
+        answer = make_answer(length, rng)
+        game = Game(settings, Assets(), [answer], [answer])
+
+        start = time.perf_counter()
+        game.get_question("basic")
+        index_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for letter in string.ascii_lowercase[1:]:
+            game.letter_in_question(letter)
+        indexed = (time.perf_counter() - start) / len(GUESSES) * 1e6
+
+        state = {
+            "answer": answer,
+            "hidden": ["_"] * length,
+            "life": 7,
+            "correct_counter": 0,
+            "won": False,
+        }
+        start = time.perf_counter()
+        for letter in GUESSES:
+            scan_guess(state, letter)
+        scan = (time.perf_counter() - start) / len(GUESSES) * 1e6
+
+        print(f"{length:>8} {index_ms:>9.2f} {scan:>14.1f} {indexed:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
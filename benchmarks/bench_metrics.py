@@ -0,0 +1,93 @@
+"""Benchmark of the cost of the guess-loop instrumentation.
+
+Plays guesses with redraws (`letter_in_question` then `_print_question`,
+what one turn of the game loop does) on a plain game and on an
+instrumented one, then times `Histogram.record` on its own. Prints the
+histograms of the instrumented run, like the `metrics_filename` dump.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_metrics [turns]
+"""
+
+import string
+import sys
+import time
+from src.assets import Assets
+from src.game import Game
+from src.metrics import Histogram, Metrics, instrument
+from src.read_json import ReadJson
+from src.terminal import TerminalGeometry
+
+
+class NullOutput:
+    """Output dropping everything written"""
+
+    def write(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+def turns_per_second(turns: int, metrics: Metrics | None) -> float:
+    """Returns guess-and-redraw turns per second"""
+    settings = ReadJson().get_settings("settings.json")
+    game = Game(
+        settings,
+        Assets(),
+        ["hangman"],
+        ["the quick brown fox jumps over the lazy dog"],
+        output=NullOutput(),
+        geometry=TerminalGeometry((80, 24)),
+    )
+    game.timer["scheduler"].shutdown()
+    letters = iter(string.ascii_lowercase * (turns // 26 + 1))
+    game._read_guess = lambda: next(letters)
+    if metrics is not None:
+        instrument(game, metrics)
+
+    start = time.perf_counter()
+    done = 0
+    while done < turns:
+        game.reset_game()
+        game.get_question("intermediate")
+        # enough lives to guess every letter
+        game.state["life"] = 26
+        for _ in range(26):
+            game.letter_in_question(game._read_guess())
+            game._print_question()
+        done += 26
+    return done / (time.perf_counter() - start)
+
+
+def record_ns(values: int) -> float:
+    """Returns nanoseconds per `Histogram.record`"""
+    histogram = Histogram()
+    start = time.perf_counter_ns()
+    for value in range(values):
+        histogram.record(value * 97)
+    return (time.perf_counter_ns() - start) / values
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    metrics = Metrics()
+    plain = turns_per_second(turns, None)
+    timed = turns_per_second(turns, metrics)
+    print(f"turns: {turns}")
+    print(f"{'plain':12} {plain:10.0f} turns/s")
+    print(f"{'instrumented':12} {timed:10.0f} turns/s")
+    print(f"{'overhead':12} {(1 / timed - 1 / plain) * 1e6:10.2f} us/turn")
+    print(f"{'record':12} {record_ns(1000000):10.0f} ns")
+    print()
+    print(f"{'':16} {'count':>8} {'p50':>8} {'p99':>8} {'max':>8} (us)")
+    for name, summary in metrics.to_dict().items():
+        print(
+            f"{name:16} {summary['count']:8} {summary['p50_us']:8.1f}"
+            f" {summary['p99_us']:8.1f} {summary['max_us']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of reloading a changed corpus while questions are picked.
+
+Builds a synthetic corpus of `words` entries, then reloads it with 1% more
+entries appended (indexes extended) and with every entry changed (indexes
+rebuilt). Each reload runs on a background thread while the main thread
+keeps picking questions, and the slowest pick is reported: that is how
+long a player could wait on a reload.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_reload [words]
+"""
+
+import random
+import sys
+import threading
+import time
+from src.game import Data
+from src.simulate import SCRIPTED
+
+
+def corpus(count: int, seed: int) -> list[str]:
+    """Returns `count` random words, letters about as common as in English"""
+    rng = random.Random(seed)
+    letters = SCRIPTED
+    # Zipf-like, so the letter ranking is stable like a real word list's
+    weights = [1 / (rank + 1) for rank in range(len(letters))]
+    return [
+        "".join(rng.choices(letters, weights, k=rng.randint(3, 12)))
+        for _ in range(count)
+    ]
+
+
+def reload_while_picking(data: Data, words: list[str]) -> tuple[float, float]:
+    """Returns (reload seconds, slowest pick in seconds)"""
+    done = threading.Event()
+    took = []
+
+    def reload() -> None:
+        start = time.perf_counter()
+        data.reload(words, data.phrase_list)
+        took.append(time.perf_counter() - start)
+        done.set()
+
+    thread = threading.Thread(target=reload)
+    slowest = 0.0
+    thread.start()
+    while not done.is_set():
+        start = time.perf_counter()
+        data.pick("basic")
+        slowest = max(slowest, time.perf_counter() - start)
+    thread.join()
+    return took[0], slowest
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    words = corpus(count, 0)
+    phrases = ["the quick brown fox"]
+    # switching threads more often than the default 5 ms, like a busy loop
+    sys.setswitchinterval(0.001)
+
+    data = Data(words, phrases)
+    data.get_indexes()
+    appended = words + corpus(count // 100, 1)
+    append_time, append_stall = reload_while_picking(data, appended)
+
+    data = Data(words, phrases)
+    data.get_indexes()
+    rebuild_time, rebuild_stall = reload_while_picking(
+        data, corpus(count, 2)
+    )
+
+    print(f"words: {count}")
+    print(f"{'':10} {'reload s':>9} {'slowest pick ms':>16}")
+    print(f"{'append':10} {append_time:9.2f} {append_stall * 1e3:16.2f}")
+    print(f"{'rebuild':10} {rebuild_time:9.2f} {rebuild_stall * 1e3:16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of terminal output per turn.
+
+Plays scripted games through `Game.start_game` with a counting output sink,
+and reports the bytes written, write calls (one syscall each on an
+unbuffered terminal) and subprocesses spawned per turn.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render [games] [--full]
+
+`--full` disables frame diffing, so every frame is repainted in full.
+"""
+
+import builtins
+import contextlib
+import os
+import random
+import string
+import sys
+from unittest.mock import patch
+from src.game import Game
+from src.read_json import ReadJson
+from src.assets import Assets
+
+
+class CountingSink:
+    """Terminal stand-in that counts writes and bytes"""
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        self.bytes_written += len(text.encode("utf-8"))
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() \
+        else 200
+    settings = ReadJson().get_settings("settings.json")
+    word_list, phrase_list = ReadJson().get_data(settings["data_filename"])
+    # long enough that no timer fires while playing
+    settings = dict(settings, max_time="3600")
+
+    rng = random.Random(0)
+    sink = CountingSink()
+    turns = 0
+    spawns = 0
+
+    def fake_input(_prompt: str = "") -> str:
+        nonlocal turns
+        turns += 1
+        return rng.choice(string.ascii_lowercase)
+
+    def fake_system(_command: str) -> int:
+        nonlocal spawns
+        spawns += 1
+        return 0
+
+    with (
+        contextlib.redirect_stdout(sink),
+        patch.object(builtins, "input", fake_input),
+        patch.object(os, "system", fake_system),
+        patch("shutil.get_terminal_size", return_value=os.terminal_size(
+            (100, 30))),
+    ):
+        game = Game(settings, Assets(), word_list, phrase_list)
+        if "--full" in sys.argv and hasattr(game, "renderer"):
+            game.renderer.diff = False
+        for idx in range(games):
+            game.start_game("basic" if idx % 2 else "intermediate")
+        game.timer["scheduler"].shutdown()
+
+    print(f"games: {games}, turns: {turns}")
+    print(f"bytes/turn:   {sink.bytes_written / turns:10.1f}")
+    print(f"writes/turn:  {sink.writes / turns:10.1f}")
+    print(f"spawns/turn:  {spawns / turns:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
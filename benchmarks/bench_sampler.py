@@ -0,0 +1,72 @@
+"""Benchmark of the no-repeat `PermutationSampler` on a 10M entry corpus.
+
+The sampler is compared with shuffling a list of all indexes, the usual way
+to get a no-repeat order: time to set up, time per draw and the memory each
+one holds. Drawn indexes are checked for repeats with a bitmap. Also shows
+how many answers `random.choice` repeats over the same number of draws.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sampler [draws]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from src.sampler import PermutationSampler
+
+SIZE = 10_000_000
+
+
+def main() -> None:
+    draws = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    sampler = PermutationSampler(SIZE, seed=0)
+    setup_ms = (time.perf_counter() - start) * 1000
+    sampler.draw()
+    _, sampler_peak = tracemalloc.get_traced_memory()
+    # tracing every allocation would dominate the timings
+    tracemalloc.stop()
+    sampler = PermutationSampler(SIZE, seed=0)
+
+    seen = bytearray(SIZE)
+    repeats = 0
+    start = time.perf_counter()
+    for _ in range(draws):
+        idx = sampler.draw()
+        repeats += seen[idx]
+        seen[idx] = 1
+    draw_us = (time.perf_counter() - start) / draws * 1e6
+    print(f"sampler: setup {setup_ms:.2f} ms, {draw_us:.2f} us/draw, "
+          f"{sampler_peak / 1024:.1f} KiB, {repeats} repeats "
+          f"in {draws} draws")
+
+    start = time.perf_counter()
+    order = list(range(SIZE))
+    random.Random(0).shuffle(order)
+    setup_ms = (time.perf_counter() - start) * 1000
+    # the list of indexes and the int objects it holds
+    shuffle_size = sys.getsizeof(order) + SIZE * sys.getsizeof(SIZE)
+    start = time.perf_counter()
+    for position in range(draws):
+        _ = order[position]
+    draw_us = (time.perf_counter() - start) / draws * 1e6
+    del order
+    print(f"shuffle: setup {setup_ms:.2f} ms, {draw_us:.2f} us/draw, "
+          f"{shuffle_size / 1024:.1f} KiB")
+
+    rng = random.Random(0)
+    seen = bytearray(SIZE)
+    repeats = 0
+    for _ in range(draws):
+        idx = rng.randrange(SIZE)
+        repeats += seen[idx]
+        seen[idx] = 1
+    print(f"random.choice: {repeats} repeats in {draws} draws")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Load test of the TCP server: guess latency at 1k, 5k and 10k sessions.
+
+Starts `src/server.py` in a subprocess on a free local port, then opens
+`sessions` connections at once from this process. Every session gets past
+the notice and the menu, waits until all sessions are in a game, then
+sends guesses one at a time. The latency of a guess is the time from
+sending the letter to receiving the redrawn question frame (which ends by
+moving the cursor to the prompt). Reports p50 and p99 per session count.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_server [sessions ...]
+"""
+
+import asyncio
+import re
+import socket
+import subprocess
+import sys
+import time
+
+GUESSES = "etaoi"
+# a frame with a prompt ends by moving the cursor there and clearing the
+# line. The timer line does the same, but after saving the cursor
+_PROMPT = re.compile(rb"(?<!\x1b\[s)\x1b\[\d+;\d+H\x1b\[K")
+CONNECTS = 200
+
+
+def free_port() -> int:
+    """Returns a local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_prompt(reader: asyncio.StreamReader) -> bytes:
+    """Read until the server has drawn a frame with a prompt"""
+    buffer = b""
+    while True:
+        chunk = await reader.read(65536)
+        if not chunk:
+            raise ConnectionError("server closed the connection")
+        buffer += chunk
+        if _PROMPT.search(buffer):
+            return buffer
+
+
+async def session(
+    port: int,
+    connects: asyncio.Semaphore,
+    ready: list[int],
+    go: asyncio.Event,
+    total: int,
+    latencies: list[float],
+) -> None:
+    """One player: reach a game, then time each guess"""
+    async with connects:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await wait_prompt(reader)
+        writer.write(b"\r\n")
+        await wait_prompt(reader)
+        writer.write(b"1\r\n")
+        await wait_prompt(reader)
+
+    ready[0] += 1
+    if ready[0] == total:
+        go.set()
+    await go.wait()
+
+    for letter in GUESSES:
+        start = time.perf_counter()
+        writer.write(letter.encode() + b"\r\n")
+        frame = await wait_prompt(reader)
+        latencies.append(time.perf_counter() - start)
+        if b"Press 'enter'" in frame:
+            break
+    writer.close()
+
+
+async def load(port: int, sessions: int) -> list[float]:
+    """Run `sessions` players at once, returns every guess latency"""
+    latencies: list[float] = []
+    go = asyncio.Event()
+    connects = asyncio.Semaphore(CONNECTS)
+    ready = [0]
+    await asyncio.gather(
+        *(
+            session(port, connects, ready, go, sessions, latencies)
+            for _ in range(sessions)
+        )
+    )
+    return latencies
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [1_000, 5_000, 10_000]
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.server", str(port)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        server.stdout.readline()
+        print(f"{'sessions':>9} {'guesses':>8} {'p50 ms':>8} "
+              f"{'p99 ms':>8} {'wall s':>7}")
+        for sessions in counts:
+            start = time.perf_counter()
+            latencies = sorted(asyncio.run(load(port, sessions)))
+            wall = time.perf_counter() - start
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[len(latencies) * 99 // 100] * 1000
+            print(f"{sessions:>9} {len(latencies):>8} {p50:>8.2f} "
+                  f"{p99:>8.2f} {wall:>7.1f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
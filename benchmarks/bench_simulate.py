@@ -0,0 +1,52 @@
+"""Benchmark of the bit-sliced batch simulator against one game at a time.
+
+A synthetic corpus of random words is played against random guess orders,
+once with `simulate_counts` (all games at once) and once with
+`play_counts` (a `GameEngine` per game) on a slice small enough to finish
+quickly. Both are reported in games per second.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_simulate [words] [trials]
+"""
+
+import random
+import string
+import sys
+import time
+from src.simulate import play_counts, random_orders, simulate_counts
+
+START_LIFE = 7
+
+
+def main() -> None:
+    words = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    trials = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    rng = random.Random(0)
+    answers = [
+        "".join(
+            rng.choice(string.ascii_lowercase)
+            for _ in range(rng.randint(4, 12))
+        )
+        for _ in range(words)
+    ]
+    orders = random_orders(trials, seed=0)
+
+    start = time.perf_counter()
+    wins, _ = simulate_counts(answers, orders, START_LIFE)
+    elapsed = time.perf_counter() - start
+    games = words * trials
+    print(f"   batch: {games} games in {elapsed:.2f} s, "
+          f"{games / elapsed:,.0f} games/s, {sum(wins) / games:.1%} won")
+
+    sample = answers[:max(1, words // 50)]
+    start = time.perf_counter()
+    play_counts(sample, orders, START_LIFE)
+    elapsed = time.perf_counter() - start
+    games = len(sample) * trials
+    print(f"  engine: {games} games in {elapsed:.2f} s, "
+          f"{games / elapsed:,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
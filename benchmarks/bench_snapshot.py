@@ -0,0 +1,55 @@
+"""Benchmark of saving game snapshots.
+
+Times one game saving its snapshot on every guess (`SnapshotFile.write`),
+and `sessions` sessions saving theirs with one write each versus putting
+them all and writing them with a single `flush`.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_snapshot [sessions]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from src.snapshot import SnapshotFile, pack
+
+
+def main() -> None:
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    records = [
+        pack(1, idx, "the quick brown fox", idx & 0x3FFFFFF, 5, 12, 26)
+        for idx in range(sessions)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        snapshots = SnapshotFile(os.path.join(directory, "game.snapshot"))
+
+        saves = 10000
+        start = time.perf_counter()
+        for idx in range(saves):
+            snapshots.write(0, records[idx % sessions])
+        single = (time.perf_counter() - start) / saves
+
+        start = time.perf_counter()
+        for slot, record in enumerate(records):
+            snapshots.write(slot, record)
+        each = time.perf_counter() - start
+
+        rounds = 100
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for slot, record in enumerate(records):
+                snapshots.put(slot, record)
+            snapshots.flush()
+        bulk = (time.perf_counter() - start) / rounds
+        snapshots.close()
+
+    print(f"snapshot size:        {len(records[0]):8d} bytes")
+    print(f"save per guess:       {single * 1e6:8.2f} us")
+    print(f"{sessions} sessions, a write each: {each * 1e3:8.2f} ms")
+    print(f"{sessions} sessions, one flush:    {bulk * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark of `Solver.next_guess` time per step against corpus size.
+
+Synthetic dictionaries of random words (letters weighted by English
+frequency, 4 to 12 letters) are indexed, then games against random
+entries are played with the solver until they end. Reports the index
+build time and the mean and 99th percentile time of one `next_guess`
+step.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_solver [max_size]
+"""
+
+import random
+import sys
+import time
+from src.engine import GameEngine
+from src.solver import Solver
+
+# English letter frequencies, per mille
+FREQUENCIES = {
+    "e": 127, "t": 91, "a": 82, "o": 75, "i": 70, "n": 67, "s": 63,
+    "h": 61, "r": 60, "d": 43, "l": 40, "c": 28, "u": 28, "m": 24,
+    "w": 24, "f": 22, "g": 20, "y": 20, "p": 19, "b": 15, "v": 10,
+    "k": 8, "j": 2, "x": 2, "q": 1, "z": 1,
+}
+GAMES = 200
+
+
+def make_words(size: int, rng: random.Random) -> list[str]:
+    """Returns `size` random words"""
+    letters = list(FREQUENCIES)
+    weights = list(FREQUENCIES.values())
+    return [
+        "".join(rng.choices(letters, weights, k=rng.randint(4, 12)))
+        for _ in range(size)
+    ]
+
+
+def main() -> None:
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    print(f"{'entries':>9} {'build s':>8} {'mean us/step':>13} "
+          f"{'p99 us/step':>12} {'won':>6}")
+    size = 10_000
+    while size <= max_size:
+        words = make_words(size, rng)
+        start = time.perf_counter()
+        solver = Solver(words)
+        build = time.perf_counter() - start
+
+        engine = GameEngine(7)
+        steps = []
+        won = 0
+        for answer in rng.sample(words, GAMES):
+            engine.reset()
+            engine.new_round(answer)
+            while not engine.is_over():
+                start = time.perf_counter()
+                guess = solver.next_guess(
+                    engine.state["hidden"], engine.tracker
+                )
+                steps.append(time.perf_counter() - start)
+                engine.guess(guess)
+            won += engine.state["won"]
+
+        steps.sort()
+        p99 = steps[len(steps) * 99 // 100]
+        print(f"{size:>9} {build:>8.2f} "
+              f"{sum(steps) / len(steps) * 1e6:>13.1f} "
+              f"{p99 * 1e6:>12.1f} {won / GAMES:>6.1%}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark of corpus startup time: JSON vs the compiled binary format.
+
+Writes a synthetic corpus, compiles it, then times loading it plus one
+random pick in a fresh interpreter: with `json.load`, through the JSON
+offset index (once it is built), and as a compiled binary corpus.
+Interpreter start-up is measured separately and left out.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [entries]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from src.corpus import compile_corpus
+from src.read_json import ReadJson
+from benchmarks.bench_corpus_load import write_corpus
+
+LOAD = """
+import random, sys
+sys.path.insert(0, "src")
+from read_json import ReadJson
+from corpus import load_binary_corpus, load_json_corpus
+if sys.argv[1] == "json":
+    words, phrases = ReadJson().get_data(sys.argv[2])
+elif sys.argv[1] == "index":
+    words, phrases = load_json_corpus(sys.argv[2])
+else:
+    words, phrases = load_binary_corpus(sys.argv[2])
+random.choice(words)
+"""
+EMPTY = """
+import random, sys
+sys.path.insert(0, "src")
+from read_json import ReadJson
+from corpus import load_binary_corpus, load_json_corpus
+"""
+RUNS = 5
+
+
+def best_of(code: str, *args: str) -> float:
+    """Returns the fastest of `RUNS` runs of `code` in a fresh interpreter"""
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, *args], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "data.json")
+        target = os.path.join(directory, "data.bin")
+        write_corpus(source, entries)
+        compile_corpus(ReadJson(), source, target)
+        # build the offset index outside of the measured runs
+        subprocess.run(
+            [sys.executable, "-c", LOAD, "index", source], check=True
+        )
+
+        baseline = best_of(EMPTY)
+        print(f"entries: {entries}")
+        for name, mode, filename in (
+            ("json.load", "json", source),
+            ("json index", "index", source),
+            ("binary", "binary", target),
+        ):
+            size = os.path.getsize(filename) / 1024 / 1024
+            elapsed = (best_of(LOAD, mode, filename) - baseline) * 1000
+            print(f"{name:<12} {size:8.1f} MiB {elapsed:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of the stats store with a large game log.
+
+Records `games` games spread over `players` players through the batched
+writer, then times the queries shown around the end screen: the player's
+rank, the leaderboard and the streaks. Also reports how long `record`
+blocks the caller, which is what the input loop waits for.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stats [games] [players]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from src.stats import StatsStore
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    players = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        stats = StatsStore(os.path.join(directory, "stats.db"))
+
+        blocked = 0.0
+        start = time.perf_counter()
+        for idx in range(games):
+            player = f"player{rng.randrange(players)}"
+            level = "basic" if idx % 3 else "intermediate"
+            won = rng.random() < 0.6
+            before = time.perf_counter()
+            stats.record(player, level, "hangman", won, 9, 3, 30.0)
+            blocked += time.perf_counter() - before
+        queued = time.perf_counter() - start
+        stats.flush()
+        written = time.perf_counter() - start
+
+        queries = 1000
+        start = time.perf_counter()
+        for idx in range(queries):
+            stats.rank(f"player{idx % players}", "basic")
+        rank = (time.perf_counter() - start) / queries
+        start = time.perf_counter()
+        for _ in range(queries):
+            stats.leaderboard("basic")
+            stats.streaks("basic")
+        board = (time.perf_counter() - start) / queries
+        size = os.path.getsize(os.path.join(directory, "stats.db"))
+        stats.close()
+
+    print(f"games: {games}, players: {players}, batches: {stats.batches}")
+    print(f"record:       {blocked / games * 1e6:8.2f} us blocked per game")
+    print(f"queued in:    {queued:8.2f} s")
+    print(f"written in:   {written:8.2f} s ({games / written:.0f} games/s)")
+    print(f"rank:         {rank * 1e3:8.3f} ms")
+    print(f"leaderboard:  {board * 1e3:8.3f} ms (with streaks)")
+    print(f"database:     {size / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
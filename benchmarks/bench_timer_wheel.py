@@ -0,0 +1,121 @@
+"""Benchmark of 100k concurrent countdowns on one `TimerWheel`.
+
+Every timer behaves like a session countdown: it fires once a second and
+re-arms itself for the next second, and a tenth of them are reset each
+second as if a guess restarted the turn. The wheel runs on a fake clock
+so only its own CPU time is measured. Memory is measured with tracemalloc
+and compared with one asyncio countdown task per session, which is what
+the server used before.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_timer_wheel [timers]
+"""
+
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from src.timer_wheel import TimerWheel
+
+SECONDS = 15
+RESOLUTION = 0.1
+
+
+class FakeClock:
+    """Clock moved by hand"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wheel_memory(count: int) -> int:
+    """Bytes allocated to arm `count` timers"""
+    tracemalloc.start()
+    wheel = TimerWheel(RESOLUTION, clock=FakeClock())
+    before, _ = tracemalloc.get_traced_memory()
+    timers = [wheel.arm(1 + idx % 10 / 10, print) for idx in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del timers
+    return after - before
+
+
+def tasks_memory(count: int) -> int:
+    """Bytes allocated by `count` sleeping asyncio tasks"""
+
+    async def countdown() -> None:
+        while True:
+            await asyncio.sleep(1)
+
+    async def measure() -> int:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        tasks = [asyncio.ensure_future(countdown()) for _ in range(count)]
+        await asyncio.sleep(0)
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return after - before
+
+    return asyncio.run(measure())
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+
+    wheel_bytes = wheel_memory(count)
+    task_bytes = tasks_memory(count)
+    print(f"memory: wheel {wheel_bytes / count:.0f} B/timer, "
+          f"asyncio tasks {task_bytes / count:.0f} B/task")
+
+    clock = FakeClock()
+    wheel = TimerWheel(RESOLUTION, clock=clock)
+    fired = [0]
+    timers = []
+
+    def countdown(idx: int) -> None:
+        fired[0] += 1
+        timers[idx].reset(1)
+
+    for idx in range(count):
+        # spread the sessions over the second, like real arrivals
+        timers.append(wheel.arm(rng.uniform(0, 1), countdown, idx))
+
+    ticks = int(SECONDS / RESOLUTION)
+    tick_times = []
+    resets = 0
+    reset_time = 0.0
+    for tick in range(ticks):
+        clock.now += RESOLUTION
+        start = time.perf_counter()
+        wheel.advance()
+        tick_times.append(time.perf_counter() - start)
+        if tick % 10 == 0:
+            # a tenth of the players guess, restarting their turn
+            guessing = rng.sample(range(count), count // 10)
+            start = time.perf_counter()
+            for idx in guessing:
+                timers[idx].reset(1)
+            reset_time += time.perf_counter() - start
+            resets += len(guessing)
+
+    tick_times.sort()
+    mean = sum(tick_times) / ticks
+    print(f"{count} timers, {ticks} ticks of {RESOLUTION} s: "
+          f"{fired[0]} fired, {resets} resets")
+    print(f"cpu per tick: mean {mean * 1000:.2f} ms, "
+          f"p99 {tick_times[ticks * 99 // 100] * 1000:.2f} ms, "
+          f"{mean * 1e9 / count:.0f} ns per armed timer")
+    print(f"reset: {reset_time / resets * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Headless benchmark of the browser demo's time to first frame.
+
+Builds the web bundle, serves the repository from a local static server
+and opens `static/index.html` in headless Chromium. For each way of loading
+the game it reports, in ms since the page started loading, when Pyodide
+was up, when the notice (the first frame) was drawn, and how long the first
+board took from leaving the notice (menu, level, reading the corpus):
+
+    - sources: the modules and `data.json` fetched one by one, the corpus
+      parsed in the browser (`?mode=sources`, what the page did before)
+    - bundle: one zip with the compiled, indexed corpus, fetched while
+      Pyodide starts. The first load is cold, later ones unpack the warm
+      state cached by the first
+
+Each way gets its own browser profile: its first load is cold (nothing
+cached), the others warm (HTTP cache, and the warm state for the bundle).
+
+Needs Playwright, which the game itself does not:
+
+    pip install playwright && playwright install chromium
+
+Pyodide is loaded from its CDN unless `--pyodide` gives the URL of a copy,
+e.g. one extracted under the repository and served with it. Run from the
+repository root:
+
+    python -m benchmarks.bench_web [loads] [--pyodide URL]
+
+With `--python` no browser is needed: each load runs in a fresh CPython
+process what the page does once Pyodide is up (copying the sources or
+unpacking the zip, importing `web`, `web.start` up to the notice, then the
+first board). Stage times are in ms from when the standard library modules
+it uses, which Pyodide loads as it starts, are imported. It leaves out
+fetching the files and starting Pyodide, and CPython runs the game several
+times faster than Pyodide, so it compares the ways of loading but does not
+replace the browser numbers:
+
+    python -m benchmarks.bench_web --python [loads]
+"""
+
+import functools
+import http.server
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import zipfile
+from urllib.parse import quote
+from src import build_web, web
+from src.read_json import ReadJson
+
+# ms to wait for each stage, Pyodide is large on a cold load
+TIMEOUT = 120000
+PAGE = os.path.join("static", "index.html")
+# one load as the page runs it, see `measure_python`
+LOAD_CODE = """
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+import zipfile
+
+# from where the page is once Pyodide, with these modules, is up
+start = time.perf_counter()
+source, root = sys.argv[1:3]
+times = {}
+
+
+def mark(name):
+    times.setdefault(name, (time.perf_counter() - start) * 1000)
+
+
+if source.endswith(".zip"):
+    with zipfile.ZipFile(source) as archive:
+        archive.extractall(root)
+else:
+    for name in sys.argv[3:]:
+        os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+        shutil.copyfile(os.path.join(source, name), os.path.join(root, name))
+mark("unpacked")
+os.chdir(root)
+sys.path.insert(0, os.path.join(root, "src"))
+import web
+
+
+def write(text):
+    if "Press enter to continue." in text:
+        mark("firstFrame")
+    if "*---*" in text:
+        mark("firstBoard")
+
+
+async def play():
+    task, reader = web.start(write, (100, 30))
+    mark("ready")
+    await asyncio.sleep(0)
+    mark("firstInput")
+    reader.feed("")
+    reader.feed("2")
+    while "firstBoard" not in times:
+        await asyncio.sleep(0.001)
+    task.cancel()
+
+
+asyncio.run(play())
+print(json.dumps(times))
+"""
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request"""
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def serve(directory: str) -> http.server.ThreadingHTTPServer:
+    """Serve `directory` on a free local port from a background thread"""
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def load_page(page, url: str) -> dict[str, float]:
+    """Open the game, choose a level, returns the page's stage times"""
+    page.goto(url)
+    page.wait_for_function(
+        "window.hangmanTimes && window.hangmanTimes.ready", timeout=TIMEOUT
+    )
+    page.click("#term")
+    page.keyboard.press("Enter")
+    page.keyboard.type("2")
+    page.keyboard.press("Enter")
+    page.wait_for_function(
+        "window.hangmanTimes.firstBoard", timeout=TIMEOUT
+    )
+    return page.evaluate("window.hangmanTimes")
+
+
+def measure(playwright, url: str, loads: int) -> list[dict[str, float]]:
+    """Returns the stage times of `loads` loads in one fresh profile"""
+    with tempfile.TemporaryDirectory() as profile:
+        context = playwright.chromium.launch_persistent_context(
+            profile, headless=True
+        )
+        try:
+            page = context.new_page()
+            return [load_page(page, url) for _ in range(loads)]
+        finally:
+            context.close()
+
+
+def page_files(page: str = PAGE) -> list[str]:
+    """Returns the files `page` fetches one by one without a bundle"""
+    with open(page, encoding="utf-8") as file:
+        listing = re.search(
+            r"const files = \[(.*?)\];", file.read(), re.DOTALL
+        )
+    return re.findall(r'"([^"]+)"', listing.group(1))
+
+
+def load_python(source: str, files: list[str] = ()) -> dict[str, float]:
+    """Run one load from `source`, a zip or the repository, in CPython
+
+    Returns:
+        - dict[str, float]
+            ms to each stage, as the page names them, and to `unpacked`
+            once the files are in place
+    """
+    # bytecode is only found where the warm state brought it
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    with tempfile.TemporaryDirectory() as root:
+        result = subprocess.run(
+            [sys.executable, "-c", LOAD_CODE, source, root, *files],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return json.loads(result.stdout)
+
+
+def measure_python(loads: int) -> dict[str, list[dict[str, float]]]:
+    """Returns the stage times of `loads` loads of each way in CPython
+
+    `sources` copies the files the page fetches without a bundle, `bundle`
+    unpacks the zip as a first visit does and `warm` the warm state saved
+    from it, as later visits do.
+    """
+    settings = ReadJson().get_settings("settings.json")
+    files = page_files()
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = build_web.build_bundle(
+            "src", settings, settings["data_filename"], directory
+        )
+        bundle = os.path.join(directory, manifest["bundle"])
+        warm = os.path.join(directory, "warm.zip")
+        root = os.path.join(directory, "home")
+        with zipfile.ZipFile(bundle) as archive:
+            archive.extractall(root)
+        web.save_warm_state(warm, root)
+        return {
+            way: [load_python(source, way_files) for _ in range(loads)]
+            for way, source, way_files in (
+                ("sources", os.getcwd(), files),
+                ("bundle", bundle, ()),
+                ("warm", warm, ()),
+            )
+        }
+
+
+def main_python(loads: int) -> None:
+    """Print the best of `loads` CPython loads of each way"""
+    print(f"CPython {sys.version.split()[0]}, best of {loads} loads")
+    print(f"{'':8} {'unpacked':>9} {'1st frame':>10} {'board':>8} (ms)")
+    for way, runs in measure_python(loads).items():
+        best = min(runs, key=lambda run: run["firstFrame"])
+        print(
+            f"{way:8} {best['unpacked']:9.1f} {best['firstFrame']:10.1f}"
+            f" {best['firstBoard'] - best['firstInput']:8.1f}"
+        )
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if "--python" in args:
+        args.remove("--python")
+        main_python(int(args[0]) if args else 5)
+        return
+
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("Needs Playwright: pip install playwright && "
+              "playwright install chromium")
+        print("or, without a browser: python -m benchmarks.bench_web "
+              "--python")
+        sys.exit(1)
+
+    query = ""
+    if "--pyodide" in args:
+        idx = args.index("--pyodide")
+        query = "&pyodide=" + quote(args[idx + 1], safe="")
+        del args[idx:idx + 2]
+    loads = int(args[0]) if args else 5
+
+    settings = ReadJson().get_settings("settings.json")
+    manifest = build_web.build_bundle(
+        "src",
+        settings,
+        settings["data_filename"],
+        os.path.join("static", "build"),
+    )
+    print(f"bundle: {manifest['bundle']}, {loads} loads per way")
+
+    server = serve(os.getcwd())
+    base = f"http://127.0.0.1:{server.server_address[1]}/static/index.html"
+    print(f"{'':16} {'pyodide':>9} {'1st frame':>10} {'board':>8} (ms)")
+    try:
+        with sync_playwright() as playwright:
+            for mode in ("sources", "bundle"):
+                runs = measure(
+                    playwright, f"{base}?mode={mode}{query}", loads
+                )
+                for label, times in (
+                    ("cold", runs[:1]),
+                    ("warm, best", runs[1:]),
+                ):
+                    if not times:
+                        continue
+                    best = min(times, key=lambda run: run["firstFrame"])
+                    print(
+                        f"{mode + ' ' + label:16} {best['pyodide']:9.0f}"
+                        f" {best['firstFrame']:10.0f}"
+                        f" {best['firstBoard'] - best['firstInput']:8.0f}"
+                    )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
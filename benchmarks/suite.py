@@ -0,0 +1,339 @@
+"""Reproducible benchmark suite with a regression check.
+
+Times the hot paths of the game on synthetic corpora written with fixed
+seeds: loading (`ReadJson.get_data`, `load_corpus`), selecting (building the
+difficulty indexes, `Data.get_random_word`/`get_random_phrase`,
+`Data.pick`), guessing (`Game.letter_in_question`,
+`LetterTracker.reset_is_typed`) and rendering (`_print_question` into a
+fake terminal, full and diffed frames). Every metric is a time, lower is
+better, and is the best of `--repeat` runs; the median is kept too.
+
+Run from the repository root:
+
+    python -m benchmarks.suite [--sizes 1k,100k] [--repeat 5]
+        [--output results.json] [--baseline baseline.json]
+        [--threshold 0.15] [--only load,select,guess,render]
+
+`--sizes` takes counts of corpus entries, with `k`/`m` suffixes, from 1k
+to 10m. `--output` writes the results as JSON; a results file can be used
+as the `--baseline` of a later run, which exits with status 1 if any
+metric is more than `--threshold` (a fraction) slower than its baseline.
+Compare results from the same machine and Python only.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from src.assets import Assets
+from src.corpus import load_corpus
+from src.engine import LetterTracker
+from src.game import Data, Game
+from src.read_json import ReadJson
+from src.terminal import TerminalGeometry
+from benchmarks.bench_corpus_load import write_corpus
+from benchmarks.bench_render import CountingSink
+
+SEED = 0
+DEFAULT_SIZES = "1k,100k"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.15
+GROUPS = ("load", "select", "guess", "render")
+# calls timed together in one run of the fast operations
+PICKS = 10000
+GUESS_ROUNDS = 500
+RESETS = 100000
+FRAMES = 500
+SCREEN_SIZE = (80, 24)
+
+
+def parse_size(text: str) -> int:
+    """Returns the entry count of `text`, e.g. `100k` or `10m`"""
+    text = text.strip().lower()
+    scale = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    return int(text.rstrip("km")) * scale
+
+
+def format_size(size: int) -> str:
+    """Returns `size` the way `parse_size` reads it, e.g. `100k`"""
+    for suffix, scale in (("m", 1000000), ("k", 1000)):
+        if size >= scale and size % scale == 0:
+            return f"{size // scale}{suffix}"
+    return str(size)
+
+
+def measure(function, repeat: int, number: int = 1) -> dict[str, float]:
+    """Time `repeat` runs of `function`, which makes `number` calls
+
+    Returns:
+        - dict[str, float]
+            best and median seconds per call
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) / number)
+    return {"best": min(times), "median": statistics.median(times)}
+
+
+def bench_load(filename: str, repeat: int) -> dict[str, dict]:
+    """Time parsing the whole corpus, and `load_corpus`
+
+    `load_corpus` maps large files lazily; its index is built by a first
+    untimed load, like every start after the first one.
+    """
+    reader = ReadJson()
+    load_corpus(reader, filename)
+    return {
+        "load.get_data": measure(lambda: reader.get_data(filename), repeat),
+        "load.load_corpus": measure(
+            lambda: load_corpus(reader, filename), repeat
+        ),
+    }
+
+
+def bench_select(words, phrases, repeat: int) -> dict[str, dict]:
+    """Time building the difficulty indexes and picking questions"""
+
+    def build() -> None:
+        Data(words, phrases).get_indexes()
+
+    data = Data(words, phrases)
+    data.get_indexes()
+
+    def random_entries() -> None:
+        for _ in range(PICKS // 2):
+            data.get_random_word()
+            data.get_random_phrase()
+
+    def pick() -> None:
+        for _ in range(PICKS // 2):
+            data.pick("basic")
+            data.pick("intermediate")
+
+    random.seed(SEED)
+    return {
+        "select.indexes": measure(build, repeat),
+        "select.get_random": measure(random_entries, repeat, PICKS),
+        "select.pick": measure(pick, repeat, PICKS),
+    }
+
+
+def make_game(settings: dict, words, phrases, output) -> Game:
+    """Returns a game writing to `output`, with no timer thread"""
+    game = Game(
+        settings,
+        Assets(),
+        words,
+        phrases,
+        output=output,
+        geometry=TerminalGeometry(SCREEN_SIZE),
+    )
+    game.timer["scheduler"].shutdown()
+    return game
+
+
+def bench_guess(settings: dict, words, phrases, repeat: int) -> dict:
+    """Time guessing every letter of random answers, and tracker resets"""
+    game = make_game(settings, words, phrases, CountingSink())
+    rng = random.Random(SEED)
+    rounds = []
+    for idx in range(GUESS_ROUNDS):
+        game.get_question("basic" if idx % 2 else "intermediate")
+        rounds.append(
+            (game.state["answer"], rng.sample(string.ascii_lowercase, 26))
+        )
+    guesses = GUESS_ROUNDS * 26
+
+    def play() -> None:
+        engine = game.engine
+        for answer, letters in rounds:
+            engine.reset()
+            engine.new_round(answer)
+            game.state["life"] = len(letters)
+            for letter in letters:
+                game.letter_in_question(letter)
+
+    tracker = LetterTracker()
+
+    def reset() -> None:
+        for _ in range(RESETS):
+            tracker.mark_typed("e")
+            tracker.reset_is_typed()
+
+    return {
+        "guess.letter_in_question": measure(play, repeat, guesses),
+        "guess.reset_is_typed": measure(reset, repeat, RESETS),
+    }
+
+
+def bench_render(settings: dict, words, phrases, repeat: int) -> dict:
+    """Time drawing the board, repainted in full and diffed per guess"""
+    game = make_game(settings, words, phrases, CountingSink())
+    random.seed(SEED)
+    game.get_question("intermediate")
+    letters = random.Random(SEED).sample(string.ascii_lowercase, 26)
+
+    def full() -> None:
+        for _ in range(FRAMES):
+            game.renderer.previous = None
+            game._print_question()
+
+    def diffed() -> None:
+        # a frame per guess, as in a game
+        for idx in range(FRAMES):
+            if idx % 26 == 0:
+                game.engine.reset()
+                game.engine.new_round(game.state["answer"])
+                game.state["life"] = 26
+            game.letter_in_question(letters[idx % 26])
+            game._print_question()
+
+    return {
+        "render.full": measure(full, repeat, FRAMES),
+        "render.diff": measure(diffed, repeat, FRAMES),
+    }
+
+
+def run(sizes: list[int], repeat: int, groups: tuple[str, ...]) -> dict:
+    """Run the selected groups on a corpus of each size
+
+    Returns:
+        - dict
+            `meta` about the run, and `metrics`: the times of each metric,
+            named `<group>.<operation>[<size>]`
+    """
+    settings = ReadJson().get_settings("settings.json")
+    # long enough that no countdown ends while timing
+    settings = dict(settings, max_time="3600", no_repeat="false")
+    metrics = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            filename = os.path.join(directory, f"data_{size}.json")
+            write_corpus(filename, size)
+            words, phrases = ReadJson().get_data(filename)
+            results = {}
+            if "load" in groups:
+                results.update(bench_load(filename, repeat))
+            if "select" in groups:
+                results.update(bench_select(words, phrases, repeat))
+            if "guess" in groups:
+                results.update(bench_guess(settings, words, phrases, repeat))
+            if "render" in groups:
+                results.update(
+                    bench_render(settings, words, phrases, repeat)
+                )
+            for name, result in results.items():
+                metrics[f"{name}[{format_size(size)}]"] = result
+            del words, phrases
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "sizes": [format_size(size) for size in sizes],
+            "repeat": repeat,
+            "seed": SEED,
+        },
+        "metrics": metrics,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Returns the metrics more than `threshold` slower than `baseline`
+
+    Returns:
+        - list[tuple[str, float, float, float]]
+            (name, baseline best, current best, ratio) of each regression.
+            Metrics missing from either side are not compared.
+    """
+    regressions = []
+    for name, result in results["metrics"].items():
+        old = baseline["metrics"].get(name)
+        if old is None or not old["best"]:
+            continue
+        ratio = result["best"] / old["best"]
+        if ratio > 1 + threshold:
+            regressions.append((name, old["best"], result["best"], ratio))
+    return regressions
+
+
+def format_time(seconds: float) -> str:
+    """Returns `seconds` in the unit that reads best"""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_results(results: dict, baseline: dict | None) -> None:
+    """Print a table of the results, against the baseline if any"""
+    old_metrics = baseline["metrics"] if baseline else {}
+    print(f"{'metric':36} {'best':>10} {'median':>10} {'baseline':>10}")
+    for name, result in results["metrics"].items():
+        old = old_metrics.get(name)
+        change = ""
+        if old and old["best"]:
+            change = f"{result['best'] / old['best'] - 1:+9.1%}"
+        print(
+            f"{name:36} {format_time(result['best']):>10}"
+            f" {format_time(result['median']):>10} {change:>10}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmark loading, selecting, guessing and rendering.",
+    )
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--only", default=",".join(GROUPS))
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD
+    )
+    args = parser.parse_args()
+
+    groups = tuple(group.strip() for group in args.only.split(","))
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results = run(sizes, args.repeat, groups)
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=1)
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(
+                f"REGRESSION {name}: {format_time(old)} -> "
+                f"{format_time(new)} ({ratio - 1:+.1%})"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"no regression past {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 """ASCII assets for the Hangman game.
 
 This module provides the Asset class which stores the ASCII gallows art for
-each life state and emoticon strings used for end-game screen
+each life state and emoticon strings used for end-game screen. It also keeps
+the frames built from them pre-rendered per terminal size, so sessions that
+share the assets share the rendering work too.
 """
 
+import threading
+from collections import OrderedDict
+
+# terminal sizes kept pre-rendered, the least recently used one is dropped
+MAX_SIZES = 8
+
 
 class Assets:
     """Container for ASCII art and emoticons used in the UI"""
@@ -71,6 +79,10 @@ class Assets:
         self.sad = "(づ•́ ᵔ •̀)づ"
         self.happy = "✺◟(＾∇＾)◞✺"
 
+        # (width, height) -> key -> pre-rendered frame, in LRU order
+        self.rendered: OrderedDict[tuple[int, int], dict] = OrderedDict()
+        self.lock = threading.Lock()
+
     def get_gallows(self, life: int) -> list[str]:
         """Returns the gallow frame for the given life count.
 
@@ -99,3 +111,32 @@ class Assets:
                 The emoticon string, either happy or sad
         """
         return self.happy if won else self.sad
+
+    def get_rendered(self, key, size: tuple[int, int], render):
+        """Return what `render()` builds for `key`, rendered once per size
+
+        Parameters:
+            - key : Hashable
+                Which frame, e.g. `("gallows", life)`
+            - size : tuple[int, int]
+                Terminal (width, height) the frame is laid out for
+            - render : Callable[[], Any]
+                Builds the frame when it is not cached for `size` yet
+
+        Returns:
+            - Any
+                The cached result of `render`. It is shared, do not modify
+        """
+        with self.lock:
+            frames = self.rendered.get(size)
+            if frames is None:
+                frames = self.rendered[size] = {}
+                if len(self.rendered) > MAX_SIZES:
+                    self.rendered.popitem(last=False)
+            else:
+                self.rendered.move_to_end(size)
+            frame = frames.get(key)
+        if frame is None:
+            # rendering twice on a race is harmless, both results are equal
+            frame = frames[key] = render()
+        return frame
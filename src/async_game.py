@@ -0,0 +1,316 @@
+"""Asyncio game loop for the Hangman game.
+
+This module implements `AsyncGame`, a `Game` whose input reading, countdown,
+timeout and rendering all run as coroutines on one event loop. It reuses the
+rules of `Game` (`get_question`, `letter_in_question`) and its rendering, so
+many sessions can share a single process, and the browser build can feed
+input lines directly instead of going through blocking `input()`.
+"""
+
+import asyncio
+import os
+import sys
+
+try:
+    from .game import Game, HINT_KEY, seconds_left
+except ImportError:
+    from game import Game, HINT_KEY, seconds_left
+
+
+class QueueReader:
+    """Line source fed from outside the event loop, e.g. by a JS terminal"""
+
+    def __init__(self) -> None:
+        self.lines: asyncio.Queue[str] = asyncio.Queue()
+
+    def feed(self, line: str) -> None:
+        """Queue a line typed by the user"""
+        self.lines.put_nowait(line)
+
+    async def readline(self) -> str:
+        """Wait for the next line typed by the user"""
+        return await self.lines.get()
+
+
+class StdinReader:
+    """Line source reading standard input without blocking the event loop"""
+
+    async def readline(self) -> str:
+        """Wait for the next line from standard input
+
+        Raises `EOFError` when standard input is closed, like `input()`.
+        """
+        loop = asyncio.get_running_loop()
+        if os.name == "posix":
+            future = loop.create_future()
+            fd = sys.stdin.fileno()
+
+            def on_readable() -> None:
+                if not future.done():
+                    future.set_result(sys.stdin.readline())
+
+            loop.add_reader(fd, on_readable)
+            try:
+                line = await future
+            finally:
+                loop.remove_reader(fd)
+        else:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+
+class AsyncGame(Game):
+    """Hangman game driven by an asyncio event loop
+
+    `reader` is any object with an awaitable `readline()` returning the next
+    line without its newline. Output goes to `output`, or `sys.stdout` when
+    it is not given. With a `TimerWheel` as `wheel`, the countdown is a
+    timer on it instead of a task of its own.
+    """
+
+    def __init__(
+        self,
+        settings: dict[str, str],
+        assets,
+        word_list: list[str],
+        phrase_list: list[str],
+        reader=None,
+        output=None,
+        data_source: str | None = None,
+        geometry=None,
+        data=None,
+        wheel=None,
+        stats=None,
+        snapshots=None,
+    ) -> None:
+        super().__init__(
+            settings,
+            assets,
+            word_list,
+            phrase_list,
+            output,
+            geometry=geometry,
+            data_source=data_source,
+            data=data,
+            stats=stats,
+            snapshots=snapshots,
+        )
+        self.reader = reader or StdinReader()
+        self.countdown_task: asyncio.Task | None = None
+        self.wheel = wheel
+        self.countdown_timer = None
+        self.game_over = asyncio.Event()
+        # loop the rank line is drawn from, see `_show_rank`
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    async def _input(self) -> str | None:
+        """Wait for a line typed after the prompt of the current frame
+
+        Returns `None` instead if the countdown ends the game first.
+        """
+        read_task = asyncio.ensure_future(self.reader.readline())
+        over_task = asyncio.ensure_future(self.game_over.wait())
+        done, _ = await asyncio.wait(
+            {read_task, over_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        over_task.cancel()
+        if read_task in done:
+            return read_task.result()
+
+        read_task.cancel()
+        return None
+
+    async def game_menu(self) -> None:
+        """Displays the main menu and handle menu selection.
+
+        Same flow as `Game.game_menu`, but awaits input instead of blocking.
+        """
+        self._clear_screen()
+        self._display_notice()
+        if self.on_notice is not None:
+            self.on_notice()
+        _ = await self._input()
+
+        level = self.resume_game()
+        if level is not None:
+            self._clear_screen()
+            await self.start_game(level, resumed=True)
+
+        self._clear_screen()
+        self._display_menu()
+        choice = await self._input()
+
+        while choice != "3":
+            self._clear_screen()
+
+            action = self.game_menu_helper(choice or "")
+            if action is not None:
+                await self.start_game(action)
+
+            self._display_menu()
+            choice = await self._input()
+
+        self._clear_screen()
+
+    async def start_game(self, level: str, resumed: bool = False) -> None:
+        """Run the main game loop for a single session
+
+        Parameters:
+            - level : str
+                Difficulty level, selects word or phrase list
+            - resumed : bool
+                Play the game restored by `resume_game` instead of a new one
+        """
+        if not resumed:
+            self.get_question(level)
+        self.game_over.clear()
+
+        while (
+            not self.game_over.is_set()
+            and self.state["life"] > 0
+            and self.state["correct_counter"] < len(self.state["answer"])
+        ):
+            self._print_question()
+
+            if not self.timer["skip_create_timer"]:
+                self._start_countdown()
+                self.timer["skip_create_timer"] = True
+
+            letter_input = await self._read_guess()
+            if letter_input is None:
+                break
+            letter_input = letter_input.lower()
+            if letter_input == HINT_KEY:
+                self.hint = self.get_hint()
+                self.timer["skip_create_timer"] = True
+                continue
+            self.hint = None
+
+            self.letter_in_question(letter_input)
+            if letter_input == "":
+                self.timer["skip_create_timer"] = True
+                continue
+
+            if not self.timer["skip_create_timer"]:
+                self._stop_countdown()
+                self.timer["time_counter"] = int(self.settings["max_time"])
+
+        self._stop_countdown()
+        self.game_over.clear()
+        self._game_end_menu()
+        _ = await self._input()
+
+        self.reset_game()
+        self._clear_screen()
+
+    async def _read_guess(self) -> str | None:
+        if not self._auto_play():
+            return await self._input()
+        await asyncio.sleep(float(self.settings.get("auto_play_delay", "0.5")))
+        if self.game_over.is_set():
+            return None
+        guess = self.get_hint() or ""
+        self.renderer.write(guess)
+        return guess
+
+    def _record_game(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        super()._record_game()
+
+    def _show_rank(self, rank: dict | None) -> None:
+        # the stats writer thread must not touch the session's output
+        self.loop.call_soon_threadsafe(super()._show_rank, rank)
+
+    def _start_countdown(self) -> None:
+        # starts from `time_counter`, a whole turn unless resumed
+        self._stop_countdown()
+        self.save_snapshot()
+        if self.wheel is None:
+            self.countdown_task = asyncio.ensure_future(self._countdown())
+            return
+
+        self.timer["deadline"] = (
+            self.wheel.clock() + self.timer["time_counter"]
+        )
+        self._timer_display(self.timer["time_counter"])
+        self._arm_wheel_tick()
+
+    def _arm_wheel_tick(self) -> None:
+        # wake at the next whole second before the deadline. The delay is
+        # from the wheel's last tick, which the callbacks run at
+        due = self.timer["deadline"] - (self.timer["time_counter"] - 1)
+        delay = round(due - self.wheel.ticked_to, 6)
+        if self.countdown_timer is None:
+            self.countdown_timer = self.wheel.arm(delay, self._wheel_tick)
+        else:
+            self.countdown_timer.reset(delay)
+
+    def _stop_countdown(self) -> None:
+        if self.countdown_task:
+            self.countdown_task.cancel()
+            self.countdown_task = None
+        if self.countdown_timer:
+            self.countdown_timer.cancel()
+
+    def _wheel_tick(self) -> None:
+        # the time left is measured from the turn's deadline, so neither
+        # late ticks nor delays rounded to the wheel's ticks add up
+        now = self.wheel.clock()
+        left = seconds_left(self.timer["deadline"], now)
+        if left <= 0:
+            if not self._time_out():
+                return
+            self.timer["deadline"] = now + self.timer["time_counter"]
+        elif left != self.timer["time_counter"]:
+            self.timer["time_counter"] = left
+        else:
+            # woke before the count changed
+            self._arm_wheel_tick()
+            return
+        self._timer_display(self.timer["time_counter"])
+        self._arm_wheel_tick()
+
+    def _time_out(self) -> bool:
+        """Take a life for the turn that ran out of time
+
+        Same rules as `Game.timer_finished_thread`: the game ends when it
+        was the last life, otherwise the question is redrawn for a new turn.
+
+        Returns:
+            - bool
+                `False` if the game is over
+        """
+        self.engine.lose_life()
+        if self.state["life"] <= 0:
+            self.game_over.set()
+            return False
+
+        self.timer["time_counter"] = int(self.settings["max_time"])
+        self._print_question(keep_cursor=True)
+        self.save_snapshot()
+        return True
+
+    async def _countdown(self) -> None:
+        # one coroutine per session does what the timer threads of `Game` do:
+        # count down, redraw the timer line, and handle the timeout. It
+        # sleeps until the time left changes, measured from the turn's
+        # deadline so that late wakeups do not add up
+        loop = asyncio.get_running_loop()
+        while True:
+            deadline = loop.time() + self.timer["time_counter"]
+            shown = None
+            while self.timer["time_counter"] > 0:
+                if self.timer["time_counter"] != shown:
+                    shown = self.timer["time_counter"]
+                    self._timer_display(shown)
+                await asyncio.sleep(deadline - (shown - 1) - loop.time())
+                self.timer["time_counter"] = seconds_left(
+                    deadline, loop.time()
+                )
+
+            if not self._time_out():
+                self.countdown_task = None
+                return
@@ -0,0 +1,154 @@
+"""Build the browser bundle of the Hangman game.
+
+Usage:
+
+    python src/build_web.py [out_dir]
+
+Writes `static/build/` by default: a zip holding every module of `src/`,
+the corpus compiled to the binary format with its difficulty indexes
+already built, and the settings for the browser, plus a `manifest.json`
+naming the zip. The zip is named after a hash of its content, so the same
+sources always give the same bundle and browsers cache it until it
+changes. `static/index.html` loads the bundle when there is one, and the
+sources one by one otherwise.
+"""
+
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import zipfile
+
+try:
+    from .corpus import compile_corpus, load_binary_corpus
+    from .game import Data
+    from .read_json import ReadJson
+    from .web import BUNDLE_INFO
+except ImportError:
+    from corpus import compile_corpus, load_binary_corpus
+    from game import Data
+    from read_json import ReadJson
+    from web import BUNDLE_INFO
+
+CURRENT_DIR = os.path.basename(os.getcwd())
+ROOT = ".." if CURRENT_DIR == "src" else "."
+MANIFEST = "manifest.json"
+CORPUS = "data.bin"
+# features that need what the browser does not have: sqlite3 for the stats,
+# a lasting file system for snapshots and metrics, threads for the watcher
+WEB_SETTINGS = {
+    "data_filename": CORPUS,
+    "stats_filename": "",
+    "snapshot_filename": "",
+    "metrics": "false",
+    "watch_corpus": "false",
+}
+# modification time of every bundled file, the earliest a zip can store
+BUNDLE_TIME = (1980, 1, 1, 0, 0, 0)
+BUNDLE_MTIME_NS = 315532800 * 10**9
+
+
+def _add(archive: zipfile.ZipFile, name: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(name, date_time=BUNDLE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    archive.writestr(info, data)
+
+
+def _read(filename: str) -> bytes:
+    with open(filename, "rb") as file:
+        return file.read()
+
+
+def build_bundle(
+    src_dir: str, settings: dict[str, str], source: str, out_dir: str
+) -> dict:
+    """Write the bundle and its manifest to `out_dir`
+
+    Parameters:
+        - src_dir : str
+            Directory of the game's modules
+        - settings : dict[str, str]
+            Game settings, `WEB_SETTINGS` override some of them
+        - source : str
+            Corpus file, JSON or already compiled
+        - out_dir : str
+            Created if missing. Bundles of earlier builds are removed
+
+    Returns:
+        - dict
+            The manifest: `bundle`, the zip's file name, and `hash`
+    """
+    modules = sorted(glob.glob(os.path.join(src_dir, "*.py")))
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = os.path.join(directory, CORPUS)
+        if not compile_corpus(ReadJson(), source, corpus):
+            raise FileNotFoundError(source)
+        # the indexes are cached for this time, restored in the browser
+        os.utime(corpus, ns=(BUNDLE_MTIME_NS, BUNDLE_MTIME_NS))
+        Data(*load_binary_corpus(corpus), corpus).get_indexes()
+        features = _read(corpus + ".features")
+        corpus_data = _read(corpus)
+
+    files = {
+        "settings.json": json.dumps(
+            dict(settings, **WEB_SETTINGS), indent=4
+        ).encode("utf-8"),
+        CORPUS: corpus_data,
+        CORPUS + ".features": features,
+    }
+    for module in modules:
+        files["src/" + os.path.basename(module)] = _read(module)
+    names = sorted(files) + [BUNDLE_INFO]
+    files[BUNDLE_INFO] = json.dumps(
+        {"files": names, "mtimes": {CORPUS: BUNDLE_MTIME_NS}}
+    ).encode("utf-8")
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name in names:
+            _add(archive, name, files[name])
+    bundle = buffer.getvalue()
+    digest = hashlib.sha256(bundle).hexdigest()[:16]
+    manifest = {"bundle": f"hangman-{digest}.zip", "hash": digest}
+
+    os.makedirs(out_dir, exist_ok=True)
+    for old in glob.glob(os.path.join(out_dir, "hangman-*.zip")):
+        if os.path.basename(old) != manifest["bundle"]:
+            os.remove(old)
+    with open(os.path.join(out_dir, manifest["bundle"]), "wb") as file:
+        file.write(bundle)
+    with open(
+        os.path.join(out_dir, MANIFEST), "w", encoding="utf-8"
+    ) as file:
+        json.dump(manifest, file, indent=4)
+    return manifest
+
+
+def main() -> None:
+    """Build the bundle from the settings and corpus of the repository"""
+    reader = ReadJson()
+    settings = reader.get_settings(os.path.join(ROOT, "settings.json"))
+    if not settings:
+        print(f"File {os.path.join(ROOT, "settings.json")} not found")
+        sys.exit(1)
+    out_dir = (
+        sys.argv[1] if len(sys.argv) > 1
+        else os.path.join(ROOT, "static", "build")
+    )
+    source = os.path.join(ROOT, settings["data_filename"])
+    try:
+        manifest = build_bundle(
+            os.path.join(ROOT, "src"), settings, source, out_dir
+        )
+    except FileNotFoundError:
+        print(f"File {source} not found")
+        sys.exit(1)
+    size = os.path.getsize(os.path.join(out_dir, manifest["bundle"]))
+    print(f"Built {manifest["bundle"]} ({size / 1024:.0f} KiB) in {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compile a JSON words/phrases file into a binary corpus.
+
+Usage:
+
+    python src/compile_corpus.py [source.json] [target.bin]
+
+Defaults to the `data_filename` from `settings.json` and the same name with a
+`.bin` extension. Point `data_filename` at the compiled file to load it at
+startup without parsing.
+"""
+
+import os
+import sys
+from read_json import ReadJson
+from corpus import compile_corpus
+
+CURRENT_DIR = os.path.basename(os.getcwd())
+SETTINGS_FILENAME = (
+    "../settings.json" if CURRENT_DIR == "src" else "settings.json"
+)
+
+
+def main() -> None:
+    """Compile the corpus named on the command line or in the settings"""
+    reader = ReadJson()
+    if len(sys.argv) > 1:
+        source = sys.argv[1]
+    else:
+        settings = reader.get_settings(SETTINGS_FILENAME)
+        if not settings:
+            print(f"File {SETTINGS_FILENAME} not found")
+            sys.exit(1)
+        source = (
+            f"../{settings["data_filename"]}"
+            if CURRENT_DIR == "src"
+            else settings["data_filename"]
+        )
+    target = sys.argv[2] if len(sys.argv) > 2 else (
+        os.path.splitext(source)[0] + ".bin"
+    )
+
+    if not compile_corpus(reader, source, target):
+        print(f"File {source} not found")
+        sys.exit(1)
+    print(f"Compiled {source} into {target}")
+
+
+if __name__ == "__main__":
+    main()
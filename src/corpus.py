@@ -0,0 +1,340 @@
+"""Large word/phrase corpora for the Hangman game.
+
+This module loads word lists that are too big to parse into Python lists.
+The JSON data file is streamed once to build an on-disk index of where each
+entry starts, then memory-mapped so entries are only decoded when picked.
+It also defines a compact binary corpus format, compiled from the JSON file
+by `compile_corpus`, which is memory-mapped without any parsing.
+"""
+
+import array
+import itertools
+import json
+import mmap
+import os
+import re
+import struct
+from collections.abc import Sequence
+
+# files at least this big are loaded lazily by `load_corpus`
+LAZY_LOAD_SIZE = 16 * 1024 * 1024
+
+INDEX_MAGIC = b"HMIDX\x00\x00\x01"
+# magic, source size, source mtime, then offset/count of words and phrases
+_INDEX_HEADER = struct.Struct("<8sQQQQQQ")
+_OFFSET = "Q"
+_FLUSH_EVERY = 65536
+
+BINARY_MAGIC = b"HMCORP\x00\x01"
+# magic, word count, phrase count. Followed by the word offsets and phrase
+# offsets (count + 1 each, relative to the blob), then the UTF-8 blob
+_BINARY_HEADER = struct.Struct("<8sQQ")
+
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_SECTIONS = (b'"words"', b'"phrases"')
+
+
+class CorpusList(Sequence):
+    """Read-only list of corpus entries
+
+    Supports `len()` and integer indexing, which is all `random.choice`
+    needs. Subclasses implement `_entry` to decode one entry.
+    """
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._entry(i) for i in range(*idx.indices(self.length))]
+        if idx < 0:
+            idx += self.length
+        if not 0 <= idx < self.length:
+            raise IndexError("corpus index out of range")
+        return self._entry(idx)
+
+    def __iter__(self):
+        # without the checks of `__getitem__` for every entry
+        return map(self._entry, range(self.length))
+
+    def _entry(self, idx: int) -> str:
+        raise NotImplementedError
+
+
+class JsonCorpusList(CorpusList):
+    """Entries of one JSON array, decoded from the mapped file on access"""
+
+    def __init__(self, source: mmap.mmap, offsets: memoryview) -> None:
+        super().__init__(len(offsets))
+        self.source = source
+        self.offsets = offsets
+
+    def _entry(self, idx: int) -> str:
+        match = _STRING.match(self.source, self.offsets[idx])
+        return json.loads(match.group())
+
+
+class BinaryCorpusList(CorpusList):
+    """Entries of a compiled corpus, sliced from the mapped UTF-8 blob"""
+
+    def __init__(self, blob: memoryview, offsets: memoryview) -> None:
+        super().__init__(len(offsets) - 1)
+        self.blob = blob
+        self.offsets = offsets
+
+    def _entry(self, idx: int) -> str:
+        return str(
+            self.blob[self.offsets[idx]:self.offsets[idx + 1]], "utf-8"
+        )
+
+    def __iter__(self):
+        # every entry sliced and decoded without a Python call
+        bounds = map(slice, self.offsets, self.offsets[1:])
+        return map(
+            str, map(self.blob.__getitem__, bounds), itertools.repeat("utf-8")
+        )
+
+
+def build_json_index(filename: str, index_filename: str) -> None:
+    """Stream `filename` once and write the entry offsets to `index_filename`
+
+    Only the offsets of the current chunk are held in memory, so this works
+    for files much bigger than the available memory.
+    """
+    stat = os.stat(filename)
+    sections = {name: (0, 0) for name in _SECTIONS}
+    item_size = array.array(_OFFSET).itemsize
+
+    with (
+        open(filename, "rb") as source,
+        mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        # written next to the index and renamed over it, lists of an older
+        # version may still have the index mapped
+        open(index_filename + ".tmp", "wb") as index,
+    ):
+        index.write(b"\0" * _INDEX_HEADER.size)
+        depth = 0
+        key = b""
+        section: bytes | None = None
+        start = count = 0
+        pending = array.array(_OFFSET)
+
+        for token in _TOKEN.finditer(mapped):
+            char = mapped[token.start()]
+            if char == 0x22:  # '"'
+                if depth == 1:
+                    key = token.group()
+                elif depth == 2 and section is not None:
+                    pending.append(token.start())
+                    if len(pending) >= _FLUSH_EVERY:
+                        count += len(pending)
+                        pending.tofile(index)
+                        pending = array.array(_OFFSET)
+            elif char in b"[{":
+                depth += 1
+                if depth == 2 and char == 0x5B and key in sections:
+                    section = key
+                    start = index.tell()
+                    count = 0
+            else:
+                if depth == 2 and section is not None:
+                    count += len(pending)
+                    pending.tofile(index)
+                    pending = array.array(_OFFSET)
+                    sections[section] = (
+                        (start - _INDEX_HEADER.size) // item_size, count
+                    )
+                    section = None
+                depth -= 1
+
+        index.seek(0)
+        index.write(
+            _INDEX_HEADER.pack(
+                INDEX_MAGIC,
+                stat.st_size,
+                stat.st_mtime_ns,
+                *sections[b'"words"'],
+                *sections[b'"phrases"'],
+            )
+        )
+    os.replace(index_filename + ".tmp", index_filename)
+
+
+def _read_index(index_filename: str, stat: os.stat_result):
+    try:
+        with open(index_filename, "rb") as index:
+            header = index.read(_INDEX_HEADER.size)
+            if len(header) < _INDEX_HEADER.size:
+                return None
+            magic, size, mtime, *sections = _INDEX_HEADER.unpack(header)
+            if (magic, size, mtime) != (
+                INDEX_MAGIC, stat.st_size, stat.st_mtime_ns
+            ):
+                return None
+            mapped = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    return mapped, sections
+
+
+def load_json_corpus(
+    filename: str, index_filename: str | None = None
+) -> None | tuple[JsonCorpusList, JsonCorpusList]:
+    """Memory-map a JSON words/phrases file through its offset index
+
+    The index is built next to the file (`<filename>.idx`) on first use and
+    rebuilt whenever the file changes.
+
+    Parameters:
+        - filename : str
+            Path to the JSON file
+        - index_filename : str | None
+            Path to the index file, defaults to `<filename>.idx`
+
+    Returns:
+        - `tuple[JsonCorpusList, JsonCorpusList]` | None
+            Returns the lazily decoded (words, phrases), or `None` if the
+            file does not exist.
+    """
+    index_filename = index_filename or filename + ".idx"
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+
+    index = _read_index(index_filename, stat)
+    if index is None:
+        build_json_index(filename, index_filename)
+        index = _read_index(index_filename, stat)
+    mapped_index, sections = index
+
+    with open(filename, "rb") as source:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_RANDOM"):
+        # picks are random, readahead would only map unused pages
+        mapped.madvise(mmap.MADV_RANDOM)
+        mapped_index.madvise(mmap.MADV_RANDOM)
+
+    offsets = memoryview(mapped_index)[_INDEX_HEADER.size:].cast(_OFFSET)
+    words_start, words_count, phrases_start, phrases_count = sections
+    return (
+        JsonCorpusList(
+            mapped, offsets[words_start:words_start + words_count]
+        ),
+        JsonCorpusList(
+            mapped, offsets[phrases_start:phrases_start + phrases_count]
+        ),
+    )
+
+
+def compile_corpus(reader, source: str, target: str) -> bool:
+    """Compile the JSON words/phrases file `source` into a binary corpus
+
+    Entries are streamed from `source` twice, once for the offsets and once
+    for the blob, so the corpus never has to fit in memory.
+
+    Returns:
+        - bool
+            `False` if `source` does not exist.
+    """
+    data = load_corpus(reader, source)
+    if data is None:
+        return False
+
+    with open(target + ".tmp", "wb") as file:
+        file.write(_BINARY_HEADER.pack(BINARY_MAGIC, *map(len, data)))
+        for entries in data:
+            offset = 0
+            offsets = array.array(_OFFSET, [0])
+            for entry in entries:
+                offset += len(entry.encode("utf-8"))
+                offsets.append(offset)
+                if len(offsets) >= _FLUSH_EVERY:
+                    offsets.tofile(file)
+                    offsets = array.array(_OFFSET)
+            offsets.tofile(file)
+
+        for entries in data:
+            for entry in entries:
+                file.write(entry.encode("utf-8"))
+    os.replace(target + ".tmp", target)
+    return True
+
+
+def load_binary_corpus(
+    filename: str,
+) -> None | tuple[BinaryCorpusList, BinaryCorpusList]:
+    """Memory-map a corpus compiled by `compile_corpus`
+
+    Nothing is parsed or copied, entries are decoded when indexed. Where the
+    file cannot be mapped, e.g. in a WebAssembly build, it is read into
+    memory in one piece instead.
+
+    Returns:
+        - `tuple[BinaryCorpusList, BinaryCorpusList]` | None
+            Returns (words, phrases), or `None` if the file does not exist.
+    """
+    try:
+        with open(filename, "rb") as file:
+            try:
+                mapped = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, ValueError):
+                mapped = file.read()
+    except FileNotFoundError:
+        return None
+    if hasattr(mmap, "MADV_RANDOM") and not isinstance(mapped, bytes):
+        mapped.madvise(mmap.MADV_RANDOM)
+
+    magic, words, phrases = _BINARY_HEADER.unpack_from(mapped)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{filename} is not a compiled corpus")
+
+    view = memoryview(mapped)
+    offsets_end = _BINARY_HEADER.size + (words + phrases + 2) * 8
+    offsets = view[_BINARY_HEADER.size:offsets_end].cast(_OFFSET)
+    blob = view[offsets_end:]
+    word_offsets = offsets[:words + 1]
+    phrase_offsets = offsets[words + 1:]
+    return (
+        BinaryCorpusList(blob, word_offsets),
+        # phrases follow the words in the blob
+        BinaryCorpusList(blob[word_offsets[-1]:], phrase_offsets),
+    )
+
+
+def is_binary_corpus(filename: str) -> bool:
+    """Returns `True` if `filename` starts with the compiled corpus magic"""
+    try:
+        with open(filename, "rb") as file:
+            return file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def load_corpus(reader, filename: str) -> None | tuple[Sequence, Sequence]:
+    """Load the words and phrases from `filename`
+
+    Compiled corpora are memory-mapped as they are. Small JSON files are
+    parsed with `reader.get_data`, JSON files of at least `LAZY_LOAD_SIZE`
+    bytes are memory-mapped through an index instead.
+
+    Returns:
+        - `tuple[Sequence[str], Sequence[str]]` | None
+            Returns (words, phrases), or `None` if the file does not exist.
+    """
+    try:
+        size = os.path.getsize(filename)
+    except OSError:
+        return None
+
+    if is_binary_corpus(filename):
+        return load_binary_corpus(filename)
+    if size >= LAZY_LOAD_SIZE:
+        return load_json_corpus(filename)
+    return reader.get_data(filename)
@@ -0,0 +1,378 @@
+"""Difficulty features and bucketed indexes for the Hangman game.
+
+This module provides the `DifficultyIndex` class which computes difficulty
+features for every entry of a word or phrase list once (letter count,
+distinct letters, letter rarity and expected guesses), groups the entries
+into (difficulty, length) buckets for O(1) selection, and caches all of it
+in a file next to the corpus.
+"""
+
+import array
+import bisect
+import json
+import math
+import os
+import random
+import struct
+from collections import Counter
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+FEATURES_MAGIC = b"HMFEAT\x00\x02"
+# magic, source size, source mtime, number of indexes in the file
+_FILE_HEADER = struct.Struct("<8sQQQ")
+# entries, buckets, easy cut, medium cut
+_INDEX_HEADER = struct.Struct("<QQdd")
+# difficulty, length, start in `order`, count
+_BUCKET = struct.Struct("<HHQQ")
+# size of the JSON letter counts that end an index
+_COUNTS = struct.Struct("<Q")
+# (attribute, array typecode) in the order they are stored
+_ARRAYS = (
+    ("lengths", "H"),
+    ("distinct", "B"),
+    ("rarity", "f"),
+    ("expected", "B"),
+    ("difficulty", "B"),
+    ("order", "I"),
+)
+
+
+# letters looked up at once from a table of up to `1 << _CHUNK_BITS`
+# values, two chunks cover a-z
+_CHUNK_BITS = 13
+
+
+class _LetterBits(dict):
+    """Letter -> its bit in the masks of entries, given in order of use"""
+
+    def __init__(self) -> None:
+        # spaces are not letters
+        super().__init__({" ": 0})
+
+    def __missing__(self, letter: str) -> int:
+        bit = self[letter] = 1 << (len(self) - 1)
+        return bit
+
+    def letters(self) -> list[str]:
+        """Returns the letters met, the one of bit `n` at index `n`"""
+        return [letter for letter in self if letter != " "]
+
+
+def _mask_chunks(masks, letters: int) -> list[tuple[int, array.array]]:
+    # (first bit, masks' bits from there) for every `_CHUNK_BITS` letters.
+    # Lists this short cannot have more masks than a chunk has values, so
+    # the masks are taken whole
+    if len(masks) <= 1 << _CHUNK_BITS:
+        return [(0, masks)]
+    chunk_mask = (1 << _CHUNK_BITS) - 1
+    chunks = []
+    for shift in range(0, letters, _CHUNK_BITS):
+        chunk = array.array("H")
+        for mask in masks:
+            chunk.append(mask >> shift & chunk_mask)
+        chunks.append((shift, chunk))
+    return chunks
+
+
+def _bits_of(value: int) -> list[int]:
+    # positions of the bits set in `value`, lowest first
+    bits = []
+    while value:
+        lowest = value & -value
+        bits.append(lowest.bit_length() - 1)
+        value ^= lowest
+    return bits
+
+
+class DifficultyIndex:
+    """Per-entry difficulty features with (difficulty, length) buckets
+
+    Features are:
+        - lengths : number of letters, spaces excluded
+        - distinct : number of distinct letters
+        - rarity : sum of -log2 of how often each distinct letter appears
+          in an entry of the list, higher is rarer
+        - expected : guesses needed when guessing letters from the most to
+          the least common one, misses included
+    Entries are split in three difficulties by their expected guesses, at
+    the tertiles of the list.
+    """
+
+    def __init__(self) -> None:
+        self.lengths = array.array("H")
+        self.distinct = array.array("B")
+        self.rarity = array.array("f")
+        self.expected = array.array("B")
+        self.difficulty = array.array("B")
+        # entry indexes sorted by bucket
+        self.order = array.array("I")
+        self.cuts = (0.0, 0.0)
+        self.buckets: dict[tuple[int, int], tuple[int, int]] = {}
+        # sorted bucket lengths of each difficulty, for range lookups
+        self.bucket_lengths: dict[int, list[int]] = {}
+        # letter -> entries containing it, to extend the index
+        self.appears: Counter[str] = Counter()
+
+    @classmethod
+    def build(cls, entries) -> "DifficultyIndex":
+        """Compute the features and buckets of `entries`"""
+        index = cls()
+        index._add(entries)
+        return index
+
+    def extended(self, entries) -> "DifficultyIndex":
+        """Returns the index of `entries`, the ones indexed here plus more
+
+        Only the added entries are examined as long as the letters keep
+        their order from the most to the least common, since the expected
+        guesses of the other entries stay the same then. Their rarity is
+        left as scored against the shorter list. If the order changes, the
+        index is built again from all of `entries`.
+        """
+        index = DifficultyIndex()
+        for name, typecode in _ARRAYS[:4]:
+            setattr(index, name, array.array(typecode, getattr(self, name)))
+        index.appears = Counter(self.appears)
+        if index._add(entries[len(self):], self._ranking()):
+            return index
+        return DifficultyIndex.build(entries)
+
+    def _ranking(self) -> dict[str, int]:
+        return {
+            letter: rank
+            for rank, (letter, _) in enumerate(self.appears.most_common())
+        }
+
+    def _add(self, entries, ranking: dict[str, int] | None = None) -> bool:
+        # features of `entries` are appended, then the difficulties and
+        # buckets of all entries are recomputed. Returns `False`, without
+        # adding anything, if the letter order is not `ranking` anymore.
+        # `entries` is read once, keeping a letter mask per entry in a typed
+        # array, so a mapped corpus is never decoded all at once. The
+        # features needing the letter counts of the whole list are then
+        # computed from the masks
+        bits = _LetterBits()
+        masks = array.array("Q")
+        lengths = array.array("H")
+        for entry in entries:
+            mask = 0
+            for letter in set(entry):
+                mask |= bits[letter]
+            try:
+                masks.append(mask)
+            except OverflowError:
+                # more than 64 letters, the masks are kept as Python ints
+                masks = list(masks)
+                masks.append(mask)
+            lengths.append(min(len(entry) - entry.count(" "), 0xFFFF))
+        letters = bits.letters()
+        # how many entries have each chunk value met, and its letters
+        chunks = []
+        for shift, chunk in _mask_chunks(masks, len(letters)):
+            counts = Counter(chunk)
+            chunk_letters = {
+                value: [shift + bit for bit in _bits_of(value)]
+                for value in counts
+            }
+            chunks.append((chunk, counts, chunk_letters))
+
+        appears = Counter(self.appears)
+        for _, counts, chunk_letters in chunks:
+            for value, count in counts.items():
+                for letter in chunk_letters[value]:
+                    appears[letters[letter]] += count
+        self.appears, previous = appears, self.appears
+        if ranking is not None and self._ranking() != ranking:
+            self.appears = previous
+            return False
+
+        total = max(1, len(self) + len(masks))
+        rarity = [-math.log2(appears[letter] / total) for letter in letters]
+        # guesses to reach each letter, the most common one first
+        ranking = self._ranking()
+        guesses = [min(ranking[letter] + 1, 0xFF) for letter in letters]
+        rarities = array.array("d", [0.0]) * len(masks)
+        expected = array.array("B", [0]) * len(masks)
+        for chunk, _, chunk_letters in chunks:
+            # rarity sum and most guesses of the letters of each chunk
+            # value met
+            rarity_of = {}
+            guesses_of = {}
+            for value, value_letters in chunk_letters.items():
+                rarity_of[value] = sum(
+                    rarity[letter] for letter in value_letters
+                )
+                guesses_of[value] = max(
+                    (guesses[letter] for letter in value_letters), default=0
+                )
+            for idx, value in enumerate(chunk):
+                rarities[idx] += rarity_of[value]
+                if guesses_of[value] > expected[idx]:
+                    expected[idx] = guesses_of[value]
+        self.lengths.extend(lengths)
+        for mask in masks:
+            self.distinct.append(min(mask.bit_count(), 0xFF))
+        self.rarity.extend(array.array("f", rarities))
+        self.expected.extend(expected)
+
+        if self.expected:
+            histogram = Counter(self.expected)
+            self.cuts = (
+                self._expected_at(histogram, len(self) // 3),
+                self._expected_at(histogram, len(self) * 2 // 3),
+            )
+        self.difficulty = array.array(
+            "B", map(self._difficulty_of, self.expected)
+        )
+        self._sort_buckets()
+        return True
+
+    def _expected_at(self, histogram: Counter, position: int) -> int:
+        # `position`-th smallest expected guesses, from their histogram
+        for expected in sorted(histogram):
+            position -= histogram[expected]
+            if position < 0:
+                return expected
+        return 0
+
+    def _difficulty_of(self, expected: int) -> int:
+        if expected <= self.cuts[0]:
+            return 0
+        if expected <= self.cuts[1]:
+            return 1
+        return 2
+
+    def _sort_buckets(self) -> None:
+        # grouped into typed arrays rather than sorted, a sort of the whole
+        # list would keep other threads waiting for as long as it runs and
+        # hold a Python int per entry
+        groups: dict[tuple[int, int], array.array] = {}
+        for idx, key in enumerate(zip(self.difficulty, self.lengths)):
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = array.array("I")
+            group.append(idx)
+        self.buckets = {}
+        self.order = array.array("I")
+        for key in sorted(groups):
+            self.buckets[key] = (len(self.order), len(groups[key]))
+            self.order.extend(groups.pop(key))
+        self._index_lengths()
+
+    def _index_lengths(self) -> None:
+        self.bucket_lengths = {}
+        for difficulty, length in sorted(self.buckets):
+            self.bucket_lengths.setdefault(difficulty, []).append(length)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def pick(
+        self,
+        rng=random,
+        difficulties: tuple[str, ...] = DIFFICULTIES,
+        min_length: int = 0,
+        max_length: int = 0xFFFF,
+    ) -> int | None:
+        """Returns the index of a random entry matching the filters
+
+        Every matching entry is equally likely. Cost depends on the number
+        of matching buckets, not on the number of entries.
+
+        Returns `None` if no entry matches.
+        """
+        candidates: list[tuple[int, int]] = []
+        total = 0
+        for name in difficulties:
+            difficulty = DIFFICULTIES.index(name)
+            lengths = self.bucket_lengths.get(difficulty, [])
+            first = bisect.bisect_left(lengths, min_length)
+            last = bisect.bisect_right(lengths, max_length)
+            for length in lengths[first:last]:
+                start, count = self.buckets[(difficulty, length)]
+                candidates.append((start, count))
+                total += count
+
+        if not total:
+            return None
+        target = rng.randrange(total)
+        for start, count in candidates:
+            if target < count:
+                return self.order[start + target]
+            target -= count
+        return None
+
+    def matches(self, idx: int, difficulties: tuple[str, ...]) -> bool:
+        """Returns `True` if entry `idx` has one of `difficulties`"""
+        return DIFFICULTIES[self.difficulty[idx]] in difficulties
+
+    def _write(self, file) -> None:
+        file.write(
+            _INDEX_HEADER.pack(len(self), len(self.buckets), *self.cuts)
+        )
+        for (difficulty, length), (start, count) in self.buckets.items():
+            file.write(_BUCKET.pack(difficulty, length, start, count))
+        for name, _ in _ARRAYS:
+            getattr(self, name).tofile(file)
+        counts = json.dumps(self.appears, sort_keys=True).encode("utf-8")
+        file.write(_COUNTS.pack(len(counts)))
+        file.write(counts)
+
+    @classmethod
+    def _read(cls, file) -> "DifficultyIndex":
+        index = cls()
+        entries, buckets, *cuts = _INDEX_HEADER.unpack(
+            file.read(_INDEX_HEADER.size)
+        )
+        index.cuts = tuple(cuts)
+        for _ in range(buckets):
+            difficulty, length, start, count = _BUCKET.unpack(
+                file.read(_BUCKET.size)
+            )
+            index.buckets[(difficulty, length)] = (start, count)
+        for name, typecode in _ARRAYS:
+            values = array.array(typecode)
+            values.fromfile(file, entries)
+            setattr(index, name, values)
+        (size,) = _COUNTS.unpack(file.read(_COUNTS.size))
+        index.appears = Counter(json.loads(file.read(size)))
+        index._index_lengths()
+        return index
+
+
+def save_indexes(
+    filename: str, source: str, indexes: list[DifficultyIndex]
+) -> None:
+    """Cache `indexes` built from the corpus file `source` in `filename`"""
+    stat = os.stat(source)
+    with open(filename + ".tmp", "wb") as file:
+        file.write(
+            _FILE_HEADER.pack(
+                FEATURES_MAGIC, stat.st_size, stat.st_mtime_ns, len(indexes)
+            )
+        )
+        for index in indexes:
+            index._write(file)
+    os.replace(filename + ".tmp", filename)
+
+
+def load_indexes(filename: str, source: str) -> list[DifficultyIndex] | None:
+    """Load indexes cached by `save_indexes`
+
+    Returns `None` if there is no cache or `source` changed since.
+    """
+    try:
+        stat = os.stat(source)
+        with open(filename, "rb") as file:
+            header = file.read(_FILE_HEADER.size)
+            if len(header) < _FILE_HEADER.size:
+                return None
+            magic, size, mtime, count = _FILE_HEADER.unpack(header)
+            if (magic, size, mtime) != (
+                FEATURES_MAGIC, stat.st_size, stat.st_mtime_ns
+            ):
+                return None
+            return [DifficultyIndex._read(file) for _ in range(count)]
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
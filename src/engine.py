@@ -0,0 +1,217 @@
+"""Headless rules engine for the Hangman game.
+
+This module implements `GameEngine`, the rules of one round (revealing
+letters, counting lives, winning and losing) as a plain state machine with
+no terminal, input, timer or randomness in it. `Game` wraps it with the
+terminal UI, and simulations drive it directly.
+"""
+
+import string
+
+# status of a letter, as returned by `LetterTracker.statuses`
+UNTYPED = 0
+HIT = 1
+MISS = 2
+# outcome of `GameEngine.guess`
+REPEATED = 0
+WRONG = 1
+REVEALED = 2
+UNCHANGED = 3
+
+
+class LetterTracker:
+    """Tracks letter typed and letter list
+
+    Typed letters and letters found in the answer are kept as bitmasks over
+    `alphabet`, one bit per letter.
+    """
+
+    __slots__ = (
+        "letter_list",
+        "bits",
+        "typed",
+        "hit",
+        "other_typed",
+        "_statuses",
+    )
+
+    def __init__(self, alphabet: str = string.ascii_lowercase) -> None:
+        self.letter_list: list[str] = list(alphabet)
+        self.bits: dict[str, int] = {
+            letter: 1 << idx for idx, letter in enumerate(alphabet)
+        }
+        self.typed = 0
+        self.hit = 0
+        # typed inputs outside the alphabet, e.g. "" or "1"
+        self.other_typed: set[str] = set()
+        # (typed, hit, statuses) of the last `statuses` call
+        self._statuses: tuple[int, int, tuple[int, ...]] | None = None
+
+    def mark_typed(self, letter: str, hit: bool = False) -> None:
+        """Mark a letter as typed, and as found in the answer if `hit`"""
+        bit = self.bits.get(letter)
+        if bit is None:
+            self.other_typed.add(letter)
+            return
+        self.typed |= bit
+        if hit:
+            self.hit |= bit
+
+    def is_typed(self, letter: str) -> bool:
+        """Returns `True` if `letter` was typed before"""
+        bit = self.bits.get(letter)
+        if bit is None:
+            return letter in self.other_typed
+        return bool(self.typed & bit)
+
+    def reset_is_typed(self) -> None:
+        """Resets every letter to not typed"""
+        self.typed = 0
+        self.hit = 0
+        if self.other_typed:
+            self.other_typed.clear()
+
+    def statuses(self) -> tuple[int, ...]:
+        """Returns `UNTYPED`, `HIT` or `MISS` for every letter in order
+
+        The result is cached until a letter is typed or the tracker reset.
+        """
+        cached = self._statuses
+        if cached and cached[0] == self.typed and cached[1] == self.hit:
+            return cached[2]
+
+        typed, hit = self.typed, self.hit
+        statuses = tuple(
+            (HIT if hit >> idx & 1 else MISS) if typed >> idx & 1 else UNTYPED
+            for idx in range(len(self.letter_list))
+        )
+        self._statuses = (typed, hit, statuses)
+        return statuses
+
+
+class GameEngine:
+    """State machine for one round of Hangman
+
+    `state` is the same dict `Game` exposes: life, answer, hidden letters,
+    correct counter, won flag, guess count and the letter position index.
+    The caller picks the answer and decides what a turn timeout is, the
+    engine only applies the rules.
+    """
+
+    def __init__(
+        self, start_life: int, alphabet: str = string.ascii_lowercase
+    ) -> None:
+        self.start_life = start_life
+        self.state = {
+            "life": start_life,
+            "hidden": [],
+            "answer": "",
+            "correct_counter": 0,
+            "won": False,
+            # inputs applied, repeats and empty inputs not counted
+            "guesses": 0,
+            # letter -> indexes in `answer`, built once per answer
+            "positions": {},
+            "positions_for": "",
+        }
+        self.tracker = LetterTracker(alphabet)
+
+    def reset(self) -> None:
+        """Resets the state and tracker for a new round"""
+        state = self.state
+        state["life"] = self.start_life
+        state["hidden"] = []
+        state["answer"] = ""
+        state["correct_counter"] = 0
+        state["positions"] = {}
+        state["positions_for"] = ""
+        state["won"] = False
+        state["guesses"] = 0
+        self.tracker.reset_is_typed()
+
+    def new_round(self, answer: str) -> None:
+        """Start a round with `answer` hidden
+
+        Spaces are shown from the start and count as found.
+        """
+        state = self.state
+        state["answer"] = answer
+
+        positions: dict[str, list[int]] = {}
+        for idx, letter in enumerate(answer):
+            positions.setdefault(letter, []).append(idx)
+            if letter == " ":
+                state["hidden"].append(" ")
+                state["correct_counter"] += 1
+            else:
+                state["hidden"].append("_")
+        state["positions"] = positions
+        state["positions_for"] = answer
+
+    def letter_positions(self, letter_input: str) -> list[int] | None:
+        """Returns the indexes of `letter_input` in the answer
+
+        Returns `None` if the input is not in the answer. Inputs that are not
+        a single character match as substrings and reveal nothing.
+        """
+        answer = self.state["answer"]
+        if len(letter_input) != 1:
+            return [] if letter_input in answer else None
+
+        if self.state["positions_for"] is not answer:
+            # the answer was set without `new_round`, index it now
+            positions: dict[str, list[int]] = {}
+            for idx, letter in enumerate(answer):
+                positions.setdefault(letter, []).append(idx)
+            self.state["positions"] = positions
+            self.state["positions_for"] = answer
+
+        return self.state["positions"].get(letter_input)
+
+    def guess(self, letter_input: str) -> int:
+        """Apply a guessed input
+
+        Parameters:
+            - letter_input : str
+                Guessed user input
+
+        Returns:
+            - int
+                `REPEATED` if it was typed before, `WRONG` if it cost a life,
+                `REVEALED` if it showed new letters, `UNCHANGED` otherwise
+        """
+        if self.tracker.is_typed(letter_input):
+            return REPEATED
+
+        if letter_input:
+            self.state["guesses"] += 1
+        positions = self.letter_positions(letter_input)
+        self.tracker.mark_typed(letter_input, positions is not None)
+        if positions is None:
+            self.state["life"] -= 1
+            return WRONG
+
+        # every position of a letter is revealed at once, so checking the
+        # first one tells whether it is already shown
+        hidden = self.state["hidden"]
+        if not positions or hidden[positions[0]] != "_":
+            return UNCHANGED
+
+        for idx in positions:
+            hidden[idx] = letter_input
+        self.state["correct_counter"] += len(positions)
+
+        if self.state["correct_counter"] >= len(self.state["answer"]):
+            self.state["won"] = True
+        return REVEALED
+
+    def lose_life(self) -> None:
+        """Take a life, e.g. when the turn timed out"""
+        self.state["life"] -= 1
+
+    def is_over(self) -> bool:
+        """Returns `True` once the round is won or out of lives"""
+        return (
+            self.state["life"] <= 0
+            or self.state["correct_counter"] >= len(self.state["answer"])
+        )
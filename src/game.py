@@ -5,20 +5,196 @@ selection, input processing, timer management, and screen rendering (terminal).
 
 """
 
+import math
 import random
-import shutil
-import os
 import threading
-import time
 import string
+import time
+
+try:
+    from .difficulty import (
+        DIFFICULTIES, DifficultyIndex, load_indexes, save_indexes
+    )
+    from .engine import (
+        GameEngine, LetterTracker, UNTYPED, HIT, MISS, WRONG, REVEALED
+    )
+    from .renderer import Frame, Renderer
+    from .sampler import PermutationSampler, load_samplers, save_states
+    from .scheduler import TimerScheduler
+    from .snapshot import matches, pack, unpack
+    from .solver import Solver
+    from .terminal import TerminalGeometry
+except ImportError:
+    from difficulty import (
+        DIFFICULTIES, DifficultyIndex, load_indexes, save_indexes
+    )
+    from engine import (
+        GameEngine, LetterTracker, UNTYPED, HIT, MISS, WRONG, REVEALED
+    )
+    from renderer import Frame, Renderer
+    from sampler import PermutationSampler, load_samplers, save_states
+    from scheduler import TimerScheduler
+    from snapshot import matches, pack, unpack
+    from solver import Solver
+    from terminal import TerminalGeometry
+
+
+# menu level -> (list, difficulties) the question is picked from
+LEVELS = {
+    "basic": ("words", ("easy", "medium")),
+    "intermediate": ("phrases", DIFFICULTIES),
+}
+# menu level -> its code in snapshots
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+# picks between two saves of the sampler state, which is saved at exit too
+SAMPLER_SAVE_INTERVAL = 32
+
+
+def seconds_left(deadline: float, now: float) -> int:
+    """Returns the whole seconds shown by a countdown ending at `deadline`
+
+    The count changes exactly at whole seconds before `deadline`, so a
+    countdown woken at `deadline - (n - 1)` shows `n - 1`.
+
+    Parameters:
+        - deadline : float
+            Time the countdown reaches 0, in the clock of `now`
+        - now : float
+            Current time of a monotonic clock
+
+    Returns:
+        - int
+            Seconds left, rounded up, and never below 0
+    """
+    # rounded first so float error at a whole second cannot show one more
+    return max(0, math.ceil(round(deadline - now, 6)))
 
 
 class Data:
     """Holds word/phrase data and provides accessors."""
 
-    def __init__(self, word_list: list[str], phrase_list: list[str]) -> None:
-        self.word_list = word_list
-        self.phrase_list = phrase_list
+    def __init__(
+        self,
+        word_list: list[str],
+        phrase_list: list[str],
+        source: str | None = None,
+    ) -> None:
+        self._word_list = word_list
+        self._phrase_list = phrase_list
+        # cleared while `load_async` loads the lists
+        self.loaded = threading.Event()
+        self.loaded.set()
+        self.load_error: Exception | None = None
+        # the load, when there was no thread to run it in
+        self.deferred_load = None
+        # corpus file, difficulty features are cached next to it
+        self.source = source
+        self.indexes: dict[str, DifficultyIndex] | None = None
+        # built on the first hint, indexing every word and phrase
+        self.solver: Solver | None = None
+        # no-repeat order of each list, see `use_sampler`
+        self.samplers: dict[str, PermutationSampler] | None = None
+        self.sampler_filename: str | None = None
+        self.unsaved_draws = 0
+        # held to write the sampler state, one writer at a time
+        self.save_lock = threading.Lock()
+        # held to swap in a reloaded corpus, and to pick from a consistent
+        # set of lists and indexes
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load_async(
+        cls,
+        load,
+        source: str | None = None,
+        no_repeat: bool = False,
+        start: bool = True,
+    ) -> "Data":
+        """Returns a `Data` whose lists are loaded by a background thread
+
+        The game can start, and show its first screens, while the corpus is
+        read. Any use of the lists waits until they are loaded, then the
+        thread goes on to build (or read) the difficulty indexes. Where
+        threads cannot be started, e.g. under Pyodide, the first use of
+        the lists loads them instead.
+
+        Parameters:
+            - load : Callable[[], tuple[Sequence[str], Sequence[str]]]
+                Returns the word and phrase lists. What it raises is raised
+                again by the first use of the lists
+            - source : str | None
+                Corpus file, see `Data`
+            - no_repeat : bool
+                Set up the samplers once loaded, see `use_sampler`
+            - start : bool
+                Start the thread now. Otherwise `start_load` starts it, or
+                the first use of the lists loads them
+        """
+        data = cls([], [], source)
+        data.loaded.clear()
+
+        def run() -> None:
+            try:
+                data._word_list, data._phrase_list = load()
+            except Exception as error:
+                data.load_error = error
+                return
+            finally:
+                data.loaded.set()
+            if no_repeat:
+                data.use_sampler(source + ".sampler" if source else None)
+            data.get_indexes()
+
+        data.deferred_load = run
+        if start:
+            data.start_load()
+        return data
+
+    def start_load(self) -> None:
+        """Start the load left by `load_async` in a background thread
+
+        Does nothing once it started. Where threads cannot be started, the
+        first use of the lists loads them instead.
+        """
+        run = self.deferred_load
+        if run is None:
+            return
+        try:
+            threading.Thread(target=run, daemon=True).start()
+        except RuntimeError:
+            return
+        self.deferred_load = None
+
+    def wait_loaded(self) -> None:
+        """Wait for `load_async` to finish loading the lists"""
+        run, self.deferred_load = self.deferred_load, None
+        if run is not None:
+            run()
+        self.loaded.wait()
+        if self.load_error is not None:
+            raise self.load_error
+
+    @property
+    def word_list(self):
+        """The words, waits for them while they are loaded"""
+        if not self.loaded.is_set() or self.load_error is not None:
+            self.wait_loaded()
+        return self._word_list
+
+    @word_list.setter
+    def word_list(self, word_list) -> None:
+        self._word_list = word_list
+
+    @property
+    def phrase_list(self):
+        """The phrases, waits for them while they are loaded"""
+        if not self.loaded.is_set() or self.load_error is not None:
+            self.wait_loaded()
+        return self._phrase_list
+
+    @phrase_list.setter
+    def phrase_list(self, phrase_list) -> None:
+        self._phrase_list = phrase_list
 
     def get_random_word(self) -> str:
         """Return a random word from the list."""
@@ -28,32 +204,243 @@ class Data:
         """Return a random phrase from the list."""
         return random.choice(self.phrase_list)
 
+    def get_entries(self, kind: str):
+        """Return the `words` or `phrases` list"""
+        return self.word_list if kind == "words" else self.phrase_list
 
-class LetterTracker:
-    """Tracks letter typed and letter list"""
+    def get_indexes(self) -> dict[str, DifficultyIndex]:
+        """Return the difficulty index of each list
 
-    def __init__(self) -> None:
-        self.letter_was_typed: dict[str, bool] = {}
-        self.letter_list: list[str] = []
-        self._initialise()
+        Built on first use, or loaded from `<source>.features` when it was
+        cached for the current corpus file.
+        """
+        if self.indexes is not None:
+            return self.indexes
+
+        with self.lock:
+            word_list, phrase_list = self.word_list, self.phrase_list
+        cache = self.source + ".features" if self.source else None
+        indexes = load_indexes(cache, self.source) if cache else None
+        if indexes is None:
+            indexes = [
+                DifficultyIndex.build(word_list),
+                DifficultyIndex.build(phrase_list),
+            ]
+            self._save_indexes(indexes)
+        with self.lock:
+            # unless a reload swapped the lists while these were built
+            if (
+                self.indexes is None
+                and self.word_list is word_list
+                and self.phrase_list is phrase_list
+            ):
+                self.indexes = {"words": indexes[0], "phrases": indexes[1]}
+        return self.indexes or self.get_indexes()
+
+    def _save_indexes(self, indexes: list[DifficultyIndex]) -> None:
+        if self.source:
+            try:
+                save_indexes(self.source + ".features", self.source, indexes)
+            except OSError:
+                pass
 
-    def _initialise(self) -> None:
-        for letter in string.ascii_lowercase:
-            self.letter_list.append(letter)
-            self.letter_was_typed[letter] = False
+    def select(
+        self,
+        kind: str,
+        difficulties: tuple[str, ...] = DIFFICULTIES,
+        min_length: int = 0,
+        max_length: int = 0xFFFF,
+    ) -> str | None:
+        """Return a random entry of `kind` matching the filters
 
-    def mark_typed(self, letter: str) -> None:
-        """Mark a letter as typed"""
-        self.letter_was_typed[letter] = True
+        Parameters:
+            - kind : str
+                `words` or `phrases`
+            - difficulties : tuple[str, ...]
+                Any of `easy`, `medium` and `hard`
+            - min_length, max_length : int
+                Range of the number of letters, spaces excluded
+
+        Returns:
+            - str | None
+                The entry, or `None` if no entry matches
+        """
+        self.get_indexes()
+        with self.lock:
+            idx = self.indexes[kind].pick(
+                random, difficulties, min_length, max_length
+            )
+            return None if idx is None else self.get_entries(kind)[idx]
+
+    def get_solver(self) -> Solver:
+        """Return the solver of both lists, built on first use"""
+        solver = self.solver
+        if solver is None:
+            with self.lock:
+                word_list, phrase_list = self.word_list, self.phrase_list
+            solver = Solver(word_list, phrase_list)
+            with self.lock:
+                if self.word_list is word_list:
+                    self.solver = solver
+        return solver
+
+    def reload(self, word_list, phrase_list) -> bool:
+        """Swap in a changed corpus, e.g. from a `CorpusWatcher`
+
+        The difficulty indexes, and the solver if one was built, are made
+        for the new lists first, so the swap itself is a few assignments
+        and picks never wait for the indexing. When the new lists only add
+        entries after the old ones, the indexes are extended instead of
+        rebuilt. Games in progress keep their answer.
+
+        Returns:
+            - bool
+                `True` if entries were only added
+        """
+        old = self.get_indexes()
+        appended = _extends(self.word_list, word_list) and _extends(
+            self.phrase_list, phrase_list
+        )
+        if appended:
+            indexes = [
+                old["words"].extended(word_list),
+                old["phrases"].extended(phrase_list),
+            ]
+        else:
+            indexes = [
+                DifficultyIndex.build(word_list),
+                DifficultyIndex.build(phrase_list),
+            ]
+        self._save_indexes(indexes)
+        solver = None
+        if self.solver is not None:
+            solver = Solver(word_list, phrase_list)
+
+        with self.lock:
+            if self.samplers is not None:
+                # added entries join the current pass, a list otherwise
+                # changed in size starts a new order
+                for kind, entries in zip(
+                    ("words", "phrases"), (word_list, phrase_list)
+                ):
+                    sampler = self.samplers[kind]
+                    if appended:
+                        sampler.extend(len(entries))
+                    elif sampler.size != len(entries):
+                        self.samplers[kind] = PermutationSampler(len(entries))
+                self.unsaved_draws += 1
+            self.word_list = word_list
+            self.phrase_list = phrase_list
+            self.indexes = {"words": indexes[0], "phrases": indexes[1]}
+            self.solver = solver
+        return appended
+
+    def use_sampler(self, filename: str | None = None) -> None:
+        """Ask every entry once before repeating any
 
-    def is_typed(self, letter: str) -> bool:
-        """Returns `True` if `letter` was typed before"""
-        return self.letter_was_typed[letter]
+        Parameters:
+            - filename : str | None
+                File the sampler state is kept in, so a restart resumes the
+                same order. Not persisted when `None`.
+        """
+        sizes = {
+            "words": len(self.word_list),
+            "phrases": len(self.phrase_list),
+        }
+        if filename:
+            self.samplers = load_samplers(filename, sizes)
+        else:
+            self.samplers = {
+                kind: PermutationSampler(size) for kind, size in sizes.items()
+            }
+        self.sampler_filename = filename
+
+    def _draw(self, kind: str, difficulties: tuple[str, ...]) -> int | None:
+        # entries of other difficulties are skipped, at most one full pass.
+        # Called with the lock held, once the indexes are built
+        entries = self.get_entries(kind)
+        sampler = self.samplers[kind]
+        index = self.indexes[kind]
+        picked = None
+        for _ in range(len(entries)):
+            idx = sampler.draw()
+            if index.matches(idx, difficulties):
+                picked = idx
+                break
+        self.unsaved_draws += 1
+        return picked
+
+    def save_sampler(self) -> None:
+        """Write the sampler state to the file given to `use_sampler`
+
+        Done every `SAMPLER_SAVE_INTERVAL` picks, outside the lock, and
+        should be done at exit: after a crash the last few questions may
+        be asked again.
+        """
+        if not self.sampler_filename or self.samplers is None:
+            return
+        with self.lock:
+            states = {
+                kind: sampler.get_state()
+                for kind, sampler in self.samplers.items()
+            }
+            self.unsaved_draws = 0
+        with self.save_lock:
+            try:
+                save_states(self.sampler_filename, states)
+            except OSError:
+                pass
+
+    def pick(self, level: str) -> tuple[str, int, str]:
+        """Return a random entry for the menu `level`, and where it is
+
+        Returns:
+            - tuple[str, int, str]
+                `words` or `phrases`, the index of the entry in that list,
+                and the entry
+        """
+        kind, difficulties = LEVELS.get(level, LEVELS["intermediate"])
+        self.get_indexes()
+        with self.lock:
+            entries = self.get_entries(kind)
+            if self.samplers is not None:
+                idx = self._draw(kind, difficulties)
+            else:
+                idx = self.indexes[kind].pick(random, difficulties)
+            if idx is None:
+                idx = random.randrange(len(entries))
+            save = self.unsaved_draws >= SAMPLER_SAVE_INTERVAL
+        if save:
+            self.save_sampler()
+        return kind, idx, entries[idx]
+
+    def get_random(self, level: str) -> str:
+        """Return a random entry for the menu `level`"""
+        return self.pick(level)[2]
+
+
+def _extends(old, new) -> bool:
+    # `True` if `new` starts with every entry of `old`
+    if len(new) < len(old):
+        return False
+    if isinstance(old, list) and isinstance(new, list):
+        return new[:len(old)] == old
+    return all(a == b for a, b in zip(old, new))
 
-    def reset_is_typed(self) -> None:
-        """Resets `letter_was_typed` to all `False`"""
-        for letter in self.letter_was_typed:
-            self.letter_was_typed[letter] = False
+
+def _default_player() -> str:
+    # imported here, `stats` pulls in sqlite3 which only recording needs
+    try:
+        from .stats import default_player
+    except ImportError:
+        from stats import default_player
+    return default_player()
+
+
+# green for letters in the answer, red for the others
+LETTER_STYLES = {UNTYPED: "", HIT: "\033[32m", MISS: "\033[31m"}
+# typed instead of a letter to show the solver's next guess
+HINT_KEY = "?"
 
 
 class Game:
@@ -70,39 +457,85 @@ class Game:
         assets,
         word_list: list[str],
         phrase_list: list[str],
+        output=None,
+        geometry=None,
+        data_source: str | None = None,
+        data: Data | None = None,
+        stats=None,
+        snapshots=None,
     ) -> None:
-        self.data = Data(word_list, phrase_list)
+        self.output = output
+        self.geometry = geometry or TerminalGeometry()
+        self.renderer = Renderer(output, geometry=self.geometry)
+        if data is not None:
+            # shared by many sessions or still loading, set up by the caller
+            self.data = data
+        else:
+            self.data = Data(word_list, phrase_list, data_source)
+            if settings.get("no_repeat") == "true":
+                self.data.use_sampler(
+                    data_source + ".sampler" if data_source else None
+                )
         self.settings = settings
         self.assets = assets
-        self.state = {
-            "life": int(self.settings["start_life"]),
-            "hidden": [],
-            "answer": "",
-            "correct_counter": 0,
-            "won": False,
-        }
-        self.tracker = LetterTracker()
+        # the rules and their state, `state` and `tracker` are shared with it
+        self.engine = GameEngine(
+            int(self.settings["start_life"]),
+            self.settings.get("alphabet", string.ascii_lowercase),
+        )
+        self.state = self.engine.state
+        self.tracker = self.engine.tracker
+        self.hint: str | None = None
+        # finished games are recorded to `stats`, a `StatsStore`, if given
+        self.stats = None
+        self.player = settings.get("player") or ""
+        if stats is not None:
+            self.use_stats(stats)
+        self.level = ""
+        # list and index of the answer, `None` between games
+        self.question: tuple[str, int] | None = None
+        self.round_started = 0.0
+        # the game in progress is saved to slot `snapshot_slot` of
+        # `snapshots`, a `SnapshotFile`, if given
+        self.snapshots = snapshots
+        self.snapshot_slot = 0
+        # row of the rank line while the end screen is shown
+        self.rank_row: int | None = None
+        # called once the notice, the first screen, is drawn
+        self.on_notice = None
         self.timer = {
+            "scheduler": TimerScheduler(),
             "start_timer_thread": None,
+            "tick": None,
+            "active": None,
             "stop_event_thread": threading.Event(),
             "time_counter": int(self.settings["max_time"]),
-            "timer_is_stopped": {},
+            # clock time the current turn runs out, and the time left last
+            # drawn, so the timer line is only redrawn when it changes
+            "deadline": 0.0,
+            "shown": None,
             "thread_counter": 0,
             "skip_create_timer": False,
             "lock": threading.Lock(),
         }
 
-    def _center_text_helper(self, width: int, text: str) -> str:
-        return text.center(width)
+    def use_stats(self, stats) -> None:
+        """Record finished games to `stats`, a `StatsStore`
+
+        Games are recorded under the `player` setting, or the user name
+        when it is empty.
+        """
+        self.stats = stats
+        self.player = self.settings.get("player") or _default_player()
 
     def _get_terminal_width(self) -> int:
-        return shutil.get_terminal_size().columns
+        return self.geometry.width
 
     def _get_terminal_height(self) -> int:
-        return shutil.get_terminal_size().lines
+        return self.geometry.height
 
     def _clear_screen(self) -> None:
-        os.system("clear" if os.name == "posix" else "cls")
+        self.renderer.clear()
 
     def game_menu(self) -> None:
         """Displays the main menu and handle menu selection.
@@ -112,19 +545,20 @@ class Game:
         continues until user exits.
         """
         self._clear_screen()
-        print(
-            "Important:\n"
-            "The game uses ANSI escape codes. Please ensure your device\n"
-            "supports and maximise your terminal window for best\n"
-            "experience. Modern Windows or VS Code's terminal should\n"
-            "support ANSE escape sequence.\n\nThank you!\n"
-        )
-        _ = input("Press enter to continue.")
+        self._display_notice()
+        if self.on_notice is not None:
+            self.on_notice()
+        _ = input()
+
+        # a game cut short by the last run goes on where it stopped
+        level = self.resume_game()
+        if level is not None:
+            self._clear_screen()
+            self.start_game(level, resumed=True)
 
         self._clear_screen()
         self._display_menu()
-        choice = input(" " * (self._get_terminal_width() // 2 - int(
-            self.settings["menu_width"]) // 2) + "-> ")
+        choice = input()
 
         while choice != "3":
             self._clear_screen()
@@ -136,17 +570,45 @@ class Game:
                 self.start_game(action)
 
             self._display_menu()
-            choice = input(
-                " "
-                * (
-                    self._get_terminal_width() // 2
-                    - int(self.settings["menu_width"]) // 2
-                )
-                + "-> "
-            )
+            choice = input()
 
         self._clear_screen()
 
+    def _display_notice(self) -> None:
+        notice_text = [
+            "Important:",
+            "The game uses ANSI escape codes. Please ensure your device",
+            "supports and maximise your terminal window for best",
+            "experience. Modern Windows or VS Code's terminal should",
+            "support ANSE escape sequence.",
+            "",
+            "Thank you!",
+            "",
+        ]
+
+        frame = Frame()
+        for row, line in enumerate(notice_text, start=1):
+            frame.put(row, 1, line)
+        frame.put_prompt(len(notice_text) + 1, 1, "Press enter to continue.")
+        self.renderer.draw(frame)
+
+    def _menu_prompt(self) -> str:
+        return " " * (
+            self._get_terminal_width() // 2
+            - int(self.settings["menu_width"]) // 2
+        ) + "-> "
+
+    def _letter_prompt(self) -> str:
+        len_list = len(self.tracker.letter_list)
+        portion = len_list // 3
+        # *2-1 because of the additional space added when printing
+        width = len(
+            self.tracker.letter_list[portion:len_list - portion]
+        ) * 2 - 1
+        return " " * (
+            self._get_terminal_width() // 2 - width // 2
+        ) + "-> "
+
     def _display_menu(self) -> None:
         menu_text = [
             "",
@@ -164,15 +626,14 @@ class Game:
             "",
         ]
 
-        # move the curson to center the menu
-        print(
-            f"\033[{
-                self._get_terminal_height() // 2 - len(menu_text) // 2
-            };1H",
-            end="",
-        )
-        for line in menu_text:
-            print(self._center_text_helper(self._get_terminal_width(), line))
+        # start row to center the menu
+        row = self._get_terminal_height() // 2 - len(menu_text) // 2
+
+        frame = Frame()
+        for offset, line in enumerate(menu_text):
+            frame.put(row + offset, 1, self.geometry.center(line))
+        frame.put_prompt(row + len(menu_text), 1, self._menu_prompt())
+        self.renderer.draw(frame)
 
     def game_menu_helper(self, choice: str) -> str | None:
         """
@@ -187,21 +648,23 @@ class Game:
 
         return None
 
-    def start_game(self, level: str) -> None:
+    def start_game(self, level: str, resumed: bool = False) -> None:
         """Run the main game loop for a single session
 
         Parameters:
             - level : str
                 Difficulty level, selects word or phrase list
+            - resumed : bool
+                Play the game restored by `resume_game` instead of a new one
         """
-        self.get_question(level)
+        if not resumed:
+            self.get_question(level)
 
         while (
             not self.timer["stop_event_thread"].is_set()
             and self.state["life"] > 0
             and self.state["correct_counter"] < len(self.state["answer"])
         ):
-            self._clear_screen()
             self._print_question()
 
             if not self.timer["skip_create_timer"]:
@@ -209,17 +672,13 @@ class Game:
                 with self.timer["lock"]:
                     self.timer["skip_create_timer"] = True
 
-            len_list = len(self.tracker.letter_list)
-            portion = len_list // 3
-            # *2-1 because of the additional space added when printing
-            width = len(
-                self.tracker.letter_list[portion:len_list - portion]
-            ) * 2 - 1
-            letter_input = input(
-                "\n" + " " * (
-                    self._get_terminal_width() // 2 - width // 2
-                ) + "-> "
-            ).lower()
+            letter_input = self._read_guess()
+            if letter_input == HINT_KEY:
+                self.hint = self.get_hint()
+                with self.timer["lock"]:
+                    self.timer["skip_create_timer"] = True
+                continue
+            self.hint = None
 
             self.letter_in_question(letter_input)
             if letter_input == "":
@@ -231,72 +690,91 @@ class Game:
                 self._reset_timer(self.timer["thread_counter"] - 1)
 
         if not self.timer["stop_event_thread"].is_set():
-            if self.timer["start_timer_thread"]:
-                self.timer["start_timer_thread"].cancel()
+            with self.timer["lock"]:
+                self.timer["active"] = None
+                self._cancel_timers()
             self._game_end_menu()
             _ = input("")
 
         self.reset_game()
         self._clear_screen()
 
-    def _print_question(self) -> None:
-        gallows = self.assets.get_gallows(self.state["life"])
-
-        print(
-            f"\033[{self._get_terminal_height()//2 - (len(gallows)+6)//2};1H",
-            end="",
+    def get_hint(self) -> str | None:
+        """Returns the solver's best next guess for the current answer"""
+        return self.data.get_solver().next_guess(
+            self.state["hidden"], self.tracker
         )
 
-        for line in gallows:
-            print(self._center_text_helper(self._get_terminal_width(), line))
-
-        print()
-        print(
-            self._center_text_helper(
-                self._get_terminal_width(), " ".join(self.state["hidden"])
-            )
+    def _auto_play(self) -> bool:
+        return self.settings.get("auto_play") == "true"
+
+    def _read_guess(self) -> str:
+        # the bot types the hint after a short pause, so its play can be
+        # followed on screen
+        if not self._auto_play():
+            return input().lower()
+        time.sleep(float(self.settings.get("auto_play_delay", "0.5")))
+        guess = self.get_hint() or ""
+        self.renderer.write(guess)
+        return guess
+
+    def _print_question(self, keep_cursor: bool = False) -> None:
+        width = self._get_terminal_width()
+        height = self._get_terminal_height()
+        life = self.state["life"]
+        gallows = self.assets.get_rendered(
+            ("gallows", life),
+            (width, height),
+            lambda: self._render_gallows(life, width),
+        )
+        row = height // 2 - (len(gallows) + 6) // 2
+
+        frame = Frame()
+        for cells in gallows:
+            frame.put_row(row, cells)
+            row += 1
+
+        row += 1
+        frame.put(
+            row,
+            1,
+            self.geometry.center(" ".join(self.state["hidden"])),
         )
 
-        len_letter_list = len(self.tracker.letter_list)
+        letter_list = self.tracker.letter_list
+        statuses = self.tracker.statuses()
+        len_letter_list = len(letter_list)
         portion = len_letter_list // 3
-        list_of_letter_list = [
+        letter_rows = [
             # a-h
-            self.tracker.letter_list[:portion],
+            (0, portion),
             # i-r
-            self.tracker.letter_list[portion:len_letter_list-portion],
+            (portion, len_letter_list - portion),
             # s-z
-            self.tracker.letter_list[len_letter_list-portion:len_letter_list],
+            (len_letter_list - portion, len_letter_list),
         ]
 
-        for letter_list in list_of_letter_list:
-            print(
-                f"\n\033[{
-                    self._get_terminal_width()//2-len(letter_list)+1
-                }C", end=""
+        for start, end in letter_rows:
+            row += 1
+            col = width // 2 - (end - start) + 2
+            for idx in range(start, end):
+                style = LETTER_STYLES[statuses[idx]]
+                col = frame.put(row, col, letter_list[idx], style)
+                col = frame.put(row, col, " ")
+
+        frame.put_prompt(row + 2, 1, self._letter_prompt())
+        if self.hint:
+            frame.put(
+                row + 4, 1, self.geometry.center(f"Hint: try '{self.hint}'")
             )
-            for char in letter_list:
-                if self.tracker.is_typed(char):
-                    if char in self.state["answer"]:
-                        print("\033[32m", end="")
-                        print(char, end=" ")
-                    else:
-                        print("\033[31m", end="")
-                        print(char, end=" ")
-
-                    print("\033[39m", end="")
-                    continue
-                print(char, end=" ")
-
-        print()
+        self.renderer.draw(frame, keep_cursor)
 
     def reset_game(self) -> None:
         """Resets game state, tracker, and timer to their initial values"""
-        self.state["life"] = int(self.settings["start_life"])
-        self.state["hidden"] = []
-        self.state["answer"] = ""
-        self.state["correct_counter"] = 0
-        self.tracker.reset_is_typed()
-        self.state["won"] = False
+        self.engine.reset()
+        self.hint = None
+        self.rank_row = None
+        self.question = None
         self.timer["thread_counter"] = 0
         self.timer["time_counter"] = int(self.settings["max_time"])
         self.timer["skip_create_timer"] = False
@@ -309,17 +787,11 @@ class Game:
             - level : str
                 Difficulty level based on what user selects from menu
         """
-        if level == "basic":
-            self.state["answer"] = self.data.get_random_word()
-        else:
-            self.state["answer"] = self.data.get_random_phrase()
-
-        for letter in self.state["answer"]:
-            if letter == " ":
-                self.state["hidden"].append(" ")
-                self.state["correct_counter"] += 1
-            else:
-                self.state["hidden"].append("_")
+        kind, idx, answer = self.data.pick(level)
+        self.engine.new_round(answer)
+        self.question = (kind, idx)
+        self.level = level
+        self.round_started = time.monotonic()
 
     def letter_in_question(self, letter_input: str) -> None:
         """Process a guessed letter and update state, life, and counters
@@ -328,183 +800,263 @@ class Game:
             - letter_input : str
                 Guessed user input
         """
-        if (
-            letter_input in self.tracker.letter_was_typed
-            and self.tracker.is_typed(letter_input)
-        ):
-            return
-
-        self.tracker.mark_typed(letter_input)
-        if letter_input not in self.state["answer"]:
-            self.state["life"] -= 1
+        outcome = self.engine.guess(letter_input)
+        if outcome == WRONG or outcome == REVEALED:
+            # a new turn starts, with its own timer
             with self.timer["lock"]:
                 self.timer["skip_create_timer"] = False
-            return
+        self.save_snapshot()
 
-        if letter_input in self.state["hidden"]:
+    def save_snapshot(self) -> None:
+        """Save the game in progress to `snapshots`, if any
+
+        Done on every guess, at the start of every turn and at exit, not
+        on timer ticks: the time left is as of the last of these.
+        """
+        if self.snapshots is None or self.question is None:
             return
+        kind, idx = self.question
+        self.snapshots.write(
+            self.snapshot_slot,
+            pack(
+                LEVEL_CODES[self.level],
+                idx,
+                self.state["answer"],
+                self.tracker.typed,
+                self.state["life"],
+                self.timer["time_counter"],
+                len(self.tracker.letter_list),
+            ),
+        )
 
-        with self.timer["lock"]:
-            self.timer["skip_create_timer"] = False
-        for idx, char in enumerate(self.state["answer"]):
-            if self.state["answer"][idx] == letter_input:
-                self.state["hidden"][idx] = char
-                self.state["correct_counter"] += 1
+    def resume_game(self) -> str | None:
+        """Restore the game saved in `snapshots` by an earlier run
+
+        The answer is looked up in the corpus and the typed letters are
+        guessed again, then the lives and time left are restored.
 
-            if self.state["correct_counter"] >= len(self.state["answer"]):
-                self.state["won"] = True
+        Returns:
+            - str | None
+                Level of the restored game, `None` if there is no game to
+                resume or it does not match the corpus anymore
+        """
+        if self.snapshots is None:
+            return None
+        snapshot = unpack(
+            self.snapshots.get(self.snapshot_slot),
+            len(self.tracker.letter_list),
+        )
+        if snapshot is None or snapshot["level"] >= len(LEVELS):
+            return None
+        level = list(LEVELS)[snapshot["level"]]
+        kind = LEVELS[level][0]
+        entries = self.data.get_entries(kind)
+        idx = snapshot["index"]
+        if idx >= len(entries) or not matches(snapshot, entries[idx]):
+            return None
+
+        self.reset_game()
+        self.engine.new_round(entries[idx])
+        for bit, letter in enumerate(self.tracker.letter_list):
+            if snapshot["typed"] >> bit & 1:
+                self.engine.guess(letter)
+        self.state["life"] = snapshot["life"]
+        if self.engine.is_over():
+            self.reset_game()
+            return None
+        self.question = (kind, idx)
+        self.level = level
+        self.round_started = time.monotonic()
+        if snapshot["time_left"] > 0:
+            self.timer["time_counter"] = snapshot["time_left"]
+        return level
 
     def _reset_timer(self, idx: int) -> None:
+        with self.timer["lock"]:
+            if self.timer["active"] == idx:
+                self.timer["active"] = None
+            self._cancel_timers()
+            self.timer["time_counter"] = int(self.settings["max_time"])
+
+    def _cancel_timers(self) -> None:
+        # must be called with the lock held
         if self.timer["start_timer_thread"]:
             self.timer["start_timer_thread"].cancel()
-        self.timer["time_counter"] = int(self.settings["max_time"])
-        with self.timer["lock"]:
-            self.timer["timer_is_stopped"][idx] = True
+        if self.timer["tick"]:
+            self.timer["tick"].cancel()
 
     def _create_timer(self) -> None:
-        # creates new thread for timer to avoid blocking whole program
-        self.timer["start_timer_thread"] = threading.Timer(
-            int(self.settings["max_time"]),
-            self.timer_finished_thread,
-            args=(self.timer["thread_counter"],),
-        )
-        timer_display_thread = threading.Thread(
-            target=self._timer_display, args=(self.timer["thread_counter"],)
-        )
-        timer_countdown_thread = threading.Thread(
-            target=self._timer_countdown, args=(self.timer["thread_counter"],)
-        )
-
-        thread_counter = self.timer["thread_counter"]
+        # every turn is scheduled on the same scheduler thread instead of
+        # starting new threads, `thread_counter` identifies the current turn
+        idx = self.timer["thread_counter"]
+        scheduler = self.timer["scheduler"]
         with self.timer["lock"]:
-            self.timer["timer_is_stopped"][thread_counter] = False
-
-        self.timer["start_timer_thread"].start()
-        timer_display_thread.start()
-        timer_countdown_thread.start()
+            self._cancel_timers()
+            self.timer["active"] = idx
+            # a whole turn, or what was left of it in a resumed game
+            deadline = scheduler.clock() + self.timer["time_counter"]
+            self.timer["deadline"] = deadline
+            self.timer["shown"] = None
+            self.timer["start_timer_thread"] = scheduler.schedule_at(
+                deadline, self.timer_finished_thread, idx
+            )
+            self.timer["tick"] = scheduler.schedule(
+                0.01, self._timer_tick, idx
+            )
 
         self.timer["thread_counter"] += 1
+        self.save_snapshot()
 
     def timer_finished_thread(self, idx: int) -> None:
         """Handle end of timer - lose life, restart, or end game
 
         Parameter:
             - idx : int
-                Identifier for `timer_is_stopped`
+                Identifier of the turn the timer was created for
         """
         with self.timer["lock"]:
-            self.timer["timer_is_stopped"][idx] = True
-        with self.timer["lock"]:
+            if self.timer["active"] == idx:
+                self.timer["active"] = None
+                self._cancel_timers()
             self.timer["skip_create_timer"] = False
-        self.state["life"] -= 1
+        self.engine.lose_life()
         if self.state["life"] <= 0:
             self._game_end_menu()
             self.timer["stop_event_thread"].set()
             return
 
-        print("\033[s", end="")
-        self._print_question()
-        print("\033[u", end="", flush=True)
+        self._print_question(keep_cursor=True)
         self._reset_timer(self.timer["thread_counter"] - 1)
         self._create_timer()
 
-    def _timer_countdown(self, idx: int) -> None:
-        time.sleep(1)
-        while (
-            self.timer["time_counter"] > 0
-            and not self.timer["timer_is_stopped"][idx]
-        ):
-            with self.timer["lock"]:
-                self.timer["time_counter"] -= 1
-            time.sleep(1)
+    def _timer_tick(self, idx: int) -> None:
+        # runs when the time left is due to change: at whole seconds before
+        # the turn's deadline rather than a second after the last tick, so
+        # late wakeups do not add up. Stops rescheduling itself as soon as
+        # the turn is no longer active, the deadline itself ends the turn
+        scheduler = self.timer["scheduler"]
+        with self.timer["lock"]:
+            if self.timer["active"] != idx:
+                return
+            deadline = self.timer["deadline"]
+            time_counter = seconds_left(deadline, scheduler.clock())
+            self.timer["time_counter"] = time_counter
+            if time_counter <= 0:
+                return
+            if time_counter > 1:
+                self.timer["tick"] = scheduler.schedule_at(
+                    deadline - (time_counter - 1), self._timer_tick, idx
+                )
+            changed = time_counter != self.timer["shown"]
+            self.timer["shown"] = time_counter
+
+        if changed:
+            self._timer_display(time_counter)
 
-    def _timer_display(self, idx: int) -> None:
+    def _timer_display(self, time_counter: int) -> None:
         # Note:
-        # The timer is re-rendered whether the time has changed or not from
-        # the previous time because whole screen clears on any user input.
-        # However, the timer does not reset when:
-        #     1. User input == ""
-        #     2. User input was already typed
-        # Thus, in these two cases, the timer will not render immediately. A
-        # better logic can be made, but with time limitation, this solution is
-        # kept for now.
-        time.sleep(0.01)
-        while (
-            self.timer["time_counter"] > 0
-            and not self.timer["timer_is_stopped"][idx]
-        ):
-            print("\033[s", end="")
-            print("\033[1;1H", end="")
-            print("\033[K", end="")
-            print("Time left: ", end="")
-            if self.timer["time_counter"] <= 5:
-                print("\033[31m", end="")
-            print(self.timer["time_counter"])
-            print("\033[39m", end="")
-            print("\033[u", end="", flush=True)
-            time.sleep(0.05)
+        # The timer line is not part of the frame, so it is left alone by
+        # frame diffs and only redrawn on a tick, when its value changes.
+        # It is cleared with the rest of the screen at the end of a game.
+        text = "Time left: "
+        if time_counter <= 5:
+            text += "\033[31m"
+        self.renderer.write_at(1, text + str(time_counter))
+
+    def _render_gallows(
+        self, life: int, width: int
+    ) -> tuple[list[tuple[str, str]], ...]:
+        # centered cell rows of the gallows, cached in the assets
+        frame = Frame()
+        for row, line in enumerate(self.assets.get_gallows(life), 1):
+            frame.put(row, 1, line.center(width))
+        return tuple(frame.rows[row] for row in sorted(frame.rows))
 
     def _game_end_menu(self) -> None:
-        self._clear_screen()
+        width = self._get_terminal_width()
+        height = self._get_terminal_height()
+        won = self.state["won"]
+        screen, answer_row = self.assets.get_rendered(
+            ("end", won),
+            (width, height),
+            lambda: self._render_end_screen(won, width, height),
+        )
+
+        # only the answer changes between games, the rest is sent as is
+        frame = Frame()
+        frame.put(
+            answer_row, 1, ("Answer: " + self.state["answer"]).center(width)
+        )
+        frame.put_prompt(answer_row + 6, width // 2 + 1, "")
+        self.renderer.draw_encoded(
+            screen + self.renderer.paint(frame).encode("utf-8")
+        )
+        self.rank_row = answer_row + 4
+        if self.snapshots is not None:
+            # a finished game is not resumed
+            self.snapshots.write(self.snapshot_slot, b"")
+        self._record_game()
+
+    def _record_game(self) -> None:
+        # queued for the stats writer, the rank line is drawn once written
+        if self.stats is None:
+            return
+        self.stats.record(
+            self.player,
+            self.level,
+            self.state["answer"],
+            self.state["won"],
+            self.state["guesses"],
+            max(0, self.state["life"]),
+            time.monotonic() - self.round_started,
+            on_rank=self._show_rank,
+        )
 
-        print(
-            f"\033[{
-                self._get_terminal_height() // 2 -
-                len(self.assets.get_gallows(0)) // 2
-            };1H",
-            end="",
+    def _show_rank(self, rank: dict | None) -> None:
+        # called by the stats writer thread
+        row = self.rank_row
+        if rank is None or row is None:
+            return
+        text = (
+            f"Rank #{rank['rank']} of {rank['players']} in {rank['level']}"
+            f", win streak {rank['streak']}"
         )
+        self.renderer.write_at(row, self.geometry.center(text))
 
-        if self.state["won"]:
+    def _render_end_screen(
+        self, won: bool, width: int, height: int
+    ) -> tuple[bytes, int]:
+        # the end screen without its answer line, as encoded bytes that
+        # clear the screen first, and the row of the answer line
+        row = height // 2 - len(self.assets.get_gallows(0)) // 2 + 1
+
+        if won:
             text = "Congratulations!"
-            print("\033[32m\033[1m", end="")
-            print(
-                f"\n\033[{
-                    self._get_terminal_width() // 2 - len(text) // 2
-                }C",
-                end="",
-            )
-            print(text)
-            print("\033[39m\033[0m", end="")
-            end_text: list[str] = [
-                "",
-                self.assets.get_emoticon(self.state["won"]),
-                "",
-                "Answer: " + self.state["answer"],
-                "",
-                "That was good! Feel free to play again",
-                "",
-            ]
+            style = "\033[32m\033[1m"
+            message = "That was good! Feel free to play again"
         else:
             text = "Game Over!"
-            print("\033[31m\033[1m", end="")
-            print(
-                f"\n\033[{self._get_terminal_width() // 2 - len(text) // 2}C",
-                end="",
-            )
-            print(text)
-            print("\033[39m\033[0m", end="")
-            end_text: list[str] = [
-                "",
-                self.assets.get_emoticon(self.state["won"]),
-                "",
-                "Answer: " + self.state["answer"],
-                "",
-                "It's ok! You can try again.",
-                "",
-            ]
+            style = "\033[31m\033[1m"
+            message = "It's ok! You can try again."
+        end_text: list[str] = [
+            "",
+            self.assets.get_emoticon(won),
+            "",
+            "",
+            "",
+            message,
+            "",
+        ]
 
+        frame = Frame()
+        frame.put(row, width // 2 - len(text) // 2 + 1, text, style)
+        answer_row = row + 4
         for line in end_text:
-            print(self._center_text_helper(self._get_terminal_width(), line))
+            row += 1
+            frame.put(row, 1, line.center(width))
 
         text = "Press 'enter' to exit."
-        print(
-            f"\n\033[{
-                self._get_terminal_width() // 2 - len(text) // 2
-            }C",
-            end="",
-        )
-        print("\033[3m\033[2m", end="")
-        print(text, end="")
-        print("\033[0m\033[0m", end="")
-        print(f"\n\033[{self._get_terminal_width()//2}C", end="")
+        row += 2
+        frame.put(row, width // 2 - len(text) // 2 + 1, text, "\033[3m\033[2m")
+        screen = "\033[2J\033[H" + self.renderer.paint(frame)
+        return screen.encode("utf-8"), answer_row
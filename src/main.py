@@ -2,13 +2,18 @@
 
 This module locates configuration files, read settings and words/phrases data
 from a json file, and starts the game loop by creating a `Game` instance.
+
+Only the settings are read before the first screen is shown. Once the
+notice is drawn, the corpus is loaded by a background thread and the stats
+database, the game snapshot and the corpus watcher are opened while the
+notice waits for the player. Modules needed by optional features (asyncio,
+stats, metrics, the corpus watcher) are imported only when the feature is
+enabled.
 """
 
 import sys
 import os
 from read_json import ReadJson
-from game import Game
-from assets import Assets
 
 CURRENT_DIR = os.path.basename(os.getcwd())
 SETTINGS_FILENAME = (
@@ -16,6 +21,61 @@ SETTINGS_FILENAME = (
 )
 
 
+def watch_corpus(settings, data, reader, data_filename: str) -> None:
+    """Reload the corpus into `data` when its file changes, if enabled"""
+    if settings.get("watch_corpus") == "true":
+        from watcher import CorpusWatcher
+
+        CorpusWatcher(data, reader, data_filename).start()
+
+
+def load_data(settings, reader, data_filename: str):
+    """Returns the `Data` of the corpus, loaded once `start_load` is called"""
+    from game import Data
+
+    def load():
+        from corpus import load_corpus
+
+        corpus = load_corpus(reader, data_filename)
+        if corpus is None:
+            raise FileNotFoundError(data_filename)
+        return corpus
+
+    return Data.load_async(
+        load, data_filename, settings.get("no_repeat") == "true", start=False
+    )
+
+
+def local_path(filename: str) -> str:
+    """Returns `filename` of the settings relative to the current directory"""
+    return f"../{filename}" if CURRENT_DIR == "src" else filename
+
+
+def open_features(game, settings, reader, data_filename: str) -> None:
+    """Load the corpus and open what `settings` enables for `game`
+
+    Called once the notice is drawn, so that none of it holds up the first
+    screen: it is done while the notice waits for the player.
+    """
+    game.data.start_load()
+
+    if settings.get("stats_filename"):
+        from stats import StatsStore
+
+        game.use_stats(StatsStore(local_path(settings["stats_filename"])))
+
+    if settings.get("snapshot_filename"):
+        import string
+        from snapshot import SnapshotFile
+
+        game.snapshots = SnapshotFile(
+            local_path(settings["snapshot_filename"]),
+            len(settings.get("alphabet", string.ascii_lowercase)),
+        )
+
+    watch_corpus(settings, game.data, reader, data_filename)
+
+
 def main() -> None:
     """Start the application
 
@@ -32,19 +92,73 @@ def main() -> None:
         print(f"File {SETTINGS_FILENAME} not found")
         sys.exit()
 
-    data_filename = (
-        f"../{settings["data_filename"]}"
-        if CURRENT_DIR == "src"
-        else settings["data_filename"]
-    )
-    data = reader.get_data(data_filename)
-    if not data:
+    data_filename = local_path(settings["data_filename"])
+    if not os.path.exists(data_filename):
         print(f"File {settings["data_filename"]} not found")
         sys.exit()
-    word_list, phrase_list = data
+    data = load_data(settings, reader, data_filename)
+
+    # timings of the guess loop, written as JSON at exit
+    metrics = None
+    if settings.get("metrics") == "true":
+        from metrics import Metrics, instrument
+
+        metrics = Metrics()
+
+    from assets import Assets
+
+    game = None
+    try:
+        if settings.get("async_mode") == "true":
+            import asyncio
+            from async_game import AsyncGame
+
+            game = AsyncGame(
+                settings,
+                Assets(),
+                None,
+                None,
+                data_source=data_filename,
+                data=data,
+            )
+            if metrics:
+                instrument(game, metrics)
+            game.geometry.watch_resize()
+            game.on_notice = lambda: open_features(
+                game, settings, reader, data_filename
+            )
+            asyncio.run(game.game_menu())
+            return
+
+        from game import Game
 
-    game = Game(settings, Assets(), word_list, phrase_list)
-    game.game_menu()
+        game = Game(
+            settings,
+            Assets(),
+            None,
+            None,
+            data_source=data_filename,
+            data=data,
+        )
+        if metrics:
+            instrument(game, metrics)
+        game.geometry.watch_resize()
+        game.on_notice = lambda: open_features(
+            game, settings, reader, data_filename
+        )
+        game.game_menu()
+    finally:
+        # the no-repeat order is only saved every few picks while playing
+        data.save_sampler()
+        if game is not None and game.stats:
+            # games still queued are written before exiting
+            game.stats.close()
+        if game is not None and game.snapshots:
+            # the time left of a game cut short, it is not saved every tick
+            game.save_snapshot()
+            game.snapshots.close()
+        if metrics:
+            metrics.dump(local_path(settings["metrics_filename"]))
 
 
 if __name__ == "__main__":
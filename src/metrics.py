@@ -0,0 +1,231 @@
+"""Latency histograms for the hot paths of the Hangman game.
+
+This module provides the `Histogram` class, an HDR-style histogram with
+log-linear buckets (exact below 128, then 64 buckets per power of two, so
+any value is within 1.6% of its bucket), the `Metrics` class which names
+and dumps them, and `instrument` which times a game's guess loop: input,
+`letter_in_question`, `_print_question`, `_clear_screen`, the end screen
+and timer wakeups.
+
+Instrumentation wraps the methods of one game instance when metrics are
+enabled, so a game without metrics runs the plain methods at no cost.
+"""
+
+import functools
+import inspect
+import json
+import os
+import time
+
+# 2 ** SUB_BITS exact buckets, then 2 ** (SUB_BITS - 1) per power of two
+SUB_BITS = 7
+_SUB_COUNT = 1 << SUB_BITS
+_HALF = _SUB_COUNT >> 1
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class Histogram:
+    """Counts of integer values (nanoseconds) in log-linear buckets"""
+
+    def __init__(self) -> None:
+        self.counts: list[int] = [0] * _SUB_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket_of(value: int) -> int:
+        """Returns the bucket index of `value`"""
+        if value < _SUB_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BITS
+        return shift * _HALF + (value >> shift)
+
+    @staticmethod
+    def bucket_range(bucket: int) -> tuple[int, int]:
+        """Returns the lowest and highest value counted in `bucket`"""
+        if bucket < _SUB_COUNT:
+            return bucket, bucket
+        shift = bucket // _HALF - 1
+        low = (bucket - shift * _HALF) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Count `value`, negative values count as 0"""
+        value = max(0, value)
+        bucket = self.bucket_of(value)
+        counts = self.counts
+        if bucket >= len(counts):
+            counts.extend([0] * (bucket + 1 - len(counts)))
+        counts[bucket] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the counts of `other`"""
+        if not other.count:
+            return
+        if len(self.counts) < len(other.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for bucket, count in enumerate(other.counts):
+            self.counts[bucket] += count
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percent: float) -> int:
+        """Returns the value `percent`% of the counted values are at most
+
+        Like HDR histograms, this is the highest value of the bucket it
+        falls in, capped to the largest value recorded.
+        """
+        if not self.count:
+            return 0
+        # rank of the value, 1-based
+        rank = max(1, -int(-percent * self.count // 100))
+        for bucket, count in enumerate(self.counts):
+            rank -= count
+            if rank <= 0:
+                return min(self.bucket_range(bucket)[1], self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Returns the summary in microseconds and the non-empty buckets"""
+        summary = {
+            "count": self.count,
+            "min_us": self.min / 1000,
+            "mean_us": self.total / self.count / 1000 if self.count else 0,
+            "max_us": self.max / 1000,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent:g}_us"] = self.percentile(percent) / 1000
+        # [lowest value in ns, count], enough to merge runs offline
+        summary["buckets"] = [
+            [self.bucket_range(bucket)[0], count]
+            for bucket, count in enumerate(self.counts)
+            if count
+        ]
+        return summary
+
+
+class Metrics:
+    """Named histograms of durations"""
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+
+    def histogram(self, name: str) -> Histogram:
+        """Returns the histogram `name`, created on first use"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def record(self, name: str, seconds: float) -> None:
+        """Count a duration of `seconds` in the histogram `name`"""
+        self.histogram(name).record(int(seconds * 1e9))
+
+    def timed(self, name: str, function):
+        """Returns `function` wrapped to time every call in `name`"""
+        histogram = self.histogram(name)
+        clock = time.perf_counter_ns
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def timed_coroutine(*args, **kwargs):
+                start = clock()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    histogram.record(clock() - start)
+
+            return timed_coroutine
+
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start)
+
+        return timed_function
+
+    def to_dict(self) -> dict[str, dict]:
+        """Returns every histogram, see `Histogram.to_dict`"""
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(self.histograms.items())
+        }
+
+    def dump(self, filename: str) -> None:
+        """Write `to_dict` to `filename` as JSON"""
+        with open(filename + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=1)
+        os.replace(filename + ".tmp", filename)
+
+
+def instrument(game, metrics: Metrics) -> None:
+    """Time the guess loop of `game`, a `Game` or `AsyncGame`
+
+    Histograms:
+        - input : waiting for a guess (the player's think time)
+        - guess : `letter_in_question`
+        - render : `_print_question`, drawing the board
+        - input_to_frame : from a guess being read to the next board
+          being drawn, what the player sees as lag
+        - clear : `_clear_screen`
+        - end_screen : `_game_end_menu`
+        - timer_draw : redrawing the countdown
+        - timer_wakeup_late : how late the timer thread ran a callback
+    """
+    clock = time.perf_counter_ns
+    # when the last guess was read, 0 once its frame is drawn
+    read_at = [0]
+    to_frame = metrics.histogram("input_to_frame")
+
+    def guess_read() -> None:
+        read_at[0] = clock()
+
+    read_guess = metrics.timed("input", game._read_guess)
+    if inspect.iscoroutinefunction(read_guess):
+
+        async def _read_guess():
+            guess = await read_guess()
+            guess_read()
+            return guess
+
+    else:
+
+        def _read_guess():
+            guess = read_guess()
+            guess_read()
+            return guess
+
+    render = metrics.timed("render", game._print_question)
+
+    def _print_question(*args, **kwargs):
+        render(*args, **kwargs)
+        if read_at[0]:
+            to_frame.record(clock() - read_at[0])
+            read_at[0] = 0
+
+    game._read_guess = _read_guess
+    game._print_question = _print_question
+    game.letter_in_question = metrics.timed(
+        "guess", game.letter_in_question
+    )
+    game._clear_screen = metrics.timed("clear", game._clear_screen)
+    game._game_end_menu = metrics.timed("end_screen", game._game_end_menu)
+    game._timer_display = metrics.timed("timer_draw", game._timer_display)
+    late = metrics.histogram("timer_wakeup_late")
+    game.timer["scheduler"].on_wakeup = lambda seconds: late.record(
+        int(seconds * 1e9)
+    )
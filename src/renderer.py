@@ -0,0 +1,234 @@
+"""Frame-buffer terminal renderer for the Hangman game.
+
+This module provides the `Frame` class, which holds the content of one screen
+as rows of styled cells, and the `Renderer` class, which diffs a frame
+against the previously drawn one and writes only the changed cells with a
+single buffered write.
+"""
+
+import sys
+import threading
+
+RESET = "\033[0m"
+# unchanged cells rewritten instead of moving the cursor past them
+MERGE_GAP = 6
+
+
+class Frame:
+    """Screen content for one draw
+
+    Rows and columns are 1-based like ANSI cursor positions. Each cell is a
+    `(char, style)` tuple where `style` is the SGR escape sequence applied to
+    the character, or `""` for the default style.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[int, list[tuple[str, str]]] = {}
+        self.cursor: tuple[int, int] | None = None
+
+    def put(self, row: int, col: int, text: str, style: str = "") -> int:
+        """Write `text` starting at `row`/`col`
+
+        Returns:
+            - int
+                Column right after the written text
+        """
+        row = max(1, row)
+        col = max(1, col)
+        cells = self.rows.setdefault(row, [])
+        if len(cells) < col - 1:
+            cells.extend([(" ", "")] * (col - 1 - len(cells)))
+        for offset, char in enumerate(text):
+            idx = col - 1 + offset
+            if idx < len(cells):
+                cells[idx] = (char, style)
+            else:
+                cells.append((char, style))
+        return col + len(text)
+
+    def put_row(self, row: int, cells: list[tuple[str, str]]) -> None:
+        """Replace row `row` with a copy of already built `cells`"""
+        self.rows[max(1, row)] = list(cells)
+
+    def put_prompt(self, row: int, col: int, text: str) -> None:
+        """Write an input prompt and leave the cursor right after it"""
+        self.cursor = (max(1, row), self.put(row, col, text))
+
+
+class Renderer:
+    """Draws frames by writing only what changed since the last one
+
+    `output` defaults to whatever `sys.stdout` is at call time. Every draw is
+    sent with one `write` call, and `writes`/`bytes_written` count them.
+    """
+
+    def __init__(
+        self, output=None, diff: bool = True, geometry=None
+    ) -> None:
+        self.output = output
+        self.diff = diff
+        self.geometry = geometry
+        self.generation = geometry.generation if geometry else 0
+        self.previous: dict[int, list[tuple[str, str]]] | None = {}
+        self.writes = 0
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        """Write `text` with one call and flush it"""
+        if not text:
+            return
+        output = self.output or sys.stdout
+        with self.lock:
+            output.write(text)
+            output.flush()
+            self.writes += 1
+            self.bytes_written += len(text.encode("utf-8"))
+
+    def write_encoded(self, data: bytes) -> None:
+        """Write already encoded `data` with one call and flush it
+
+        Outputs with a `write_bytes` method or a binary `buffer` (like
+        `sys.stdout`) get `data` as is, others get it decoded.
+        """
+        if not data:
+            return
+        output = self.output or sys.stdout
+        with self.lock:
+            write_bytes = getattr(output, "write_bytes", None)
+            buffer = getattr(output, "buffer", None)
+            if write_bytes is not None:
+                write_bytes(data)
+            elif buffer is not None:
+                # text written before must not end up after `data`
+                output.flush()
+                buffer.write(data)
+            else:
+                output.write(data.decode("utf-8"))
+            output.flush()
+            self.writes += 1
+            self.bytes_written += len(data)
+
+    def draw_encoded(self, data: bytes) -> None:
+        """Draw a whole screen pre-rendered with `paint`
+
+        The next `draw` repaints everything, the renderer does not know
+        what `data` left on screen.
+        """
+        self.write_encoded(data)
+        self.previous = None
+
+    def paint(self, frame: Frame) -> str:
+        """Returns what `draw` writes for `frame` on a blank screen"""
+        parts: list[str] = []
+        for row in sorted(frame.rows):
+            self._diff_row(parts, row, [], frame.rows[row])
+        if frame.cursor:
+            parts.append(f"\033[{frame.cursor[0]};{frame.cursor[1]}H\033[K")
+        return "".join(parts)
+
+    def clear(self) -> None:
+        """Clear the whole screen and forget the previous frame"""
+        self.previous = {}
+        self.write("\033[2J\033[H")
+
+    def write_at(self, row: int, text: str) -> None:
+        """Replace line `row` with `text` without moving the cursor
+
+        Used for content that is not part of the frame, like the timer line.
+        """
+        self.write(f"\033[s\033[{row};1H\033[K{text}{RESET}\033[u")
+
+    def draw(self, frame: Frame, keep_cursor: bool = False) -> None:
+        """Draw `frame`, writing only cells that changed
+
+        Parameters:
+            - frame : Frame
+                Content of the whole screen
+            - keep_cursor : bool
+                Restore the cursor where it was instead of moving it to the
+                frame's prompt. Used when redrawing under a pending input.
+        """
+        parts: list[str] = []
+        if self.geometry and self.geometry.generation != self.generation:
+            # the layout moved with the resize, nothing on screen is reusable
+            self.generation = self.geometry.generation
+            self.previous = None
+        if not self.diff or self.previous is None:
+            parts.append("\033[2J\033[H")
+            self.previous = {}
+
+        for row in sorted(self.previous.keys() | frame.rows.keys()):
+            old = self.previous.get(row, [])
+            new = frame.rows.get(row, [])
+            if old != new:
+                self._diff_row(parts, row, old, new)
+
+        self.previous = {row: list(cells) for row, cells in frame.rows.items()}
+
+        if keep_cursor:
+            if parts:
+                parts.insert(0, "\033[s")
+                parts.append("\033[u")
+        elif frame.cursor:
+            # erase what was typed after the prompt last time
+            parts.append(f"\033[{frame.cursor[0]};{frame.cursor[1]}H\033[K")
+
+        self.write("".join(parts))
+
+    def _diff_row(
+        self,
+        parts: list[str],
+        row: int,
+        old: list[tuple[str, str]],
+        new: list[tuple[str, str]],
+    ) -> None:
+        if not (_is_ascii(old) and _is_ascii(new)):
+            # wide and combining characters do not take exactly one column,
+            # so cells cannot be addressed by position. Rewrite the whole row
+            parts.append(f"\033[{row};1H\033[2K")
+            self._write_cells(parts, new)
+            return
+
+        blank = (" ", "")
+        length = max(len(old), len(new))
+        col = 0
+        while col < length:
+            old_cell = old[col] if col < len(old) else blank
+            new_cell = new[col] if col < len(new) else blank
+            if old_cell == new_cell:
+                col += 1
+                continue
+
+            # extend the run over short unchanged gaps, rewriting a few
+            # cells is cheaper than another cursor move
+            start = col
+            end = col
+            while col < length and col - end <= MERGE_GAP:
+                old_cell = old[col] if col < len(old) else blank
+                new_cell = new[col] if col < len(new) else blank
+                col += 1
+                if old_cell != new_cell:
+                    end = col
+            col = end
+
+            run = new[start:end]
+            run += [blank] * (end - start - len(run))
+            parts.append(f"\033[{row};{start + 1}H")
+            self._write_cells(parts, run)
+
+    def _write_cells(
+        self, parts: list[str], cells: list[tuple[str, str]]
+    ) -> None:
+        style = ""
+        for char, cell_style in cells:
+            if cell_style != style:
+                parts.append(RESET + cell_style)
+                style = cell_style
+            parts.append(char)
+        if style:
+            parts.append(RESET)
+
+
+def _is_ascii(cells: list[tuple[str, str]]) -> bool:
+    return all(char.isascii() for char, _ in cells)
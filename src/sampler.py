@@ -0,0 +1,214 @@
+"""No-repeat question sampler for the Hangman game.
+
+This module provides the `PermutationSampler` class which walks a corpus in
+a random order without repeats. The order is a keyed Feistel permutation of
+the entry indexes, so nothing is copied or shuffled: the state is the seed,
+the number of completed passes and the position in the current pass.
+"""
+
+import json
+import os
+import random
+
+# fewer rounds leave a visible bias on lists of a few entries
+ROUNDS = 8
+_MASK32 = 0xFFFFFFFF
+
+
+class _Walk:
+    """Keyed Feistel permutation of `range(start, start + size)`"""
+
+    def __init__(
+        self, start: int, size: int, key: str, drawn: int = 0
+    ) -> None:
+        self.start = start
+        self.size = size
+        # positions of the permutation already drawn
+        self.drawn = drawn
+        bits = max(2, (size - 1).bit_length())
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        rng = random.Random(key)
+        self.keys = tuple(rng.getrandbits(32) for _ in range(ROUNDS))
+
+    def _encrypt(self, value: int) -> int:
+        half = self.half
+        mask = self.mask
+        left = value >> half
+        right = value & mask
+        for key in self.keys:
+            # 32 bit integer hash of the right half, keyed by the round key
+            mixed = ((right ^ key) * 0x9E3779B1) & _MASK32
+            mixed ^= mixed >> 16
+            mixed = (mixed * 0x85EBCA6B) & _MASK32
+            mixed ^= mixed >> 13
+            left, right = right, left ^ (mixed & mask)
+        return (left << half) | right
+
+    def at(self, position: int) -> int:
+        """Returns the index at `position` of the permutation"""
+        if not 0 <= position < self.size:
+            raise IndexError("sampler position out of range")
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return self.start + value
+
+
+class PermutationSampler:
+    """Visits every index in `range(size)` once per pass, in random order
+
+    The permutation is a balanced Feistel network over the smallest even
+    number of bits covering `size`. Outputs outside the range are encrypted
+    again (cycle walking), which keeps it a permutation of `range(size)`
+    and takes fewer than 4 rounds on average. Each pass uses new keys, so
+    consecutive passes have different orders.
+
+    A sampler `extend`ed during a pass walks the added indexes with their
+    own permutation, mixed in with the indexes left in the pass.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        seed: int | None = None,
+        epoch: int = 0,
+        position: int = 0,
+        walks: list[list[int]] | None = None,
+    ) -> None:
+        self.size = size
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.epoch = epoch
+        self.position = position
+        # [start, size, drawn] of each range walked in the current pass
+        if walks is None:
+            walks = [[0, size, position]]
+        self.walks = [
+            _Walk(start, length, self._key(start), drawn)
+            for start, length, drawn in walks
+        ]
+
+    def _key(self, start: int) -> str:
+        if start == 0:
+            return f"{self.seed}:{self.epoch}"
+        return f"{self.seed}:{self.epoch}:{start}"
+
+    def at(self, position: int) -> int:
+        """Returns the index at `position` of the current pass
+
+        Only defined for a pass not `extend`ed, the walks are mixed in a
+        random order otherwise.
+        """
+        return self.walks[0].at(position)
+
+    def draw(self) -> int:
+        """Returns the next index, starting a new pass after the last one"""
+        if self.position >= self.size:
+            self.epoch += 1
+            self.position = 0
+            self.walks = [_Walk(0, self.size, self._key(0))]
+        walk = self.walks[0] if len(self.walks) == 1 else self._choose()
+        value = walk.at(walk.drawn)
+        walk.drawn += 1
+        self.position += 1
+        return value
+
+    def _choose(self) -> _Walk:
+        # a walk picked with a chance proportional to the indexes it has
+        # left, which mixes them in a uniformly random order. Seeded by the
+        # position, so that a resumed sampler makes the same choices
+        rng = random.Random(f"{self.seed}:{self.epoch}:@{self.position}")
+        target = rng.randrange(self.size - self.position)
+        for walk in self.walks:
+            left = walk.size - walk.drawn
+            if target < left:
+                return walk
+            target -= left
+        raise AssertionError("sampler walks out of step with its position")
+
+    def extend(self, size: int) -> None:
+        """Grow to `range(size)` without starting a new pass
+
+        Indexes drawn in the current pass are still not drawn again before
+        it ends, the added ones are drawn along with those left.
+
+        Parameters:
+            - size : int
+                New size, at least the current one
+        """
+        if size < self.size:
+            raise ValueError("a sampler can only grow")
+        if size > self.size:
+            self.walks.append(
+                _Walk(self.size, size - self.size, self._key(self.size))
+            )
+            self.size = size
+
+    def get_state(self) -> dict:
+        """Returns the state needed to resume the same order"""
+        state = {
+            "size": self.size,
+            "seed": self.seed,
+            "epoch": self.epoch,
+            "position": self.position,
+        }
+        if len(self.walks) > 1:
+            state["walks"] = [
+                [walk.start, walk.size, walk.drawn] for walk in self.walks
+            ]
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "PermutationSampler":
+        """Resume a sampler from `get_state`"""
+        return cls(
+            state["size"],
+            state["seed"],
+            state["epoch"],
+            state["position"],
+            state.get("walks"),
+        )
+
+
+def save_samplers(
+    filename: str, samplers: dict[str, PermutationSampler]
+) -> None:
+    """Write the state of `samplers` to `filename`"""
+    save_states(
+        filename,
+        {name: sampler.get_state() for name, sampler in samplers.items()},
+    )
+
+
+def save_states(filename: str, states: dict[str, dict]) -> None:
+    """Write sampler states taken with `get_state` to `filename`"""
+    with open(filename + ".tmp", "w") as file:
+        json.dump(states, file)
+    os.replace(filename + ".tmp", filename)
+
+
+def load_samplers(
+    filename: str, sizes: dict[str, int]
+) -> dict[str, PermutationSampler]:
+    """Resume the samplers saved in `filename`
+
+    A new sampler is started for any name without a saved state, or whose
+    list no longer has the saved size.
+    """
+    try:
+        with open(filename) as file:
+            states = json.load(file)
+    except (OSError, ValueError):
+        states = {}
+
+    samplers = {}
+    for name, size in sizes.items():
+        state = states.get(name)
+        try:
+            if state and state["size"] == size:
+                samplers[name] = PermutationSampler.from_state(state)
+                continue
+        except (KeyError, TypeError):
+            pass
+        samplers[name] = PermutationSampler(size)
+    return samplers
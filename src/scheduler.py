@@ -0,0 +1,166 @@
+"""Single-thread timer scheduler for the Hangman game.
+
+This module provides the `TimerScheduler` class which runs every scheduled
+callback (turn deadline, countdown and redraw ticks) from one long-lived
+worker thread, using a heap of deadlines guarded by a condition variable.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class TimerHandle:
+    """Handle returned by `TimerScheduler.schedule`, used to cancel a timer"""
+
+    def __init__(self, scheduler, deadline: float, callback, args) -> None:
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the timer. Does nothing if it already ran"""
+        self.scheduler.cancel(self)
+
+
+class TimerScheduler:
+    """Runs delayed callbacks from a single worker thread
+
+    The worker thread is started lazily on the first `schedule` call and
+    keeps running until `shutdown`, so the number of threads stays the same
+    no matter how many timers are scheduled or cancelled.
+    """
+
+    def __init__(self, clock=time.monotonic) -> None:
+        # seconds of a monotonic clock, what deadlines are measured in
+        self.clock = clock
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._cancelled = 0
+        self._thread: threading.Thread | None = None
+        self._running = False
+        # called with how many seconds late each callback runs, if set
+        self.on_wakeup = None
+
+    def schedule(self, delay: float, callback, *args) -> TimerHandle:
+        """Run `callback(*args)` after `delay` seconds
+
+        Parameters:
+            - delay : float
+                Seconds to wait before running the callback
+            - callback : Callable
+                Function called from the scheduler thread
+
+        Returns:
+            - TimerHandle
+                Handle that can be used to cancel the timer
+        """
+        return self.schedule_at(self.clock() + delay, callback, *args)
+
+    def schedule_at(self, deadline: float, callback, *args) -> TimerHandle:
+        """Run `callback(*args)` once `clock` reaches `deadline`
+
+        Repeating timers scheduled at fixed deadlines, rather than a delay
+        after the previous run, do not drift when a callback runs late.
+
+        Parameters:
+            - deadline : float
+                Time of `clock` to run the callback at
+            - callback : Callable
+                Function called from the scheduler thread
+
+        Returns:
+            - TimerHandle
+                Handle that can be used to cancel the timer
+        """
+        handle = TimerHandle(self, deadline, callback, args)
+        with self._condition:
+            self._start()
+            heapq.heappush(self._heap, (deadline, next(self._counter), handle))
+            # only wake the worker if the new timer is the earliest one
+            if self._heap[0][2] is handle:
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        """Cancel `handle`. Cancelled entries are dropped lazily"""
+        with self._condition:
+            if handle.cancelled:
+                return
+            handle.cancelled = True
+            self._cancelled += 1
+            # compact once cancelled entries make up most of the heap, so
+            # memory stays bounded when many timers are cancelled early
+            if self._cancelled > 32 and self._cancelled * 2 > len(self._heap):
+                self._heap = [
+                    entry for entry in self._heap if not entry[2].cancelled
+                ]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def pending(self) -> int:
+        """Returns the number of timers that are still waiting to run"""
+        with self._condition:
+            return len(self._heap) - self._cancelled
+
+    def shutdown(self) -> None:
+        """Stop the worker thread and drop every pending timer"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._cancelled = 0
+            self._condition.notify()
+            thread = self._thread
+            self._thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self) -> None:
+        # must be called with the condition held
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="hangman-timer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                handle = self._next_due()
+                if handle is None:
+                    return
+            if self.on_wakeup is not None:
+                self.on_wakeup(self.clock() - handle.deadline)
+            handle.callback(*handle.args)
+
+    def _next_due(self) -> TimerHandle | None:
+        # must be called with the condition held. Blocks until a timer is due
+        # and returns it, or returns None once the scheduler is shut down
+        while self._running:
+            if not self._heap:
+                self._condition.wait()
+                continue
+
+            deadline, _, handle = self._heap[0]
+            if handle.cancelled:
+                heapq.heappop(self._heap)
+                self._cancelled -= 1
+                continue
+
+            remaining = deadline - self.clock()
+            if remaining > 0:
+                self._condition.wait(remaining)
+                continue
+
+            heapq.heappop(self._heap)
+            # mark as done so a late `cancel` does not count it twice
+            handle.cancelled = True
+            return handle
+
+        return None
@@ -0,0 +1,209 @@
+"""Multi-session TCP server for the Hangman game.
+
+Usage:
+
+    python src/server.py [port]
+
+Serves one `AsyncGame` per connection over a telnet-style line protocol,
+all sessions on one asyncio event loop. The corpus, its indexes and the
+`Assets` are loaded once and shared read-only by every session; each
+session only owns its game state, renderer and a countdown timer on the
+shared `TimerWheel`, which one clock task advances. Connect with
+`telnet localhost 2323` or `nc localhost 2323`.
+"""
+
+import asyncio
+import os
+import re
+import sys
+
+try:
+    from .assets import Assets
+    from .async_game import AsyncGame
+    from .corpus import load_corpus
+    from .game import Data
+    from .read_json import ReadJson
+    from .terminal import TerminalGeometry
+    from .timer_wheel import TimerWheel
+    from .watcher import CorpusWatcher
+except ImportError:
+    from assets import Assets
+    from async_game import AsyncGame
+    from corpus import load_corpus
+    from game import Data
+    from read_json import ReadJson
+    from terminal import TerminalGeometry
+    from timer_wheel import TimerWheel
+    from watcher import CorpusWatcher
+
+CURRENT_DIR = os.path.basename(os.getcwd())
+SETTINGS_FILENAME = (
+    "../settings.json" if CURRENT_DIR == "src" else "settings.json"
+)
+DEFAULT_PORT = 2323
+# screen size assumed for every client, telnet does not report it by default
+SCREEN_SIZE = (80, 24)
+# telnet option negotiation (IAC WILL/WONT/DO/DONT x, or IAC command)
+_TELNET_COMMAND = re.compile(rb"\xff[\xfb-\xfe].|\xff[\xf0-\xfa]", re.S)
+
+
+class StreamLineReader:
+    """Line source reading a client's `asyncio.StreamReader`"""
+
+    def __init__(self, reader: asyncio.StreamReader) -> None:
+        self.reader = reader
+
+    async def readline(self) -> str:
+        """Wait for the next line sent by the client
+
+        Raises `EOFError` when the client disconnects, like `input()`.
+        """
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError
+        line = _TELNET_COMMAND.sub(b"", line)
+        return line.decode("utf-8", "ignore").rstrip("\r\n")
+
+
+class StreamOutput:
+    """File-like output sending text to a client's `asyncio.StreamWriter`"""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+
+    def write(self, text: str) -> None:
+        """Queue `text` on the connection, dropped once it is closing"""
+        if not self.writer.is_closing():
+            self.writer.write(text.encode("utf-8"))
+
+    def write_bytes(self, data: bytes) -> None:
+        """Queue already encoded `data`, see `Renderer.write_encoded`"""
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    def flush(self) -> None:
+        """Nothing to do, the transport sends as soon as it can"""
+
+
+class HangmanServer:
+    """Accepts connections and runs a game session for each
+
+    Parameters:
+        - settings : dict[str, str]
+            Game settings shared by every session
+        - word_list, phrase_list : Sequence[str]
+            Corpus shared by every session
+        - data_source : str | None
+            Corpus file, for the cached difficulty indexes
+    """
+
+    def __init__(
+        self,
+        settings: dict[str, str],
+        word_list,
+        phrase_list,
+        data_source: str | None = None,
+    ) -> None:
+        self.settings = settings
+        self.assets = Assets()
+        self.data = Data(word_list, phrase_list, data_source)
+        if settings.get("no_repeat") == "true":
+            # one permutation for everyone, no player gets a repeat soon
+            self.data.use_sampler(
+                data_source + ".sampler" if data_source else None
+            )
+        # build the shared indexes now rather than in the first session
+        self.data.get_indexes()
+        # countdowns of every session, ticked by `wheel_task`
+        self.wheel = TimerWheel()
+        self.wheel_task: asyncio.Task | None = None
+        self.sessions = 0
+        self.served = 0
+        self.server: asyncio.Server | None = None
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+    ) -> asyncio.Server:
+        """Start listening, returns the `asyncio.Server`"""
+        if self.wheel_task is None:
+            self.wheel_task = asyncio.ensure_future(self.wheel.run())
+        self.server = await asyncio.start_server(
+            self.handle, host, port, backlog=4096
+        )
+        return self.server
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run one session until the client quits or disconnects"""
+        game = AsyncGame(
+            self.settings,
+            self.assets,
+            self.data.word_list,
+            self.data.phrase_list,
+            reader=StreamLineReader(reader),
+            output=StreamOutput(writer),
+            geometry=TerminalGeometry(SCREEN_SIZE),
+            data=self.data,
+            wheel=self.wheel,
+        )
+        self.sessions += 1
+        self.served += 1
+        try:
+            await game.game_menu()
+        except (EOFError, ConnectionError):
+            pass
+        finally:
+            game._stop_countdown()
+            self.sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(settings, data, data_source, port: int) -> None:
+    """Serve the game on `port` until interrupted"""
+    hangman = HangmanServer(settings, *data, data_source)
+    if settings.get("watch_corpus") == "true":
+        # every session picks from the new corpus once it is swapped in
+        CorpusWatcher(hangman.data, ReadJson(), data_source).start()
+    server = await hangman.start(
+        settings.get("server_host", "127.0.0.1"), port
+    )
+    print(f"Serving Hangman on port {port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        hangman.data.save_sampler()
+
+
+def main() -> None:
+    """Load the settings and corpus once, then serve sessions"""
+    reader = ReadJson()
+    settings = reader.get_settings(SETTINGS_FILENAME)
+    if not settings:
+        print(f"File {SETTINGS_FILENAME} not found")
+        sys.exit(1)
+
+    data_filename = (
+        f"../{settings["data_filename"]}"
+        if CURRENT_DIR == "src"
+        else settings["data_filename"]
+    )
+    data = load_corpus(reader, data_filename)
+    if not data:
+        print(f"File {settings["data_filename"]} not found")
+        sys.exit(1)
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
+    try:
+        asyncio.run(serve(settings, data, data_filename, port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Batch simulator for whole-corpus difficulty analysis.
+
+This module plays every answer of a corpus against many guess orders at
+once. Each game is one bit of a Python integer: letter sets, lives and
+letters left are bit-sliced across all games, so one step of a few
+integer operations advances every game by one guess. The results match
+`GameEngine.guess`, which `check_equivalence` verifies game by game.
+
+Run from the repository root to print the hardest and easiest entries:
+
+    python src/simulate.py [start_life] [strategy] [trials]
+
+where strategy is `random` (default) or `scripted`. The corpus is the
+`data_filename` of `settings.json`, and `start_life` defaults to its
+setting.
+"""
+
+import os
+import random
+import string
+import sys
+
+try:
+    from .corpus import load_corpus
+    from .engine import GameEngine
+    from .read_json import ReadJson
+except ImportError:
+    from corpus import load_corpus
+    from engine import GameEngine
+    from read_json import ReadJson
+
+CURRENT_DIR = os.path.basename(os.getcwd())
+SETTINGS_FILENAME = (
+    "../settings.json" if CURRENT_DIR == "src" else "settings.json"
+)
+
+# letters from the most to the least common in English
+SCRIPTED = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+def random_orders(
+    trials: int,
+    seed: int | None = None,
+    alphabet: str = string.ascii_lowercase,
+) -> list[str]:
+    """Returns `trials` random guess orders of every letter of `alphabet`"""
+    rng = random.Random(seed)
+    letters = list(alphabet)
+    orders = []
+    for _ in range(trials):
+        rng.shuffle(letters)
+        orders.append("".join(letters))
+    return orders
+
+
+def _segments(values: list[int], width: int) -> int:
+    # games are grouped by answer, `width` bits (a multiple of 8) per answer.
+    # Returns the mask with every game of answer `idx` set if `values[idx]`
+    full = b"\xff" * (width // 8)
+    empty = b"\x00" * (width // 8)
+    return int.from_bytes(
+        b"".join(full if value else empty for value in values), "little"
+    )
+
+
+def _counter(values: list[int], width: int, bits: int) -> list[int]:
+    # bit-sliced counter, slice `k` holds bit `k` of every game's value
+    return [
+        _segments([value >> k & 1 for value in values], width)
+        for k in range(bits)
+    ]
+
+
+def _decrement(counter: list[int], mask: int) -> None:
+    # subtract 1 from the games in `mask`, which must all be above 0
+    borrow = mask
+    for k, value in enumerate(counter):
+        counter[k] = value ^ borrow
+        borrow &= ~value
+        if not borrow:
+            return
+
+
+def _increment(counter: list[int], mask: int) -> None:
+    carry = mask
+    for k, value in enumerate(counter):
+        counter[k] = value ^ carry
+        carry &= value
+        if not carry:
+            return
+    counter.append(carry)
+
+
+def _segment_counts(mask: int, answers: int, width: int) -> list[int]:
+    # number of set bits in the games of each answer
+    data = mask.to_bytes(answers * width // 8, "little")
+    step = width // 8
+    return [
+        int.from_bytes(data[idx:idx + step], "little").bit_count()
+        for idx in range(0, len(data), step)
+    ]
+
+
+def simulate_counts(
+    answers, orders: list[str], start_life: int
+) -> tuple[list[int], list[int]]:
+    """Play every answer against every guess order
+
+    Parameters:
+        - answers : Sequence[str]
+            Words or phrases
+        - orders : list[str]
+            Guess orders, each a string of distinct letters. Game `j` of an
+            answer guesses the letters of `orders[j]` in turn.
+        - start_life : int
+            Lives at the start of a game
+
+    Returns:
+        - tuple[list[int], list[int]]
+            Per answer, the number of games won and the total number of
+            guesses made until the games ended
+    """
+    for order in orders:
+        if len(set(order)) != len(order):
+            raise ValueError(f"guess order {order!r} repeats a letter")
+
+    count = len(answers)
+    trials = len(orders)
+    # round up so every answer starts on a byte, padding games never play
+    width = max(8, (trials + 7) // 8 * 8)
+    if not count or not trials or start_life <= 0:
+        return [0] * count, [0] * count
+
+    alphabet = sorted(set("".join(orders)))
+    letter_sets = [set(answer) - {" "} for answer in answers]
+    has = {
+        letter: _segments([letter in letters for letters in letter_sets],
+                          width)
+        for letter in alphabet
+    }
+    # letters outside the guessed alphabet can never be revealed, count
+    # one letter more for them so they never reach 0
+    remaining_values = [
+        len(letters) + (not letters <= set(alphabet))
+        for letters in letter_sets
+    ]
+    remaining = _counter(
+        remaining_values, width, max(remaining_values).bit_length()
+    )
+    lives = _counter([start_life] * count, width, start_life.bit_length())
+
+    trial_mask = (1 << trials) - 1
+    played = int.from_bytes(
+        trial_mask.to_bytes(width // 8, "little") * count, "little"
+    )
+    # an answer without letters is over before the first guess, not won
+    alive = played & _segments(remaining_values, width)
+    won = 0
+    guesses: list[int] = [0]
+
+    for step in range(max(map(len, orders))):
+        # games guessing each letter at this step, the same pattern for
+        # every answer
+        patterns: dict[str, int] = {}
+        for trial, order in enumerate(orders):
+            if step < len(order):
+                patterns[order[step]] = patterns.get(order[step], 0) | (
+                    1 << trial
+                )
+        guessing = 0
+        hits = 0
+        for letter, pattern in patterns.items():
+            mask = int.from_bytes(
+                pattern.to_bytes(width // 8, "little") * count, "little"
+            )
+            guessing |= mask
+            hits |= mask & has[letter]
+        guessing &= alive
+        if not guessing:
+            break
+        hits &= guessing
+        misses = guessing & ~hits
+
+        _increment(guesses, guessing)
+        _decrement(remaining, hits)
+        _decrement(lives, misses)
+
+        any_remaining = 0
+        for value in remaining:
+            any_remaining |= value
+        any_life = 0
+        for value in lives:
+            any_life |= value
+        won_now = hits & ~any_remaining
+        lost_now = misses & ~any_life
+        won |= won_now
+        alive &= ~(won_now | lost_now)
+
+    wins = _segment_counts(won, count, width)
+    totals = [0] * count
+    for k, value in enumerate(guesses):
+        for idx, total in enumerate(_segment_counts(value, count, width)):
+            totals[idx] += total << k
+    return wins, totals
+
+
+def simulate(
+    answers, orders: list[str], start_life: int
+) -> list[tuple[float, float]]:
+    """Returns the win probability and mean guesses of every answer
+
+    See `simulate_counts` for the parameters.
+    """
+    wins, totals = simulate_counts(answers, orders, start_life)
+    trials = max(1, len(orders))
+    return [(won / trials, total / trials) for won, total in zip(wins, totals)]
+
+
+def play_counts(
+    answers, orders: list[str], start_life: int
+) -> tuple[list[int], list[int]]:
+    """`simulate_counts` computed one game at a time with `GameEngine`"""
+    engine = GameEngine(start_life)
+    wins = []
+    totals = []
+    for answer in answers:
+        won = total = 0
+        for order in orders:
+            engine.reset()
+            engine.new_round(answer)
+            for letter in order:
+                if engine.is_over():
+                    break
+                engine.guess(letter)
+                total += 1
+            won += engine.state["won"]
+        wins.append(won)
+        totals.append(total)
+    return wins, totals
+
+
+def check_equivalence(answers, orders: list[str], start_life: int) -> bool:
+    """Returns `True` if the batch and the engine agree on every answer"""
+    return simulate_counts(answers, orders, start_life) == play_counts(
+        answers, orders, start_life
+    )
+
+
+def main() -> None:
+    """Print the hardest and easiest entries of the data file"""
+    reader = ReadJson()
+    settings = reader.get_settings(SETTINGS_FILENAME)
+    if not settings:
+        print(f"File {SETTINGS_FILENAME} not found")
+        sys.exit(1)
+
+    data_filename = (
+        f"../{settings["data_filename"]}"
+        if CURRENT_DIR == "src"
+        else settings["data_filename"]
+    )
+    data = load_corpus(reader, data_filename)
+    if not data:
+        print(f"File {settings["data_filename"]} not found")
+        sys.exit(1)
+
+    start_life = (
+        int(sys.argv[1]) if len(sys.argv) > 1 else int(settings["start_life"])
+    )
+    strategy = sys.argv[2] if len(sys.argv) > 2 else "random"
+    trials = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+    orders = [SCRIPTED] if strategy == "scripted" else random_orders(trials)
+
+    word_list, phrase_list = data
+    for name, answers in (("words", word_list), ("phrases", phrase_list)):
+        results = sorted(
+            zip(simulate(answers, orders, start_life), answers)
+        )
+        print(f"{name}: {len(answers)} entries, {len(orders)} games each")
+        for (win_rate, guesses), answer in results[:5] + results[-5:]:
+            print(f"  {win_rate:>7.1%} {guesses:>5.1f}  {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Compact game snapshots for resuming an interrupted game.
+
+This module provides `pack`/`unpack` for a fixed-size binary snapshot of a
+game in progress and the `SnapshotFile` class which keeps one snapshot per
+slot in a file. A snapshot stores the answer as its index in the corpus
+(with a checksum of the answer, to notice a changed corpus), the typed
+letters as a bitmask, the lives and the time left in the turn: about 20
+bytes. A game saves it after every guess, at the start of every turn and
+on exit, not on timer ticks. Everything else is rebuilt by replaying the
+typed letters on the answer.
+"""
+
+import os
+import struct
+import threading
+import zlib
+
+VERSION = 1
+# version, level, life, time left, answer index, answer checksum. The
+# typed-letter mask follows, one bit per letter of the alphabet
+_HEADER = struct.Struct("<BBhhII")
+
+
+def record_size(alphabet_size: int) -> int:
+    """Returns the size of a snapshot for an alphabet of that many letters"""
+    return _HEADER.size + (alphabet_size + 7) // 8
+
+
+def pack(
+    level: int,
+    index: int,
+    answer: str,
+    typed: int,
+    life: int,
+    time_left: int,
+    alphabet_size: int,
+) -> bytes:
+    """Returns the snapshot of a game in progress
+
+    Parameters:
+        - level : int
+            Code of the menu level
+        - index : int
+            Index of the answer in its list
+        - answer : str
+            The answer, only its checksum is stored
+        - typed : int
+            `LetterTracker.typed` bitmask
+        - life, time_left : int
+            Lives left and seconds left in the turn
+        - alphabet_size : int
+            Letters in the tracker's alphabet
+    """
+    return _HEADER.pack(
+        VERSION,
+        level,
+        life,
+        time_left,
+        index,
+        zlib.crc32(answer.encode("utf-8")),
+    ) + typed.to_bytes((alphabet_size + 7) // 8, "little")
+
+
+def unpack(data: bytes | None, alphabet_size: int) -> dict | None:
+    """Returns the fields of a snapshot made by `pack`
+
+    Returns:
+        - dict | None
+            level, index, checksum, typed, life and time_left. `None` if
+            `data` is empty or not a snapshot of this version and alphabet
+    """
+    if not data or len(data) != record_size(alphabet_size):
+        return None
+    version, level, life, time_left, index, checksum = _HEADER.unpack_from(
+        data
+    )
+    if version != VERSION:
+        return None
+    return {
+        "level": level,
+        "index": index,
+        "checksum": checksum,
+        "typed": int.from_bytes(data[_HEADER.size:], "little"),
+        "life": life,
+        "time_left": time_left,
+    }
+
+
+def matches(snapshot: dict, answer: str) -> bool:
+    """Returns `True` if `answer` is the answer the snapshot was taken of"""
+    return snapshot["checksum"] == zlib.crc32(answer.encode("utf-8"))
+
+
+class SnapshotFile:
+    """File of fixed-size snapshot slots, e.g. one per session
+
+    The whole file is mirrored in memory. `put` only updates the mirror,
+    `flush` writes every slot changed since the last flush with a single
+    write, so many sessions can be saved in one operation. `write` does
+    both, for a single game saving on every guess.
+
+    Parameters:
+        - filename : str
+            Snapshot file, created if missing
+        - alphabet_size : int
+            Letters in the tracker's alphabet, sets the slot size
+    """
+
+    def __init__(self, filename: str, alphabet_size: int = 26) -> None:
+        self.filename = filename
+        self.size = record_size(alphabet_size)
+        # unbuffered, a flush is one seek and one write system call
+        mode = "r+b" if os.path.exists(filename) else "w+b"
+        self.file = open(filename, mode, buffering=0)
+        self.buffer = bytearray(self.file.read())
+        # byte range changed since the last flush
+        self.dirty_start = len(self.buffer)
+        self.dirty_end = 0
+        self.lock = threading.Lock()
+
+    def get(self, slot: int) -> bytes | None:
+        """Returns the snapshot in `slot`, `None` if it is empty"""
+        start = slot * self.size
+        data = bytes(self.buffer[start:start + self.size])
+        if len(data) < self.size or not any(data):
+            return None
+        return data
+
+    def put(self, slot: int, data: bytes) -> None:
+        """Store `data` in `slot`, written by the next `flush`"""
+        start = slot * self.size
+        end = start + self.size
+        with self.lock:
+            if len(self.buffer) < end:
+                self.buffer.extend(bytes(end - len(self.buffer)))
+            self.buffer[start:end] = data.ljust(self.size, b"\0")
+            self.dirty_start = min(self.dirty_start, start)
+            self.dirty_end = max(self.dirty_end, end)
+
+    def clear(self, slot: int) -> None:
+        """Empty `slot`, written by the next `flush`"""
+        self.put(slot, b"")
+
+    def flush(self) -> None:
+        """Write the slots changed since the last flush at once"""
+        with self.lock:
+            if self.dirty_start >= self.dirty_end:
+                return
+            self.file.seek(self.dirty_start)
+            self.file.write(self.buffer[self.dirty_start:self.dirty_end])
+            self.dirty_start = len(self.buffer)
+            self.dirty_end = 0
+
+    def write(self, slot: int, data: bytes) -> None:
+        """Store `data` in `slot` and write it now"""
+        self.put(slot, data)
+        self.flush()
+
+    def close(self) -> None:
+        """Write pending changes and close the file"""
+        self.flush()
+        self.file.close()
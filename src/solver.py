@@ -0,0 +1,159 @@
+"""Next-guess solver for hints and the auto-play bot.
+
+This module provides the `Solver` class which indexes a word/phrase list
+by (length, position, letter) into candidate bitsets, one bit per entry of
+that length. Narrowing the candidates down to the ones matching the hidden
+pattern and the typed letters is then a few integer operations per step,
+independent of how many entries the list has.
+"""
+
+import array
+import bisect
+
+
+class Solver:
+    """Picks the letter most likely to be in the answer
+
+    Candidates are the entries with the answer's length whose letters match
+    every revealed position, that contain no missed letter, and that do not
+    have a found letter at a hidden position (it would have been revealed).
+    The next guess is the untyped letter found in the most candidates.
+    """
+
+    def __init__(self, *sources) -> None:
+        # first global id of each source, to map ids back to entries
+        self.sources = sources
+        self.starts: list[int] = []
+        # length -> global ids of the entries of that length, in bit order
+        self.ids: dict[int, array.array] = {}
+        # length -> position -> letter -> candidates with it there
+        self.positions: dict[int, list[dict[str, int]]] = {}
+        # length -> letter -> candidates containing it
+        self.letters: dict[int, dict[str, int]] = {}
+
+        start = 0
+        for source in sources:
+            self.starts.append(start)
+            for offset, entry in enumerate(source):
+                self.ids.setdefault(len(entry), array.array("I")).append(
+                    start + offset
+                )
+            start += len(source)
+
+        for length, ids in self.ids.items():
+            self._index_length(length, ids)
+
+    def _index_length(self, length: int, ids: array.array) -> None:
+        size = (len(ids) + 7) // 8
+        positions: list[dict[str, bytearray]] = [{} for _ in range(length)]
+        letters: dict[str, bytearray] = {}
+        for bit, entry_id in enumerate(ids):
+            byte = bit >> 3
+            mask = 1 << (bit & 7)
+            entry = self.entry(entry_id)
+            for position, letter in enumerate(entry):
+                bits = positions[position].get(letter)
+                if bits is None:
+                    bits = positions[position][letter] = bytearray(size)
+                bits[byte] |= mask
+            for letter in set(entry):
+                bits = letters.get(letter)
+                if bits is None:
+                    bits = letters[letter] = bytearray(size)
+                bits[byte] |= mask
+
+        self.positions[length] = [
+            {
+                letter: int.from_bytes(bits, "little")
+                for letter, bits in at_position.items()
+            }
+            for at_position in positions
+        ]
+        self.letters[length] = {
+            letter: int.from_bytes(bits, "little")
+            for letter, bits in letters.items()
+        }
+
+    def entry(self, entry_id: int) -> str:
+        """Returns the entry with the global id `entry_id`"""
+        idx = bisect.bisect_right(self.starts, entry_id) - 1
+        return self.sources[idx][entry_id - self.starts[idx]]
+
+    def _typed(self, tracker) -> tuple[list[str], list[str], list[str]]:
+        # (found, missed, untyped) letters of the tracker's alphabet
+        found: list[str] = []
+        missed: list[str] = []
+        untyped: list[str] = []
+        for idx, letter in enumerate(tracker.letter_list):
+            if not tracker.typed >> idx & 1:
+                untyped.append(letter)
+            elif tracker.hit >> idx & 1:
+                found.append(letter)
+            else:
+                missed.append(letter)
+        return found, missed, untyped
+
+    def _candidates(self, hidden: list[str], found, missed) -> int:
+        length = len(hidden)
+        positions = self.positions.get(length)
+        if positions is None:
+            return 0
+        letters = self.letters[length]
+
+        candidates = (1 << len(self.ids[length])) - 1
+        for position, char in enumerate(hidden):
+            if char != "_":
+                candidates &= positions[position].get(char, 0)
+            else:
+                for letter in found:
+                    candidates &= ~positions[position].get(letter, 0)
+            if not candidates:
+                return 0
+        for letter in missed:
+            candidates &= ~letters.get(letter, 0)
+        return candidates
+
+    def candidates(self, hidden: list[str], tracker) -> list[str]:
+        """Returns the entries matching the hidden pattern and typed letters"""
+        found, missed, _ = self._typed(tracker)
+        candidates = self._candidates(hidden, found, missed)
+        ids = self.ids.get(len(hidden))
+        matches = []
+        while candidates:
+            low = candidates & -candidates
+            matches.append(self.entry(ids[low.bit_length() - 1]))
+            candidates ^= low
+        return matches
+
+    def next_guess(self, hidden: list[str], tracker) -> str | None:
+        """Returns the best letter to guess next
+
+        Parameters:
+            - hidden : list[str]
+                Hidden answer, `_` for letters not found yet
+            - tracker : LetterTracker
+                Letters typed so far
+
+        Returns:
+            - str | None
+                The untyped letter in the most candidates. When no entry
+                matches (the answer is not in the list), the untyped letter
+                in the most entries of that length. `None` if every letter
+                was typed.
+        """
+        found, missed, untyped = self._typed(tracker)
+        if not untyped:
+            return None
+
+        candidates = self._candidates(hidden, found, missed)
+        if not candidates:
+            candidates = (1 << len(self.ids.get(len(hidden), ()))) - 1
+        letters = self.letters.get(len(hidden), {})
+
+        best = untyped[0]
+        best_count = -1
+        for letter in untyped:
+            count = (candidates & letters.get(letter, 0)).bit_count()
+            if count > best_count:
+                best, best_count = letter, count
+        return best
@@ -0,0 +1,318 @@
+"""Persistent player stats and leaderboard for the Hangman game.
+
+This module provides the `StatsStore` class which records every finished
+game to a SQLite database. Games are queued and written in batches by a
+background thread, so recording one never waits on the disk. Besides the
+log of games, a summary row per player and level (games, wins, streaks) is
+kept up to date in the same transaction, so leaderboard, streak and rank
+queries read a few indexed rows instead of scanning every game.
+"""
+
+import getpass
+import queue
+import sqlite3
+import threading
+import time
+
+# games written per transaction at most
+BATCH_SIZE = 256
+# seconds a queued game may wait for others to share its transaction
+FLUSH_INTERVAL = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    level TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    lives INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    seconds_per_guess REAL NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_player ON games (player, level, id);
+CREATE TABLE IF NOT EXISTS players (
+    player TEXT NOT NULL,
+    level TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    PRIMARY KEY (player, level)
+);
+CREATE INDEX IF NOT EXISTS players_wins ON players (level, wins DESC, games);
+CREATE INDEX IF NOT EXISTS players_streak
+    ON players (level, best_streak DESC, games);
+"""
+
+_INSERT_GAME = """
+INSERT INTO games (
+    player, level, answer, won, guesses, lives, seconds,
+    seconds_per_guess, finished
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# a win extends the current streak, a loss ends it
+_UPDATE_PLAYER = """
+INSERT INTO players VALUES (:player, :level, 1, :won, :won, :won)
+ON CONFLICT (player, level) DO UPDATE SET
+    games = games + 1,
+    wins = wins + excluded.wins,
+    streak = CASE WHEN excluded.wins THEN streak + 1 ELSE 0 END,
+    best_streak = MAX(
+        best_streak, CASE WHEN excluded.wins THEN streak + 1 ELSE 0 END
+    )
+"""
+
+# marks queued between games, see `_write_loop`
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+def default_player() -> str:
+    """Returns the name of the logged in user, or `player`"""
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "player"
+
+
+class StatsStore:
+    """SQLite store of finished games, written by a background thread
+
+    Parameters:
+        - filename : str
+            Database file, created if missing. `:memory:` is not supported,
+            the writer and the queries use separate connections.
+        - batch_size : int
+            Games written per transaction at most
+        - flush_interval : float
+            Seconds a queued game waits for others before being written
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ) -> None:
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: queue.Queue = queue.Queue()
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        # `on_rank` callbacks that raised
+        self.callback_errors = 0
+
+        # the writer's connection; creates the schema before any query
+        self.writer = sqlite3.connect(filename, check_same_thread=False)
+        # readers do not wait for the writer's transactions
+        self.writer.execute("PRAGMA journal_mode=WAL")
+        self.writer.execute("PRAGMA synchronous=NORMAL")
+        self.writer.executescript(_SCHEMA)
+        self.reader = sqlite3.connect(filename, check_same_thread=False)
+        self.reader_lock = threading.Lock()
+
+        self.thread = threading.Thread(target=self._write_loop, daemon=True)
+        self.thread.start()
+
+    def record(
+        self,
+        player: str,
+        level: str,
+        answer: str,
+        won: bool,
+        guesses: int,
+        lives: int,
+        seconds: float,
+        on_rank=None,
+    ) -> None:
+        """Queue a finished game, returns without waiting for the write
+
+        Parameters:
+            - player, level, answer : str
+                Who played, at which level, and the answer
+            - won : bool
+                Whether the answer was found
+            - guesses : int
+                Letters guessed, repeats not counted
+            - lives : int
+                Lives left at the end
+            - seconds : float
+                Time the game took
+            - on_rank : Callable[[dict], None] | None
+                Called from the writer thread with the player's `rank`
+                once the game is written
+        """
+        seconds_per_guess = seconds / guesses if guesses else 0.0
+        self.queue.put(
+            (
+                (
+                    player,
+                    level,
+                    answer,
+                    int(won),
+                    guesses,
+                    lives,
+                    seconds,
+                    seconds_per_guess,
+                    time.time(),
+                ),
+                on_rank,
+            )
+        )
+
+    def flush(self) -> None:
+        """Wait until every game queued so far is written"""
+        self.queue.put(_FLUSH)
+        self.queue.join()
+
+    def close(self) -> None:
+        """Write what is queued and stop the writer"""
+        if self.thread.is_alive():
+            self.queue.put(_STOP)
+            self.thread.join()
+        self.reader.close()
+
+    def _write_loop(self) -> None:
+        # a batch ends when it is full, when it waited `flush_interval`,
+        # or at a flush/stop mark
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while (
+                len(batch) < self.batch_size
+                and batch[-1] != _FLUSH
+                and batch[-1] != _STOP
+            ):
+                try:
+                    batch.append(
+                        self.queue.get(
+                            timeout=max(0.0, deadline - time.monotonic())
+                        )
+                    )
+                except queue.Empty:
+                    break
+
+            games = [item for item in batch if isinstance(item, tuple)]
+            stop = batch[-1] == _STOP
+            try:
+                if games:
+                    self._write(games)
+            except sqlite3.Error:
+                # stats are not worth ending the game over, drop the batch
+                self.errors += 1
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+        self.writer.close()
+
+    def _write(self, games: list[tuple]) -> None:
+        with self.writer:
+            self.writer.executemany(_INSERT_GAME, [row for row, _ in games])
+            self.writer.executemany(
+                _UPDATE_PLAYER,
+                [
+                    {"player": row[0], "level": row[1], "won": row[3]}
+                    for row, _ in games
+                ],
+            )
+        self.written += len(games)
+        self.batches += 1
+
+        for row, on_rank in games:
+            if on_rank is None:
+                continue
+            rank = self._rank(self.writer, row[0], row[1])
+            try:
+                on_rank(rank)
+            except Exception:
+                # the writer must outlive a failing callback, or every game
+                # queued later stays unwritten and `flush` never returns
+                self.callback_errors += 1
+
+    def _rank(self, connection, player: str, level: str) -> dict | None:
+        summary = connection.execute(
+            "SELECT games, wins, streak, best_streak FROM players"
+            " WHERE player = ? AND level = ?",
+            (player, level),
+        ).fetchone()
+        if summary is None:
+            return None
+        games, wins, streak, best_streak = summary
+        # more wins, or as many in fewer games
+        ahead, players = connection.execute(
+            "SELECT"
+            " (SELECT COUNT(*) FROM players WHERE level = :level"
+            "  AND (wins > :wins OR (wins = :wins AND games < :games))),"
+            " (SELECT COUNT(*) FROM players WHERE level = :level)",
+            {"level": level, "wins": wins, "games": games},
+        ).fetchone()
+        return {
+            "player": player,
+            "level": level,
+            "rank": ahead + 1,
+            "players": players,
+            "games": games,
+            "wins": wins,
+            "streak": streak,
+            "best_streak": best_streak,
+        }
+
+    def rank(self, player: str, level: str) -> dict | None:
+        """Returns the player's standing at `level`
+
+        Returns:
+            - dict | None
+                rank (1 is the best), players, games, wins, streak and
+                best_streak. `None` if the player has no written game there
+        """
+        with self.reader_lock:
+            return self._rank(self.reader, player, level)
+
+    def leaderboard(self, level: str, limit: int = 10) -> list[tuple]:
+        """Returns the `limit` players with the most wins at `level`
+
+        Returns:
+            - list[tuple[str, int, int]]
+                (player, wins, games), ties going to fewer games
+        """
+        with self.reader_lock:
+            return self.reader.execute(
+                "SELECT player, wins, games FROM players WHERE level = ?"
+                " ORDER BY wins DESC, games LIMIT ?",
+                (level, limit),
+            ).fetchall()
+
+    def streaks(self, level: str, limit: int = 10) -> list[tuple]:
+        """Returns the `limit` longest win streaks at `level`
+
+        Returns:
+            - list[tuple[str, int, int]]
+                (player, best_streak, streak), the current streak last
+        """
+        with self.reader_lock:
+            return self.reader.execute(
+                "SELECT player, best_streak, streak FROM players"
+                " WHERE level = ? ORDER BY best_streak DESC, games LIMIT ?",
+                (level, limit),
+            ).fetchall()
+
+    def history(self, player: str, level: str, limit: int = 10) -> list:
+        """Returns the player's last `limit` games at `level`, newest first
+
+        Returns:
+            - list[tuple[str, int, int, int, float]]
+                (answer, won, guesses, lives, seconds) of each game
+        """
+        with self.reader_lock:
+            return self.reader.execute(
+                "SELECT answer, won, guesses, lives, seconds FROM games"
+                " WHERE player = ? AND level = ? ORDER BY id DESC LIMIT ?",
+                (player, level, limit),
+            ).fetchall()
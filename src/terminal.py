@@ -0,0 +1,110 @@
+"""Terminal geometry service for the Hangman game.
+
+This module provides the `TerminalGeometry` class which caches the terminal
+size, refreshes it when the terminal is resized, and caches centered lines
+so they are only laid out once per size.
+"""
+
+import shutil
+import signal
+import threading
+import time
+
+# how long a size is trusted when resizes cannot be signalled
+FALLBACK_TTL = 1.0
+MAX_CENTERED = 1024
+
+
+class TerminalGeometry:
+    """Cached terminal size and centered layout
+
+    With `size` given, the geometry is fixed (e.g. for a network session).
+    Otherwise the size is read once and refreshed on SIGWINCH after
+    `watch_resize`, or at most once per second on platforms without it. With
+    `cache` off every lookup queries the terminal, as before the cache.
+    """
+
+    def __init__(
+        self, size: tuple[int, int] | None = None, cache: bool = True
+    ) -> None:
+        self.fixed = size is not None
+        self.cache = cache
+        self.columns, self.lines = size if size else (80, 24)
+        # bumped on every size change, renderers compare it to redraw
+        self.generation = 0
+        self._stale = not self.fixed
+        self._expires = 0.0
+        self._watching = False
+        self._centered: dict[str, str] = {}
+
+    def watch_resize(self) -> bool:
+        """Refresh the size on SIGWINCH
+
+        Must be called from the main thread. Returns `False` when the
+        platform has no SIGWINCH, in which case the size expires instead.
+        """
+        if self.fixed or not hasattr(signal, "SIGWINCH"):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def on_resize(signum, frame) -> None:
+            # only flag it, the handler may interrupt a render
+            self._stale = True
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signal.SIGWINCH, on_resize)
+        self._watching = True
+        return True
+
+    def refresh(self) -> None:
+        """Read the terminal size again, dropping cached layout on change"""
+        self._stale = False
+        if not self._watching:
+            self._expires = time.monotonic() + FALLBACK_TTL
+        size = shutil.get_terminal_size()
+        if (size.columns, size.lines) != (self.columns, self.lines):
+            self.columns, self.lines = size.columns, size.lines
+            self._centered.clear()
+            self.generation += 1
+
+    def _check(self) -> None:
+        if self.fixed:
+            return
+        if (
+            not self.cache
+            or self._stale
+            or (not self._watching and time.monotonic() >= self._expires)
+        ):
+            self.refresh()
+
+    @property
+    def width(self) -> int:
+        """Terminal width in columns"""
+        self._check()
+        return self.columns
+
+    @property
+    def height(self) -> int:
+        """Terminal height in lines"""
+        self._check()
+        return self.lines
+
+    def center(self, text: str) -> str:
+        """Returns `text` centered to the terminal width
+
+        The result is cached until the next resize.
+        """
+        width = self.width
+        if not self.cache:
+            return text.center(width)
+
+        centered = self._centered.get(text)
+        if centered is None:
+            if len(self._centered) >= MAX_CENTERED:
+                self._centered.clear()
+            centered = self._centered[text] = text.center(width)
+        return centered
@@ -0,0 +1,144 @@
+"""Hashed timing wheel for per-session deadlines at server scale.
+
+This module provides the `TimerWheel` class which keeps timers in a ring of
+slots, one slot per clock tick. Arming, resetting and cancelling a timer is
+a dict insert or delete, and one tick only looks at the timers of the slot
+it reaches, so many thousands of sessions can each keep a countdown with a
+single clock driving all of them.
+"""
+
+import asyncio
+import time
+
+
+class WheelTimer:
+    """Timer armed on a `TimerWheel`, used to reset or cancel it"""
+
+    __slots__ = ("wheel", "callback", "args", "slot", "rounds")
+
+    def __init__(self, wheel, callback, args) -> None:
+        self.wheel = wheel
+        self.callback = callback
+        self.args = args
+        # slot index, or -1 when not armed
+        self.slot = -1
+        # full turns of the wheel left before it is due
+        self.rounds = 0
+
+    def cancel(self) -> None:
+        """Cancel the timer. Does nothing if it already ran"""
+        self.wheel.cancel(self)
+
+    def reset(self, delay: float) -> None:
+        """Run the timer `delay` seconds from now instead"""
+        self.wheel.reset(self, delay)
+
+
+class TimerWheel:
+    """Ring of `slots` timer buckets advanced every `resolution` seconds
+
+    Delays are rounded up to whole ticks. Timers longer than one turn of
+    the wheel stay in their slot and count the turns down. Callbacks run
+    from `tick`, which `advance` or `run` call as the clock moves.
+    """
+
+    def __init__(
+        self, resolution: float = 0.1, slots: int = 512, clock=time.monotonic
+    ) -> None:
+        self.resolution = resolution
+        self.clock = clock
+        # dicts as ordered sets, so removal is O(1) and order is kept
+        self.slots: list[dict[WheelTimer, None]] = [
+            {} for _ in range(slots)
+        ]
+        self.cursor = 0
+        self.armed = 0
+        self.ticked_to = clock()
+
+    def __len__(self) -> int:
+        return self.armed
+
+    def arm(self, delay: float, callback, *args) -> WheelTimer:
+        """Run `callback(*args)` after `delay` seconds
+
+        Returns:
+            - WheelTimer
+                Handle that can be used to reset or cancel the timer
+        """
+        timer = WheelTimer(self, callback, args)
+        self._insert(timer, delay)
+        return timer
+
+    def _insert(self, timer: WheelTimer, delay: float) -> None:
+        ticks = max(1, -int(-delay // self.resolution))
+        size = len(self.slots)
+        timer.slot = (self.cursor + ticks) % size
+        # the slot is passed (ticks - 1) // size times before it is due
+        timer.rounds = (ticks - 1) // size
+        self.slots[timer.slot][timer] = None
+        self.armed += 1
+
+    def cancel(self, timer: WheelTimer) -> None:
+        """Remove `timer` from the wheel. Does nothing if it is not armed"""
+        if timer.slot >= 0:
+            del self.slots[timer.slot][timer]
+            timer.slot = -1
+            self.armed -= 1
+
+    def reset(self, timer: WheelTimer, delay: float) -> None:
+        """Re-arm `timer` to run `delay` seconds from now
+
+        Works for timers that already ran or were cancelled too.
+        """
+        self.cancel(timer)
+        self._insert(timer, delay)
+
+    def tick(self) -> int:
+        """Move to the next slot and run the timers due there
+
+        Returns:
+            - int
+                Number of callbacks run
+        """
+        self.cursor = (self.cursor + 1) % len(self.slots)
+        slot = self.slots[self.cursor]
+        if not slot:
+            return 0
+
+        due = []
+        for timer in slot:
+            if timer.rounds:
+                timer.rounds -= 1
+            else:
+                due.append(timer)
+        for timer in due:
+            del slot[timer]
+            timer.slot = -1
+        self.armed -= len(due)
+
+        for timer in due:
+            # a callback may re-arm its own timer or cancel others
+            timer.callback(*timer.args)
+        return len(due)
+
+    def advance(self, now: float | None = None) -> int:
+        """Tick once for every `resolution` elapsed up to `now`
+
+        Returns:
+            - int
+                Number of callbacks run
+        """
+        now = self.clock() if now is None else now
+        fired = 0
+        while now - self.ticked_to >= self.resolution:
+            self.ticked_to += self.resolution
+            fired += self.tick()
+        return fired
+
+    async def run(self) -> None:
+        """Drive the wheel from the running event loop until cancelled"""
+        self.ticked_to = self.clock()
+        while True:
+            delay = self.ticked_to + self.resolution - self.clock()
+            await asyncio.sleep(max(0.0, delay))
+            self.advance()
@@ -0,0 +1,257 @@
+"""Multiprocess tournament of guessing strategies.
+
+Usage:
+
+    python src/tournament.py [strategy ...]
+
+Plays every word and phrase of the `data_filename` from `settings.json` with
+each strategy (default: all of `STRATEGIES`) on all cores and prints the
+win rate and mean guesses of each. A strategy can also be given as
+`module:function`, a factory like the ones in `STRATEGIES`.
+
+Games run on `GameEngine`, the rules behind `Game.letter_in_question`,
+without a terminal. The corpus is sharded into ranges of entries and every
+worker sends back one aggregate per range. With the fork start method the
+workers inherit the loaded corpus and the strategies (including the solver
+index) from the parent instead of receiving a pickled copy.
+"""
+
+import importlib
+import multiprocessing
+import os
+import random
+import sys
+
+try:
+    from .corpus import load_corpus
+    from .engine import GameEngine
+    from .read_json import ReadJson
+    from .simulate import SCRIPTED
+    from .solver import Solver
+except ImportError:
+    from corpus import load_corpus
+    from engine import GameEngine
+    from read_json import ReadJson
+    from simulate import SCRIPTED
+    from solver import Solver
+
+CURRENT_DIR = os.path.basename(os.getcwd())
+SETTINGS_FILENAME = (
+    "../settings.json" if CURRENT_DIR == "src" else "settings.json"
+)
+CHUNK_SIZE = 256
+
+
+def random_strategy(word_list, phrase_list):
+    """Guesses any untyped letter"""
+
+    def guess(hidden, tracker, rng):
+        untyped = [
+            letter
+            for idx, letter in enumerate(tracker.letter_list)
+            if not tracker.typed >> idx & 1
+        ]
+        return rng.choice(untyped) if untyped else None
+
+    return guess
+
+
+def frequency_strategy(word_list, phrase_list):
+    """Guesses letters from the most to the least common in English"""
+
+    def guess(hidden, tracker, rng):
+        for letter in SCRIPTED:
+            if not tracker.is_typed(letter):
+                return letter
+        return None
+
+    return guess
+
+
+def solver_strategy(word_list, phrase_list):
+    """Guesses what `Solver` would hint"""
+    solver = Solver(word_list, phrase_list)
+
+    def guess(hidden, tracker, rng):
+        return solver.next_guess(hidden, tracker)
+
+    return guess
+
+
+# name -> factory(word_list, phrase_list) returning
+# guess(hidden, tracker, rng) -> letter, or None to give up
+STRATEGIES = {
+    "random": random_strategy,
+    "frequency": frequency_strategy,
+    "solver": solver_strategy,
+}
+
+# set in the parent before forking, or by `_init_worker`
+_corpus: tuple = ((), ())
+_players: dict = {}
+_start_life = 7
+_seed = 0
+
+
+def load_strategy(name: str):
+    """Returns the factory of a `STRATEGIES` name or `module:function`"""
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"unknown strategy {name!r}")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _setup(word_list, phrase_list, names, start_life, seed) -> None:
+    global _corpus, _players, _start_life, _seed
+    _corpus = (word_list, phrase_list)
+    _players = {
+        name: load_strategy(name)(word_list, phrase_list) for name in names
+    }
+    _start_life = start_life
+    _seed = seed
+
+
+def _init_worker(word_list, phrase_list, names, start_life, seed) -> None:
+    # only used without fork, the corpus is pickled once per worker
+    _setup(word_list, phrase_list, names, start_life, seed)
+
+
+def _play_chunk(task: tuple[int, int, int]) -> dict[str, list[int]]:
+    """Plays entries `start:stop` of list `kind` with every strategy
+
+    Returns [games, wins, guesses] per strategy name.
+    """
+    kind, start, stop = task
+    entries = _corpus[kind]
+    engine = GameEngine(_start_life)
+    # bounds a strategy that keeps guessing typed letters
+    max_guesses = 2 * len(engine.tracker.letter_list)
+    results = {}
+    for name, guess in _players.items():
+        games = wins = guesses = 0
+        for idx in range(start, stop):
+            rng = random.Random(f"{_seed}:{kind}:{idx}")
+            engine.reset()
+            engine.new_round(entries[idx])
+            for _ in range(max_guesses):
+                if engine.is_over():
+                    break
+                letter = guess(engine.state["hidden"], engine.tracker, rng)
+                if letter is None:
+                    break
+                engine.guess(letter)
+                guesses += 1
+            games += 1
+            wins += engine.state["won"]
+        results[name] = [games, wins, guesses]
+    return results
+
+
+def run_tournament(
+    word_list,
+    phrase_list,
+    names: list[str],
+    start_life: int,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = 0,
+) -> dict[str, dict[str, float]]:
+    """Play every entry with every strategy in `names`
+
+    Parameters:
+        - word_list, phrase_list : Sequence[str]
+            Corpus to play
+        - names : list[str]
+            Strategies, see `load_strategy`
+        - start_life : int
+            Lives at the start of a game
+        - processes : int | None
+            Worker processes, all cores when `None`. With 1 the games are
+            played in this process.
+        - chunk_size : int
+            Entries per task sent to a worker
+        - seed : int
+            Seed of the per-game random generators
+
+    Returns:
+        - dict[str, dict[str, float]]
+            games, wins, win_rate and mean_guesses per strategy
+    """
+    tasks = [
+        (kind, start, min(start + chunk_size, len(entries)))
+        for kind, entries in enumerate((word_list, phrase_list))
+        for start in range(0, len(entries), chunk_size)
+    ]
+    totals = {name: [0, 0, 0] for name in names}
+
+    def add(results: dict[str, list[int]]) -> None:
+        for name, counts in results.items():
+            for idx, count in enumerate(counts):
+                totals[name][idx] += count
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        _setup(word_list, phrase_list, names, start_life, seed)
+        for task in tasks:
+            add(_play_chunk(task))
+    elif "fork" in multiprocessing.get_all_start_methods():
+        # workers are forked after this, so they share the corpus pages
+        _setup(word_list, phrase_list, names, start_life, seed)
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            for results in pool.imap_unordered(_play_chunk, tasks):
+                add(results)
+    else:
+        with multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(
+                list(word_list), list(phrase_list), names, start_life, seed
+            ),
+        ) as pool:
+            for results in pool.imap_unordered(_play_chunk, tasks):
+                add(results)
+
+    return {
+        name: {
+            "games": games,
+            "wins": wins,
+            "win_rate": wins / games if games else 0.0,
+            "mean_guesses": guesses / games if games else 0.0,
+        }
+        for name, (games, wins, guesses) in totals.items()
+    }
+
+
+def main() -> None:
+    """Run the strategies named on the command line against the corpus"""
+    reader = ReadJson()
+    settings = reader.get_settings(SETTINGS_FILENAME)
+    if not settings:
+        print(f"File {SETTINGS_FILENAME} not found")
+        sys.exit(1)
+
+    data_filename = (
+        f"../{settings["data_filename"]}"
+        if CURRENT_DIR == "src"
+        else settings["data_filename"]
+    )
+    data = load_corpus(reader, data_filename)
+    if not data:
+        print(f"File {settings["data_filename"]} not found")
+        sys.exit(1)
+
+    names = sys.argv[1:] or list(STRATEGIES)
+    results = run_tournament(*data, names, int(settings["start_life"]))
+    print(f"{'strategy':<12} {'games':>8} {'win rate':>9} {'guesses':>8}")
+    for name, result in sorted(
+        results.items(), key=lambda item: -item[1]["win_rate"]
+    ):
+        print(f"{name:<12} {result['games']:>8} "
+              f"{result['win_rate']:>9.1%} {result['mean_guesses']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Corpus file watcher for reloading the word list without a restart.
+
+This module provides the `CorpusWatcher` class which checks the size and
+modification time of the corpus file from a background thread, and when
+they change, loads the file and hands it to `Data.reload`. Loading and
+indexing happen on the watcher's thread, the games only see the swap.
+"""
+
+import os
+import threading
+
+try:
+    from .corpus import load_corpus
+except ImportError:
+    from corpus import load_corpus
+
+# seconds between two checks of the file
+CHECK_INTERVAL = 1.0
+
+
+class CorpusWatcher:
+    """Reloads `filename` into `data` whenever the file changes
+
+    Parameters:
+        - data : Data
+            Corpus holder the new lists are swapped into
+        - reader : ReadJson
+            Reader for JSON corpora, see `load_corpus`
+        - filename : str
+            Corpus file to watch
+        - interval : float
+            Seconds between two checks
+    """
+
+    def __init__(
+        self, data, reader, filename: str, interval: float = CHECK_INTERVAL
+    ) -> None:
+        self.data = data
+        self.reader = reader
+        self.filename = filename
+        self.interval = interval
+        self.stamp = self._stamp()
+        self.reloads = 0
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def _stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def check(self) -> bool:
+        """Reload the corpus if the file changed since the last check
+
+        A file that cannot be parsed, e.g. caught halfway through being
+        written, is skipped until it changes again.
+
+        Returns:
+            - bool
+                `True` if a new corpus was swapped in
+        """
+        stamp = self._stamp()
+        if stamp is None or stamp == self.stamp:
+            return False
+        self.stamp = stamp
+        try:
+            corpus = load_corpus(self.reader, self.filename)
+        except (OSError, ValueError, KeyError):
+            return False
+        if corpus is None:
+            return False
+        self.data.reload(*corpus)
+        self.reloads += 1
+        return True
+
+    def start(self) -> None:
+        """Check the file every `interval` seconds until `stop`"""
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        """Stop checking, waits for a reload in progress"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
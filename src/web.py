@@ -0,0 +1,152 @@
+"""Browser entry point for the Hangman game, run by Pyodide.
+
+`static/index.html` copies the game into Pyodide's file system, either the
+sources one by one or the bundle made by `build_web.py`, then calls `start`
+to run an `AsyncGame` fed by the page's terminal. `save_warm_state` packs
+the game with its modules compiled once started, for the page to cache and
+unpack on the next load instead of the bundle.
+"""
+
+import asyncio
+import compileall
+import json
+import os
+import py_compile
+import zipfile
+
+try:
+    from .assets import Assets
+    from .async_game import AsyncGame, QueueReader
+    from .corpus import load_corpus
+    from .game import Data
+    from .read_json import ReadJson
+    from .terminal import TerminalGeometry
+except ImportError:
+    from assets import Assets
+    from async_game import AsyncGame, QueueReader
+    from corpus import load_corpus
+    from game import Data
+    from read_json import ReadJson
+    from terminal import TerminalGeometry
+
+# written into the bundle by `build_web.py`: its files, and the modification
+# times the cached difficulty indexes were made for
+BUNDLE_INFO = "bundle.json"
+SCREEN_SIZE = (100, 30)
+
+
+class TermWriter:
+    """File-like output handing the text to `write`, e.g. a JS function"""
+
+    def __init__(self, write) -> None:
+        self.write_text = write
+
+    def write(self, text: str) -> int:
+        self.write_text(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def read_bundle_info(root: str = ".") -> dict | None:
+    """Returns the `BUNDLE_INFO` of the bundle unpacked in `root`, if any"""
+    try:
+        with open(
+            os.path.join(root, BUNDLE_INFO), "r", encoding="utf-8"
+        ) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def restore_mtimes(root: str = ".") -> None:
+    """Give the bundled files back the modification times of the build
+
+    Unpacking sets them to the current time, which would make the cached
+    difficulty indexes look out of date and be built again.
+    """
+    info = read_bundle_info(root)
+    if info is None:
+        return
+    for name, mtime_ns in info["mtimes"].items():
+        os.utime(os.path.join(root, name), ns=(mtime_ns, mtime_ns))
+
+
+def start(
+    write, size: tuple[int, int] = SCREEN_SIZE, root: str = "."
+) -> tuple[asyncio.Task, QueueReader]:
+    """Start a game drawing to `write`, on the running event loop
+
+    The notice is drawn at once, the corpus is only read once a level is
+    chosen (there are no threads to read it earlier in the browser).
+
+    Parameters:
+        - write : Callable[[str], None]
+            Receives the output of the game
+        - size : tuple[int, int]
+            Columns and rows of the terminal
+        - root : str
+            Directory holding `settings.json` and the corpus
+
+    Returns:
+        - tuple[asyncio.Task, QueueReader]
+            The task running the game, and the reader to feed typed lines
+    """
+    restore_mtimes(root)
+    reader = ReadJson()
+    settings = reader.get_settings(os.path.join(root, "settings.json"))
+    filename = os.path.join(root, settings["data_filename"])
+
+    def load():
+        corpus = load_corpus(reader, filename)
+        if corpus is None:
+            raise FileNotFoundError(filename)
+        return corpus
+
+    data = Data.load_async(
+        load, filename, settings.get("no_repeat") == "true"
+    )
+    line_reader = QueueReader()
+    game = AsyncGame(
+        settings,
+        Assets(),
+        None,
+        None,
+        reader=line_reader,
+        output=TermWriter(write),
+        geometry=TerminalGeometry(size),
+        data=data,
+    )
+    return asyncio.ensure_future(game.game_menu()), line_reader
+
+
+def save_warm_state(filename: str, root: str = ".") -> bool:
+    """Zip the unpacked bundle with its modules compiled to `filename`
+
+    The bytecode is not checked against the sources, whose times change on
+    every unpack, so the zip must be dropped with its bundle: the page
+    keeps it in a cache named after the bundle's hash.
+
+    Returns:
+        - bool
+            `False` if `root` holds no bundle, e.g. loaded from sources
+    """
+    info = read_bundle_info(root)
+    if info is None:
+        return False
+    src = os.path.join(root, "src")
+    compileall.compile_dir(
+        src,
+        quiet=1,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+    cache = os.path.join(src, "__pycache__")
+    compiled = [
+        os.path.join("src", "__pycache__", name)
+        for name in sorted(os.listdir(cache))
+    ]
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name in info["files"] + compiled:
+            archive.write(os.path.join(root, name), name)
+    return True